@@ -0,0 +1,149 @@
+from enum import IntEnum
+
+
+#################################################################
+# Ergebniscodes aller Aktionen der GameEngine
+class Outcome(IntEnum):
+    MOVED = 1
+    DIED = 2
+    BLOCKED = 3
+    NO_CONNECTION = 4
+    TRAVELED = 5
+    WON = 6
+    TRAVEL_BLOCKED = 7
+    INVALID_DESTINATION = 8
+    TALKED = 9
+    NO_ONE_HERE = 10
+    PICKED_UP = 11
+    ITEM_NOT_HERE = 12
+    KILLED = 13
+    NO_ENEMY = 14
+    WRONG_ENEMY = 15
+    NO_WEAPON = 16
+    PLANTED = 17
+    NO_C4 = 18
+    NOT_IN_REACTOR = 19
+    GRENADE_THROWN = 20
+    NO_GRENADE = 21
+    NOT_AT_GENERATOR = 22
+    QUIT = 23
+    UNKNOWN_COMMAND = 24
+    ARRIVED = 25
+    NO_ROUTE = 26
+
+
+# Ergebnisse, bei denen sich der Spielzustand geändert hat
+SUCCESS = frozenset({
+    Outcome.MOVED, Outcome.DIED, Outcome.TRAVELED, Outcome.WON, Outcome.TALKED,
+    Outcome.PICKED_UP, Outcome.KILLED, Outcome.PLANTED, Outcome.GRENADE_THROWN, Outcome.QUIT,
+    Outcome.ARRIVED,
+})
+
+
+#################################################################
+# Momentaufnahme des Raums, in dem sich der Spieler befindet (nur Referenzen, kein Text)
+class RoomState:
+    __slots__ = ("room", "npc", "items", "objective", "_text")
+
+    def __init__(self, room, npc, items, objective):
+        self.room = room  # Room-Objekt
+        self.npc = npc  # lebender NPC oder None
+        self.items = items  # Items, die in dieser Sitzung im Raum liegen
+        self.objective = objective  # aktuelles Ziel
+        self._text = None
+
+    def render(self):
+        """Baut den Statustext einmal auf und merkt ihn sich."""
+        if self._text is None:
+            room = self.room
+            parts = [f"\n Location: {room.name}\n{room.description}"]
+            if self.npc:
+                parts.append(f"\n You see {self.npc.name} here.")
+            if self.items:
+                parts.append(f"\n Items in room: {', '.join(self.items)}")
+            parts.append(f"\n Current Objective: {self.objective}")
+            self._text = "".join(parts)
+        return self._text
+
+    def to_payload(self):
+        """Kompakte Darstellung für Frontends ohne Text (z. B. den Server)."""
+        return {
+            "room": self.room.name,
+            "planet": self.room.planet.name,
+            "npc": self.npc.name if self.npc else None,
+            "items": list(self.items),
+            "objective": self.objective,
+        }
+
+    def __str__(self):
+        return self.render()
+
+
+#################################################################
+# Ergebnis einer Aktion: Code, betroffene Objekte und neuer Raumzustand; Text erst bei Bedarf
+class ActionResult:
+    __slots__ = ("outcome", "subject", "room_state", "changed", "detail", "_text")
+
+    def __init__(self, outcome, subject=None, room_state=None, changed=(), detail=None):
+        self.outcome = outcome  # Outcome-Code
+        self.subject = subject  # Name des betroffenen Raums, Items oder NPCs
+        self.room_state = room_state  # RoomState nach der Aktion (falls sich der Raum geändert hat)
+        self.changed = changed  # veränderte Objekte (Spieler, Raum, NPC)
+        self.detail = detail  # zusätzliche Daten, z. B. fehlende Items oder Dialogzeilen
+        self._text = None
+
+    @property
+    def ok(self):
+        return self.outcome in SUCCESS
+
+    def render(self):
+        """Wandelt das Ergebnis in den Text um, den die Oberfläche anzeigt."""
+        if self._text is None:
+            self._text = _RENDERERS[self.outcome](self)
+        return self._text
+
+    def to_payload(self):
+        """Kompakte Darstellung ohne Fließtext."""
+        payload = {"outcome": self.outcome.name, "subject": self.subject}
+        if self.room_state is not None:
+            payload["state"] = self.room_state.to_payload()
+        if isinstance(self.detail, (list, tuple)):
+            payload["detail"] = list(self.detail)
+        return payload
+
+    def __str__(self):
+        return self.render()
+
+    def __repr__(self):
+        return f"ActionResult({self.outcome.name}, {self.subject!r})"
+
+
+_RENDERERS = {
+    Outcome.MOVED: lambda r: f" You moved to {r.subject}.\n" + r.room_state.render(),
+    Outcome.DIED: lambda r: f" You moved to {r.subject}.\n" + r.room_state.render(),
+    Outcome.BLOCKED: lambda r: f"🚫 Requirements not met for room {r.subject}, you're missing {r.detail[0]} .",
+    Outcome.NO_CONNECTION: lambda r: f" No connection to room '{r.subject}'.",
+    Outcome.TRAVELED: lambda r: f" You traveled to {r.subject}.\n" + r.room_state.render(),
+    Outcome.WON: lambda r: "\n".join(r.detail) + "\n You win!",
+    Outcome.TRAVEL_BLOCKED: lambda r: f" Cannot travel. Requirements not met for {list(r.detail)}.",
+    Outcome.INVALID_DESTINATION: lambda r: " Invalid travel destination index.",
+    Outcome.TALKED: lambda r: "\n".join(r.detail),
+    Outcome.NO_ONE_HERE: lambda r: "There's no one to interact with.",
+    Outcome.PICKED_UP: lambda r: f"✅ You picked up {r.subject}.",
+    Outcome.ITEM_NOT_HERE: lambda r: f" '{r.subject}' is not in this room.",
+    Outcome.KILLED: lambda r: f" You killed {r.subject}.",
+    Outcome.NO_ENEMY: lambda r: " There's no enemy here.",
+    Outcome.WRONG_ENEMY: lambda r: f" No enemy named '{r.subject}' here.",
+    Outcome.NO_WEAPON: lambda r: " You don't have a weapon!",
+    Outcome.PLANTED: lambda r: "💣 You planted C4 in the reactor!",
+    Outcome.NO_C4: lambda r: " You don't have C4.",
+    Outcome.NOT_IN_REACTOR: lambda r: " You're not in the Reactor.",
+    Outcome.GRENADE_THROWN: lambda r: "💥 You threw the grenade at the generator!",
+    Outcome.NO_GRENADE: lambda r: "❌ You don't have a grenade.",
+    Outcome.NOT_AT_GENERATOR: lambda r: "⚠️ You're not in the Shield Generator.",
+    Outcome.QUIT: lambda r: "🛑 Game ended. Thanks for playing!",
+    Outcome.UNKNOWN_COMMAND: lambda r: f" Unknown command '{r.subject}'.",
+    Outcome.ARRIVED: lambda r: (f" You went to {r.subject} via {' → '.join(r.detail)}.\n" if r.detail
+                                else f" You are already in {r.subject}.\n") + r.room_state.render(),
+    Outcome.NO_ROUTE: lambda r: f" No route to room '{r.subject}'.",
+}
@@ -0,0 +1,87 @@
+from action_result import ActionResult
+from game_rules import (apply_drop, apply_interact, apply_kill, apply_move, apply_pickup, apply_plant,
+                        apply_travel)
+
+# Ergebniscodes: Outcome-Werte (passen in ein Byte) und drei Codes für Fälle ohne Outcome
+NO_OUTCOME = 0  # Befehl ohne Ergebniscode (status, actions)
+UNKNOWN_SESSION = 254  # nur im Server: Sitzungs-ID unbekannt
+BAD_ARGUMENTS = 255  # falsche Anzahl oder falscher Typ der Argumente
+
+
+#################################################################
+# Führt viele Befehle verschiedener Sitzungen in einem Durchlauf aus und liefert nur Ergebniscodes
+# Häufige Befehle rufen direkt die Regeln aus game_rules auf, ohne ActionResult, RoomState und Texte;
+# alle Sitzungen teilen sich dieselbe Welt-Vorlage und damit auch den Cache der Raumnamen.
+class BatchEngine:
+    def __init__(self, max_names=4096):
+        self.max_names = max_names  # Obergrenze pro Welt, Namen kommen von Clients
+        self.room_names = {}  # WorldIndex -> {eingegebener Raumname -> Room}
+
+    def step(self, batch, after_each=None):
+        """Wendet (engine, Befehl, Argumente)-Tripel der Reihe nach an und gibt die Codes als bytearray zurück.
+
+        Der Spielzustand ändert sich genauso wie mit GameEngine.execute (auch der Zufallsgenerator der Sitzung).
+        after_each(position, code) wird, falls angegeben, direkt nach jedem Befehl aufgerufen (z. B. für das Journal).
+        """
+        codes = bytearray(len(batch))
+        handlers = self.HANDLERS
+        for position, (engine, command, args) in enumerate(batch):
+            if not engine.arguments_valid(command, args):  # ein kaputter Befehl bricht nicht den ganzen Stapel ab
+                codes[position] = BAD_ARGUMENTS
+            else:
+                handler = handlers.get(command)
+                if handler is not None:
+                    codes[position] = handler(self, engine, *args)
+                else:
+                    result = engine.execute(command, args)
+                    codes[position] = result.outcome if isinstance(result, ActionResult) else NO_OUTCOME
+            if after_each is not None:
+                after_each(position, codes[position])
+        return codes
+
+    def _room_named(self, game, name):
+        """Raum zu einem eingegebenen Namen (ohne Groß-/Kleinschreibung); gefundene Namen werden gemerkt."""
+        names = self.room_names.get(game.index)
+        if names is None:
+            names = self.room_names[game.index] = {}
+        room = names.get(name)
+        if room is None:
+            room = game.find_room_ignore_case(name)
+            if room is not None:
+                if len(names) >= self.max_names:
+                    names.clear()
+                names[name] = room
+        return room
+
+    # Dieselben Regeln wie GameEngine (game_rules), nur ohne Ergebnisobjekt und Texte
+    def move(self, engine, direction_name):
+        return apply_move(engine.game, engine.player, self._room_named(engine.game, direction_name))
+
+    def travel(self, engine, destination_index):
+        return apply_travel(engine.game, engine.player, destination_index)
+
+    def interact(self, engine):
+        return apply_interact(engine.game, engine.player)
+
+    def pickup(self, engine, item_name):
+        return apply_pickup(engine.game, engine.player, item_name)
+
+    def kill(self, engine, enemy_name):
+        return apply_kill(engine.game, engine.player, enemy_name)
+
+    def plant(self, engine):
+        return apply_plant(engine.game, engine.player)
+
+    def drop(self, engine):
+        return apply_drop(engine.game, engine.player)
+
+    # Alle anderen Befehle (goto, quit, status, actions) gehen an GameEngine.execute
+    HANDLERS = {
+        "move": move,
+        "travel": travel,
+        "interact": interact,
+        "pickup": pickup,
+        "kill": kill,
+        "plant": plant,
+        "drop": drop,
+    }
@@ -0,0 +1,71 @@
+"""Misst die Zeit pro Aktion für die Button-Leiste: Widgets zerstören und neu bauen gegen ButtonBar.
+
+Simuliert eine Folge von Klicks mit wechselnden Button-Sätzen (Aktionen, Auswahllisten) und zählt
+jeweils bis einschließlich update_idletasks, also inklusive Layout. Benötigt ein Display.
+
+Aufruf: python benchmarks/bench_action_bar.py [klicks]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import customtkinter as ctk  # noqa: E402
+
+from main_gui import ButtonBar  # noqa: E402
+
+# Typische Abfolge: Aktionsleiste, Bewegungsauswahl, Aktionsleiste im neuen Raum, Item-Auswahl ...
+FRAMES = [
+    ["Move", "Quit", "Pickup", "Interact"],
+    ["Armory", "Control room", "Hangar", "Cancel"],
+    ["Move", "Quit", "Kill"],
+    ["Zat", "C4", "Cancel"],
+    ["Move", "Quit", "Travel", "Pickup", "Interact"],
+    ["Abydos", "Chulak", "Dakara", "Cancel"],
+]
+
+
+def recreate(frame, labels):
+    """Bisheriges Vorgehen: alle Kinder zerstören und neue Buttons samt Closures anlegen."""
+    for widget in frame.winfo_children():
+        widget.destroy()
+    for label in labels:
+        button = ctk.CTkButton(frame, text=label)
+        button.configure(command=lambda label=label: None)
+        button.pack(side="left", padx=5)
+
+
+def measure(root, clicks, show):
+    timings = []
+    for index in range(clicks):
+        start = time.perf_counter()
+        show(FRAMES[index % len(FRAMES)])
+        root.update_idletasks()
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return sum(timings) / len(timings), timings[len(timings) * 99 // 100]
+
+
+def main():
+    clicks = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    root = ctk.CTk()
+    root.geometry("1000x120")
+
+    old_frame = ctk.CTkFrame(root)
+    old_frame.pack(fill="x")
+    old_avg, old_p99 = measure(root, clicks, lambda labels: recreate(old_frame, labels))
+    old_frame.destroy()
+
+    bar_frame = ctk.CTkFrame(root)
+    bar_frame.pack(fill="x")
+    bar = ButtonBar(bar_frame)
+    bar_avg, bar_p99 = measure(root, clicks, lambda labels: bar.show([(label, lambda: None) for label in labels]))
+
+    print(f"destroy/create  avg={old_avg:7.2f} ms  p99={old_p99:7.2f} ms")
+    print(f"ButtonBar       avg={bar_avg:7.2f} ms  p99={bar_p99:7.2f} ms  speedup={old_avg / bar_avg:5.2f}x")
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""Misst die Laufzeit von world_analyzer für wachsende generierte Welten (sollte nahezu linear wachsen).
+
+Aufruf: python benchmarks/bench_analyzer.py [planeten] [max_räume_pro_planet]
+"""
+import os
+import sys
+import time
+
+BASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, BASE)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from game import Game  # noqa: E402
+from world_analyzer import analyze_world  # noqa: E402
+from worldgen import write_world  # noqa: E402
+
+
+def main(planets=20, max_rooms_per_planet=5000):
+    world_path = os.path.join(BASE, "bench_analyzer_world.json")
+    rooms_per_planet = max(1, max_rooms_per_planet // 8)
+    try:
+        while rooms_per_planet <= max_rooms_per_planet:
+            write_world(world_path, planets, rooms_per_planet)
+            game = Game()
+            game.create_game(world_path)
+            start = game.find_room_by_name("P0 Room 0")
+            goal = game.find_room_by_name(f"P{planets - 1} Room {rooms_per_planet - 1}")
+            began = time.perf_counter()
+            report = analyze_world(game, start, goal)
+            elapsed = time.perf_counter() - began
+            print(f"rooms={len(game.rooms):8d} analyze={elapsed * 1000:9.1f} ms  "
+                  f"per_room={elapsed * 1e6 / len(game.rooms):6.2f} us  reachable={len(report.reachable):8d} "
+                  f"locked={len(report.locked):6d} winnable={report.winnable}")
+            rooms_per_planet *= 2
+    finally:
+        if os.path.exists(world_path):
+            os.remove(world_path)
+
+
+if __name__ == "__main__":
+    main(*[int(value) for value in sys.argv[1:3]])
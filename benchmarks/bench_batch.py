@@ -0,0 +1,83 @@
+"""Misst Befehle pro Sekunde für viele Sitzungen: einzeln über GameEngine.execute gegen BatchEngine.step,
+und im Server eine Anfragezeile pro Befehl gegen eine "batch"-Anfrage pro Tick.
+
+Aufruf: python benchmarks/bench_batch.py [max_stapelgröße] [ticks]
+"""
+import json
+import os
+import random
+import sys
+import time
+
+BASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, BASE)
+
+from batch_engine import BatchEngine  # noqa: E402
+from game_engine import GameEngine  # noqa: E402
+from game_server import GameServer  # noqa: E402
+from simulator import random_command  # noqa: E402
+
+
+def new_fleet(size):
+    fleet = []
+    for seed in range(size):
+        engine = GameEngine(seed=seed)
+        engine.initialize_game(f"Bot {seed}")
+        fleet.append(engine)
+    return fleet
+
+
+def new_server(size):
+    server = GameServer(max_sessions=size)
+    session_ids = []
+    for seed in range(size):
+        response = server.handle_request(json.dumps({"cmd": "new", "args": [f"Bot {seed}", seed]}))
+        session_ids.append(response["session"])
+    return server, session_ids
+
+
+def main(max_batch=4096, ticks=20):
+    size = 1
+    while size <= max_batch:
+        rng = random.Random(size)
+        single, batched = new_fleet(size), new_fleet(size)
+        line_server, line_ids = new_server(size)
+        batch_server, batch_ids = new_server(size)
+        engine = BatchEngine()
+        timings = [0.0, 0.0, 0.0, 0.0]
+        for _ in range(ticks):
+            # Befehle der Bots außerhalb der Messung wählen (alle vier Flotten sind im selben Zustand)
+            commands = [random_command(bot, rng) or ("status", ()) for bot in single]
+
+            began = time.perf_counter()
+            for bot, (command, args) in zip(single, commands):
+                bot.execute(command, args)
+            timings[0] += time.perf_counter() - began
+
+            began = time.perf_counter()
+            engine.step([(bot, command, args) for bot, (command, args) in zip(batched, commands)])
+            timings[1] += time.perf_counter() - began
+
+            lines = [json.dumps({"session": sid, "cmd": command, "args": list(args)})
+                     for sid, (command, args) in zip(line_ids, commands)]
+            began = time.perf_counter()
+            for line in lines:
+                line_server._encode(line_server.handle_request(line))
+            timings[2] += time.perf_counter() - began
+
+            line = json.dumps({"cmd": "batch", "args": [[sid, command, list(args)]
+                                                        for sid, (command, args) in zip(batch_ids, commands)]})
+            began = time.perf_counter()
+            batch_server._encode(batch_server.handle_request(line))
+            timings[3] += time.perf_counter() - began
+
+        commands_run = size * ticks
+        execute_rate, batch_rate, line_rate, server_batch_rate = (commands_run / timing for timing in timings)
+        print(f"batch={size:5d} execute={execute_rate:9.0f} cmd/s  step={batch_rate:9.0f} cmd/s "
+              f"({batch_rate / execute_rate:4.1f}x)  server lines={line_rate:8.0f} cmd/s  "
+              f"server batch={server_batch_rate:9.0f} cmd/s ({server_batch_rate / line_rate:4.1f}x)")
+        size *= 4
+
+
+if __name__ == "__main__":
+    main(*[int(value) for value in sys.argv[1:3]])
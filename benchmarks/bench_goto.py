@@ -0,0 +1,72 @@
+"""Misst goto auf einer generierten Welt: Wegsuche kalt und aus dem Cache, Schritt für Schritt gegen einen Aufruf.
+
+Aufruf: python benchmarks/bench_goto.py [planeten] [räume_pro_planet]
+"""
+import os
+import sys
+import time
+
+BASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, BASE)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from game import Game, Player, get_world_template  # noqa: E402
+from game_engine import GameEngine  # noqa: E402
+from world_cache import cache_path_for  # noqa: E402
+from worldgen import write_world  # noqa: E402
+
+
+def new_engine(template, start):
+    """GameEngine über der generierten Welt, Spieler im Startraum (ohne die Startlogik der Story)."""
+    engine = GameEngine()
+    engine.game = Game.from_template(template)
+    engine.player = engine.game.player = Player("Bench")
+    engine.player.current_room = start
+    engine.player.current_planet = start.planet
+    return engine
+
+
+def timed(action):
+    start = time.perf_counter()
+    result = action()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main(planets=10, rooms_per_planet=1000):
+    world_path = write_world(os.path.join(BASE, "bench_goto_world.json"), planets, rooms_per_planet)
+    try:
+        template = get_world_template(world_path)
+        start = template.find_room_by_name("P0 Room 0")
+        target = template.find_room_by_name(f"P{planets // 2} Room {rooms_per_planet - 1}")
+
+        engine = new_engine(template, start)
+        result, cold = timed(lambda: engine.goto(target.name))
+        route = list(result.detail or ())
+        engine.player.current_room = start
+        _, warm = timed(lambda: engine.goto(target.name))
+
+        # Bisheriger Weg: ein execute-Aufruf pro Schritt
+        engine = new_engine(template, start)
+
+        def hop_by_hop():
+            for name in route:
+                room = engine.player.current_room
+                next_room = engine.game.find_room_by_name(name)
+                if next_room in engine.game.get_local_exits(room):
+                    engine.execute("move", [name])
+                else:
+                    engine.execute("travel", [engine.game.get_gate_exits(room).index(next_room)])
+
+        _, hops = timed(hop_by_hop)
+        print(f"rooms={len(template.rooms)} outcome={result.outcome.name} steps={len(route)}")
+        print(f"goto (cold search)   {cold:9.2f} ms")
+        print(f"goto (cached search) {warm:9.2f} ms")
+        print(f"execute per hop      {hops:9.2f} ms  ({len(route)} calls; over the server each is a round-trip)")
+    finally:
+        for path in (world_path, cache_path_for(world_path)):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+if __name__ == "__main__":
+    main(*[int(value) for value in sys.argv[1:3]])
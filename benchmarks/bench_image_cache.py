@@ -0,0 +1,56 @@
+"""Misst das Anzeigen der Raum- und Planetenbilder ohne und mit ImageCache.
+
+Spielt eine Rundreise über alle Räume der Welt mehrfach ab und vergleicht das bisherige Laden
+(Image.open + resize bei jedem Raumwechsel) mit dem LRU-Cache.
+
+Aufruf: python benchmarks/bench_image_cache.py [runden]
+"""
+import os
+import sys
+import time
+
+BASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, BASE)
+os.chdir(BASE)  # Bildpfade in world.json sind relativ zum Projektordner
+
+import customtkinter as ctk  # noqa: E402
+from PIL import Image  # noqa: E402
+
+from game import Game  # noqa: E402
+from image_cache import ImageCache  # noqa: E402
+from image_sizes import MINIMAP_SIZE, ROOM_IMAGE_SIZE  # noqa: E402
+
+
+def uncached(path, size):
+    """Bisheriges Vorgehen ohne Cache."""
+    img = Image.open(path).resize(size)
+    return ctk.CTkImage(light_image=img, dark_image=img, size=size)
+
+
+def tour(rounds, load, rooms):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for room in rooms:
+            if room.picture:
+                load(room.picture, ROOM_IMAGE_SIZE)
+            if room.planet.picture:
+                load(room.planet.picture, MINIMAP_SIZE)
+    return (time.perf_counter() - start) * 1000 / (rounds * len(rooms))
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    game = Game()
+    game.create_game("world.json")
+    rooms = [room for room in game.rooms.values() if room.picture and os.path.exists(room.picture)]
+
+    before = tour(rounds, uncached, rooms)
+    cache = ImageCache()
+    after = tour(rounds, cache.get, rooms)
+    print(f"uncached    {before:7.3f} ms per room change")
+    print(f"ImageCache  {after:7.3f} ms per room change  speedup={before / after:6.1f}x")
+    print(f"cache stats: {cache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Misst Schreibdurchsatz des Befehlsjournals und die Wiederherstellungszeit für wachsende Sitzungslängen.
+
+Verglichen wird die Wiederherstellung mit periodischen Snapshots gegen das erneute Abspielen aller Befehle.
+
+Aufruf: python benchmarks/bench_journal.py [max_befehle] [snapshot_alle]
+"""
+import os
+import random
+import sys
+import time
+
+BASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, BASE)
+
+from game_engine import GameEngine  # noqa: E402
+from journal import Journal, recover  # noqa: E402
+from world_analyzer import END_ROOM  # noqa: E402
+
+
+def wander(engine, rng):
+    """Zufälliger Befehl, der die Sitzung nicht beendet (keine tödlichen Räume, kein Spielende)."""
+    game = engine.game
+    room = engine.player.current_room
+    choices = [("move", (next_room.name,)) for next_room in game.get_local_exits(room)
+               if not next_room.enter_trigger and next_room.name != END_ROOM]
+    choices.extend(("travel", (index,)) for index, next_room in enumerate(game.get_gate_exits(room))
+                   if not next_room.enter_trigger and not room.travel_triggers.get(next_room.name)
+                   and next_room.name != END_ROOM)
+    choices.extend(("pickup", (item,)) for item in game.items_in(room))
+    choices.append(("interact", ()))
+    return rng.choice(choices)
+
+
+def write_session(path, commands, snapshot_every):
+    """Spielt eine Sitzung mit Journal und gibt (Sekunden, Einträge, fsyncs, Spielstand am Ende) zurück."""
+    if os.path.exists(path):
+        os.remove(path)
+    rng = random.Random(1)
+    engine = GameEngine(seed=1)
+    engine.initialize_game("Bench")
+    journal = Journal(path, snapshot_every=snapshot_every)
+    start = time.perf_counter()
+    journal.snapshot("bench", engine)
+    for _ in range(commands):
+        command, args = wander(engine, rng)
+        engine.execute(command, args)
+        journal.record("bench", engine, command, args)
+    journal.close()
+    elapsed = time.perf_counter() - start
+    return elapsed, journal.records_written, journal.syncs, engine.save_state()
+
+
+def recover_session(path):
+    start = time.perf_counter()
+    engines, _ = recover(path, GameEngine)
+    return time.perf_counter() - start, engines["bench"].save_state()
+
+
+def main(max_commands=20000, snapshot_every=500):
+    path = os.path.join(BASE, "bench_journal.log")
+    commands = 500
+    try:
+        while commands <= max_commands:
+            for label, every in (("snapshots", snapshot_every), ("replay", commands + 1)):
+                written, records, syncs, final_state = write_session(path, commands, every)
+                recovered, recovered_state = recover_session(path)
+                assert recovered_state == final_state, "recovered state differs"
+                print(f"commands={commands:6d} {label:9s} write={records / written:9.0f} records/s "
+                      f"fsyncs={syncs:5d} size={os.path.getsize(path) / 1024:8.1f} KiB "
+                      f"recover={recovered * 1000:8.1f} ms")
+            commands *= 2
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main(*[int(value) for value in sys.argv[1:3]])
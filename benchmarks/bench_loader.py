@@ -0,0 +1,46 @@
+"""Vergleicht json.load mit dem Streaming-Loader: Ladezeit und Spitzen-RSS.
+
+Jeder Lauf findet in einem eigenen Prozess statt, damit ru_maxrss nicht vom vorherigen Lauf verfälscht wird.
+Aufruf: python benchmarks/bench_loader.py [planeten] [räume_pro_planet]
+"""
+import os
+import resource
+import subprocess
+import sys
+import time
+
+BASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, BASE)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_once(world_path, streaming):
+    """Lädt die Welt einmal und gibt Laufzeit und Spitzen-RSS dieses Prozesses aus."""
+    from game import Game
+
+    start = time.perf_counter()
+    game = Game()
+    game.create_game(world_path, streaming=streaming)
+    elapsed = time.perf_counter() - start
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss  # Linux: Kilobyte
+    print(f"{'stream' if streaming else 'json':6} rooms={len(game.rooms):8d} "
+          f"time={elapsed:7.3f}s peak_rss={peak_kb / 1024:8.1f} MiB")
+
+
+def main(planets=20, rooms_per_planet=5000):
+    from worldgen import write_world
+
+    world_path = write_world(os.path.join(BASE, "bench_world.json"), planets, rooms_per_planet)
+    try:
+        print(f"world file: {os.path.getsize(world_path) / 1e6:.1f} MB")
+        for mode in ("json", "stream"):
+            subprocess.run([sys.executable, __file__, "--run", mode, world_path], check=True)
+    finally:
+        os.remove(world_path)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--run":
+        load_once(sys.argv[3], streaming=sys.argv[2] == "stream")
+    else:
+        main(*(int(arg) for arg in sys.argv[1:3]))
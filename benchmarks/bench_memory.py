@@ -0,0 +1,96 @@
+"""Misst mit tracemalloc den Speicherbedarf pro Raum und pro Verbindung sowie die Attributzugriffszeit,
+jeweils für das Objektmodell mit __slots__ und für eine Kopie ohne __slots__ (Stand vor der Umstellung).
+
+Aufruf: python benchmarks/bench_memory.py [anzahl]
+"""
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from game import Connection, Planet, Room  # noqa: E402
+
+
+# Vergleichsmodell ohne __slots__: dieselben Attribute wie Room, Connection wie vor der Umstellung
+# (Attribute im __dict__, Zugriff über Properties)
+class DictGameObject:
+    def __init__(self, name, description):
+        self.name = name
+        self.description = description
+
+
+class DictRoom(DictGameObject):
+    def __init__(self, name, description, planet):
+        super().__init__(name, description)
+        self.planet = planet
+        self.connections = []
+        self.items = []
+        self.requirement = []
+        self.requirement_mask = 0
+        self.objective = None
+        self.npc = None
+        self.picture = None
+        self.local_exits = None
+        self.gate_exits = None
+        self.special_actions = ()
+        self.enter_trigger = None
+        self.travel_triggers = {}
+
+
+class DictConnection:
+    def __init__(self, from_room, to_room, connection_type):
+        self._from_room = from_room
+        self._to_room = to_room.name
+        self._connection_type = connection_type
+
+    @property
+    def from_room(self):
+        return self._from_room
+
+    @property
+    def to_room(self):
+        return self._to_room
+
+    @property
+    def connection_type(self):
+        return self._connection_type
+
+
+def measure(factory, count):
+    """Gibt die durchschnittlich allokierten Bytes pro erzeugtem Objekt zurück."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = [factory(i) for i in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    # Die Liste selbst gehört nicht zum Objektmodell
+    allocated -= sys.getsizeof(objects)
+    return allocated / count, objects
+
+
+def access_time(read, number=2_000_000):
+    return timeit.timeit(read, number=number) / number * 1e9
+
+
+def main(count=100_000):
+    planet = Planet("Bench", None)
+    names = [f"Room {i}" for i in range(count)]  # Namen vorab erzeugen, damit sie nicht mitgezählt werden
+
+    results = {}
+    for label, room_class, conn_class in (("__dict__", DictRoom, DictConnection), ("__slots__", Room, Connection)):
+        room_bytes, rooms = measure(lambda i: room_class(names[i], "desc", planet), count)
+        conn_bytes, connections = measure(lambda i: conn_class(rooms[i], rooms[i - 1], "local"), count)
+        room, conn = rooms[0], connections[0]
+        results[label] = (room_bytes, conn_bytes, access_time(lambda: room.items), access_time(lambda: conn.to_room))
+        del rooms, connections
+
+    print(f"{'':24s} {'__dict__':>10s} {'__slots__':>10s} {'saving':>10s}")
+    rows = ("Rooms (bytes/room)", "Connections (bytes/conn)", "room.items (ns/access)", "conn.to_room (ns/access)")
+    for row, before, after in zip(rows, results["__dict__"], results["__slots__"]):
+        print(f"{row:24s} {before:10.1f} {after:10.1f} {(1 - after / before) * 100:9.1f}%")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
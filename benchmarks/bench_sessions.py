@@ -0,0 +1,45 @@
+"""Misst den Speicherbedarf pro Spielsitzung bei geteilter Welt-Vorlage für verschiedene Weltgrößen.
+
+Aufruf: python benchmarks/bench_sessions.py [sitzungen]
+"""
+import os
+import sys
+import tracemalloc
+
+BASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, BASE)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from game import Game, Player  # noqa: E402
+from worldgen import write_world  # noqa: E402
+
+
+def bytes_per_session(template, sessions):
+    """Erzeugt Sitzungen über einer Vorlage und gibt die neu allokierten Bytes pro Sitzung zurück."""
+    start_room = next(iter(template.rooms.values()))
+    tracemalloc.start()
+    games = []
+    for i in range(sessions):
+        game = Game.from_template(template)
+        game.player = Player(f"Player {i}")
+        game.player.current_room = start_room
+        game.player.current_planet = start_room.planet
+        games.append(game)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return allocated / sessions
+
+
+def main(sessions=2000):
+    for planets, rooms_per_planet in ((1, 100), (10, 1000), (20, 5000)):
+        world_path = write_world(os.path.join(BASE, "bench_world.json"), planets, rooms_per_planet)
+        try:
+            template = Game()
+            template.create_game(world_path)
+        finally:
+            os.remove(world_path)
+        print(f"rooms={len(template.rooms):7d}  {bytes_per_session(template, sessions):8.0f} bytes/session")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
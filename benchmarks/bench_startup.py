@@ -0,0 +1,52 @@
+"""Vergleicht den Start mit kaltem JSON-Laden gegen den warmen Welt-Cache.
+
+Aufruf: python benchmarks/bench_startup.py [planeten] [räume_pro_planet]
+"""
+import os
+import sys
+import time
+
+BASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, BASE)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from game import Game  # noqa: E402
+from world_cache import cache_path_for  # noqa: E402
+from worldgen import write_world  # noqa: E402
+
+
+def best_of(runs, load):
+    """Gibt die beste Laufzeit aus mehreren Durchläufen zurück."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        load()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def compare(world_path, runs):
+    cache_path = cache_path_for(world_path)
+    if os.path.exists(cache_path):
+        os.remove(cache_path)
+
+    cold = best_of(runs, lambda: Game().create_game(world_path))
+    Game().create_game(world_path, use_cache=True)  # Cache schreiben
+    warm = best_of(runs, lambda: Game().create_game(world_path, use_cache=True))
+    print(f"{os.path.basename(world_path):24} json={cold * 1000:9.2f} ms  cache={warm * 1000:9.2f} ms  "
+          f"speedup={cold / warm:5.2f}x  cache_size={os.path.getsize(cache_path) / 1024:9.1f} KiB")
+    return cache_path
+
+
+def main(planets=10, rooms_per_planet=2000):
+    compare(os.path.join(BASE, "world.json"), runs=50)
+    generated = write_world(os.path.join(BASE, "bench_world.json"), planets, rooms_per_planet)
+    try:
+        cache_path = compare(generated, runs=3)
+        os.remove(cache_path)
+    finally:
+        os.remove(generated)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,79 @@
+"""Vergleicht Erreichbarkeitsabfragen in Python (RouteFinder) mit der NumPy-Sicht aus world_arrays.
+
+Aufruf: python benchmarks/bench_world_arrays.py [planeten] [max_räume_pro_planet] [spieler]
+"""
+import os
+import random
+import sys
+import time
+
+BASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, BASE)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np  # noqa: E402
+
+from game import Game, Player  # noqa: E402
+from pathfinding import RouteCache, RouteFinder  # noqa: E402
+from world_arrays import ArrayPlayers, WorldArrays  # noqa: E402
+from worldgen import write_world  # noqa: E402
+
+
+def python_reachable(game, start, inventory_mask):
+    """Erreichbare Räume über RouteFinder (ohne Cache-Treffer, jede Abfrage sucht neu)."""
+    player = Player("Bench")
+    player.inventory.mask = inventory_mask
+    player.current_room = start
+    game.player = player
+    return RouteFinder(game, cache=RouteCache()).reachable(start)
+
+
+def main(planets=10, max_rooms_per_planet=10000, players=256):
+    world_path = os.path.join(BASE, "bench_world_arrays.json")
+    rooms_per_planet = max(1, max_rooms_per_planet // 8)
+    rng = random.Random(1)
+    try:
+        while rooms_per_planet <= max_rooms_per_planet:
+            write_world(world_path, planets, rooms_per_planet)
+            game = Game()
+            game.create_game(world_path)
+            rooms = list(game.rooms.values())
+
+            began = time.perf_counter()
+            arrays = WorldArrays(game)
+            build = time.perf_counter() - began
+
+            starts = [rooms[0]] * players  # typische Auswertung: viele Inventare, ein Startraum
+            masks = [rng.getrandbits(64) for _ in range(players)]
+            sample = min(players, 16)  # die Python-Suche nur für eine Stichprobe messen
+
+            began = time.perf_counter()
+            for start, mask in zip(starts[:sample], masks[:sample]):
+                python_reachable(game, start, mask)
+            python_each = (time.perf_counter() - began) / sample
+
+            began = time.perf_counter()
+            for start, mask in zip(starts[:sample], masks[:sample]):
+                arrays.reachable(start, mask)
+            numpy_each = (time.perf_counter() - began) / sample
+
+            began = time.perf_counter()
+            arrays.reachable_many(starts, masks)
+            many_each = (time.perf_counter() - began) / players
+
+            walkers = ArrayPlayers(arrays, players * 40, starts[0])
+            began = time.perf_counter()
+            walkers.run(np.random.default_rng(1), max_steps=100)
+            steps_per_second = walkers.alive.size * walkers.steps / (time.perf_counter() - began)
+
+            print(f"rooms={len(rooms):8d} build={build * 1000:8.1f} ms  reachable python={python_each * 1000:8.2f} ms "
+                  f"numpy={numpy_each * 1000:8.2f} ms  batched={many_each * 1000:8.2f} ms/player  "
+                  f"walk={steps_per_second:12.0f} player-steps/s")
+            rooms_per_planet *= 2
+    finally:
+        if os.path.exists(world_path):
+            os.remove(world_path)
+
+
+if __name__ == "__main__":
+    main(*[int(value) for value in sys.argv[1:4]])
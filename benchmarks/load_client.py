@@ -0,0 +1,84 @@
+"""Lastgenerator für game_server.py: misst Befehle pro Sekunde und p99-Latenz.
+
+Aufruf: python benchmarks/load_client.py [--clients 50] [--duration 5] [--port 8765 | --unix PFAD | --embedded]
+Mit --embedded läuft der Server im selben Prozess (praktisch zum schnellen Ausprobieren).
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+# Ein Rundgang, der in der Standardwelt immer wieder ausgeführt werden kann
+SCRIPT = [
+    ("move", ["Briefing Room"]),
+    ("interact", []),
+    ("move", ["Quarters"]),
+    ("status", []),
+    ("actions", []),
+]
+
+
+async def run_client(connect, duration, latencies):
+    reader, writer = await connect()
+
+    async def call(request):
+        start = time.perf_counter()
+        writer.write(json.dumps(request).encode("utf-8") + b"\n")
+        await writer.drain()
+        response = json.loads(await reader.readline())
+        latencies.append(time.perf_counter() - start)
+        return response
+
+    session = (await call({"cmd": "new", "args": ["Bot"]}))["session"]
+    deadline = time.perf_counter() + duration
+    step = 0
+    while time.perf_counter() < deadline:
+        command, args = SCRIPT[step % len(SCRIPT)]
+        await call({"id": step, "session": session, "cmd": command, "args": args})
+        step += 1
+    await call({"session": session, "cmd": "close"})
+    writer.close()
+
+
+async def main(options):
+    server = None
+    if options.embedded:
+        from game_server import GameServer
+
+        server = GameServer()
+        await server.start("127.0.0.1", 0)
+        port = server.server.sockets[0].getsockname()[1]
+        connect = lambda: asyncio.open_connection("127.0.0.1", port)  # noqa: E731
+    elif options.unix:
+        connect = lambda: asyncio.open_unix_connection(options.unix)  # noqa: E731
+    else:
+        connect = lambda: asyncio.open_connection(options.host, options.port)  # noqa: E731
+
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(run_client(connect, options.duration, latencies) for _ in range(options.clients)))
+    elapsed = time.perf_counter() - start
+
+    if server:
+        await server.close()
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000
+    print(f"clients={options.clients} commands={len(latencies)} "
+          f"throughput={len(latencies) / elapsed:9.0f} cmd/s  p50={p50:6.2f} ms  p99={p99:6.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix")
+    parser.add_argument("--embedded", action="store_true")
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=5.0)
+    asyncio.run(main(parser.parse_args()))
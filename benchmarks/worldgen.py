@@ -0,0 +1,73 @@
+"""Erzeugt synthetische Spielwelten im Format von world.json für Benchmarks.
+
+Aufruf: python benchmarks/worldgen.py <planeten> <räume_pro_planet> [ausgabe.json]
+"""
+import json
+import os
+import random
+import sys
+
+
+def generate_world(planets=10, rooms_per_planet=1000, seed=1):
+    """Baut ein world.json-kompatibles Dictionary mit Gitter-Räumen und Stargate-Verbindungen."""
+    rng = random.Random(seed)
+    width = max(1, int(rooms_per_planet ** 0.5))
+    world = {"planets": [], "connections": []}
+
+    for p in range(planets):
+        planet_name = f"Planet {p}"
+        rooms = []
+        for r in range(rooms_per_planet):
+            connections = []
+            if r % width and r - 1 >= 0:  # linker Nachbar
+                connections.append({"to_room": f"P{p} Room {r - 1}", "type": "local"})
+            if (r + 1) % width and r + 1 < rooms_per_planet:  # rechter Nachbar
+                connections.append({"to_room": f"P{p} Room {r + 1}", "type": "local"})
+            if r - width >= 0:  # oberer Nachbar
+                connections.append({"to_room": f"P{p} Room {r - width}", "type": "local"})
+            if r + width < rooms_per_planet:  # unterer Nachbar
+                connections.append({"to_room": f"P{p} Room {r + width}", "type": "local"})
+
+            room = {
+                "name": f"P{p} Room {r}",
+                "description": f"Room {r} on planet {p}.",
+                "picture": f"./img/hallway{1 + r % 2}.jpg",
+                "connections": connections,
+            }
+            if rng.random() < 0.2:
+                room["items"] = [f"Item {rng.randrange(50)}"]
+            if rng.random() < 0.05:
+                room["requirement"] = [f"Item {rng.randrange(50)}"]
+            if rng.random() < 0.05:
+                room["npc"] = {
+                    "first_name": f"Npc{r}",
+                    "last_name": f"P{p}",
+                    "hostile": rng.random() < 0.5,
+                    "dialogues": {"default": ["Hello.", "Go away."], "Mission": ["Good luck."]},
+                }
+            rooms.append(room)
+        world["planets"].append({"name": planet_name, "picture": "./img/minimap_mars.jpg", "rooms": rooms})
+
+        # Jeder Planet hat ein Stargate in Raum 0, das zum nächsten Planeten führt
+        if planets > 1:
+            world["connections"].append({
+                "from_room": f"P{p} Room 0",
+                "to_room": f"P{(p + 1) % planets} Room 0",
+                "type": "interplanetary",
+            })
+
+    return world
+
+
+def write_world(path, planets=10, rooms_per_planet=1000, seed=1):
+    """Schreibt eine generierte Welt als JSON-Datei und gibt den absoluten Pfad zurück."""
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(generate_world(planets, rooms_per_planet, seed), file)
+    return os.path.abspath(path)
+
+
+if __name__ == "__main__":
+    planets = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    rooms_per_planet = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    output = sys.argv[3] if len(sys.argv) > 3 else "generated_world.json"
+    print(write_world(output, planets, rooms_per_planet))
@@ -0,0 +1,147 @@
+import argparse
+import io
+import json
+import os
+import shutil
+
+from PIL import Image
+
+from image_sizes import MINIMAP_SIZE, ROOM_IMAGE_SIZE
+
+# Build-Schritt für die Bilder: liest die "picture"-Pfade aus world.json und erzeugt daraus Bilder in genau
+# der Größe, in der die GUI sie anzeigt. Ergebnis im Ausgabeordner (Standard: assets/):
+#   img/            skalierte und neu komprimierte Bilder (nur die, die world.json wirklich verwendet)
+#   world.json      Kopie der Welt mit umgeschriebenen Bildpfaden
+#   manifest.json   Quelle, Ziel, Größe und Bytes je Bild
+# main_gui.spec bündelt diesen Ordner statt img/, sobald er existiert.
+JPEG_QUALITY = 85
+DEFAULT_OUTPUT = "assets"
+
+
+def collect_pictures(world):
+    """Gibt (Pfad, Anzeigegröße)-Paare aller Bilder der Welt in Dateireihenfolge zurück."""
+    pictures = []
+    for planet in world["planets"]:
+        if planet.get("picture"):
+            pictures.append((planet["picture"], MINIMAP_SIZE))
+        for room in planet["rooms"]:
+            if room.get("picture"):
+                pictures.append((room["picture"], ROOM_IMAGE_SIZE))
+    return list(dict.fromkeys(pictures))  # doppelte Einträge entfernen, Reihenfolge behalten
+
+
+def encode_image(source_path, size):
+    """Skaliert ein Bild auf die Anzeigegröße und komprimiert es neu.
+
+    Bilder mit Transparenz bleiben PNG, alle anderen werden JPEG. Gibt (Bytes, Dateiendung) zurück.
+    """
+    with Image.open(source_path) as img:
+        has_alpha = img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info)
+        source_format = img.format
+        same_size = img.size == size
+        scaled = img.resize(size) if not same_size else img.copy()
+
+    buffer = io.BytesIO()
+    if has_alpha:
+        scaled.save(buffer, "PNG", optimize=True)
+        extension, target_format = ".png", "PNG"
+    else:
+        scaled.convert("RGB").save(buffer, "JPEG", quality=JPEG_QUALITY, optimize=True)
+        extension, target_format = ".jpg", "JPEG"
+    data = buffer.getvalue()
+
+    # Schon passend und kleiner als die Neukomprimierung: Originaldatei übernehmen
+    if same_size and source_format == target_format and os.path.getsize(source_path) <= len(data):
+        with open(source_path, "rb") as file:
+            data = file.read()
+    return data, extension
+
+
+def build_assets(world_file="world.json", output_dir=DEFAULT_OUTPUT):
+    """Erzeugt die Bilder in Anzeigegröße, die umgeschriebene world.json und das Manifest."""
+    base_path = os.path.dirname(os.path.abspath(__file__))
+    world_path = os.path.join(base_path, world_file)
+    output_dir = os.path.join(base_path, output_dir)
+    with open(world_path, "r", encoding="utf-8") as file:
+        world = json.load(file)
+
+    image_dir = os.path.join(output_dir, "img")
+    if os.path.isdir(image_dir):
+        shutil.rmtree(image_dir)  # keine veralteten Bilder mitbündeln
+    os.makedirs(image_dir)
+
+    references = {}  # (alter Pfad, Größe) -> neuer Pfad
+    used_names = set()
+    entries = []
+    for picture, size in collect_pictures(world):
+        source_path = os.path.join(base_path, picture)
+        if not os.path.exists(source_path):
+            print(f"  missing: {picture}")
+            continue
+        data, extension = encode_image(source_path, size)
+        stem = os.path.splitext(os.path.basename(picture))[0]
+        name = stem + extension
+        if name in used_names:  # gleiches Bild in zwei Größen oder gleicher Dateiname in verschiedenen Ordnern
+            name = f"{stem}_{size[0]}x{size[1]}{extension}"
+            counter = 2
+            while name in used_names:
+                name = f"{stem}_{size[0]}x{size[1]}_{counter}{extension}"
+                counter += 1
+        used_names.add(name)
+        with open(os.path.join(image_dir, name), "wb") as file:
+            file.write(data)
+        new_picture = f"./img/{name}"
+        references[(picture, size)] = new_picture
+        entries.append({
+            "source": picture,
+            "output": new_picture,
+            "size": list(size),
+            "source_bytes": os.path.getsize(source_path),
+            "bytes": len(data),
+        })
+
+    # Verweise in einer Kopie der Welt umschreiben; die Quelldatei bleibt unverändert
+    for planet in world["planets"]:
+        if (planet.get("picture"), MINIMAP_SIZE) in references:
+            planet["picture"] = references[(planet["picture"], MINIMAP_SIZE)]
+        for room in planet["rooms"]:
+            if (room.get("picture"), ROOM_IMAGE_SIZE) in references:
+                room["picture"] = references[(room["picture"], ROOM_IMAGE_SIZE)]
+    with open(os.path.join(output_dir, "world.json"), "w", encoding="utf-8") as file:
+        json.dump(world, file, ensure_ascii=False, indent=2)
+
+    # Vergleich mit dem bisher gebündelten Ordner img/ (enthält auch unbenutzte Dateien)
+    source_dir = os.path.join(base_path, "img")
+    bundled_before = sum(os.path.getsize(os.path.join(source_dir, name))
+                         for name in os.listdir(source_dir)) if os.path.isdir(source_dir) else 0
+    bundled_after = sum(entry["bytes"] for entry in entries)
+    manifest = {
+        "world": world_file,
+        "images": entries,
+        "bytes_before": bundled_before,
+        "bytes_after": bundled_after,
+    }
+    with open(os.path.join(output_dir, "manifest.json"), "w", encoding="utf-8") as file:
+        json.dump(manifest, file, ensure_ascii=False, indent=2)
+    return manifest
+
+
+def print_report(manifest):
+    for entry in manifest["images"]:
+        print(f"  {entry['source']:32} -> {entry['output']:32} {entry['size'][0]}x{entry['size'][1]:<4} "
+              f"{entry['source_bytes'] / 1024:8.1f} KiB -> {entry['bytes'] / 1024:7.1f} KiB")
+    before = manifest["bytes_before"]
+    after = manifest["bytes_after"]
+    if not before:  # img/ fehlt oder ist leer: keine Ersparnis zu berechnen
+        print(f"img/ bundle: empty -> {after / 1024:.1f} KiB")
+        return
+    print(f"img/ bundle: {before / 1024:.1f} KiB -> {after / 1024:.1f} KiB "
+          f"(saved {(before - after) / 1024:.1f} KiB, {100 * (before - after) / before:.0f}%)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build display-size images for the Stargate Adventure bundle.")
+    parser.add_argument("--world", default="world.json")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    options = parser.parse_args()
+    print_report(build_assets(options.world, options.output))
@@ -3,12 +3,21 @@ import json
 import time
 import random
 import os
+import threading
+from collections.abc import MutableMapping
+
+from session_random import SessionRandom
+from world_cache import load_cache, write_cache
+from world_loader import EdgeBuffer, stream_world
 
 
 #################################################################
 # Basisklasse für alle Spielobjekte
 class GameObject:
 
+    # __slots__ statt __dict__: spart pro Objekt Speicher und beschleunigt den Attributzugriff
+    __slots__ = ("name", "description")
+
     roomcounter = 0
 
     def __init__(self, name, description):
@@ -28,23 +37,85 @@ class GameObject:
         
         return isinstance(name, str) and len(name.strip()) > 0      #es wird gesvhaut ob der name gültig ist
 
+#################################################################
+# Vergibt jedem Itemnamen eine feste Bitnummer, damit Inventare und Anforderungen als Bitmasken geprüft werden können
+class ItemRegistry:
+    def __init__(self):
+        self.ids = {}  # Itemname -> Bitnummer
+        self.names = []  # Bitnummer -> Itemname
+        self._lock = threading.Lock()  # neue Nummern können aus mehreren Sitzungs-Threads kommen
+
+    def intern(self, name):
+        """Gibt die Bitnummer eines Items zurück und vergibt bei Bedarf eine neue."""
+        item_id = self.ids.get(name)
+        if item_id is None:
+            with self._lock:
+                item_id = self.ids.get(name)
+                if item_id is None:
+                    item_id = self.ids[name] = len(self.names)
+                    self.names.append(name)
+        return item_id
+
+    def mask_of(self, names):
+        """Bitmaske für eine Liste von Itemnamen."""
+        mask = 0
+        for name in names:
+            mask |= 1 << self.intern(name)
+        return mask
+
+    def names_of(self, mask):
+        """Itemnamen einer Bitmaske (nach Bitnummer sortiert)."""
+        names = self.names
+        result = []
+        while mask:
+            low = mask & -mask  # niedrigstes gesetztes Bit
+            result.append(names[low.bit_length() - 1])
+            mask ^= low
+        return result
+
+
+# Eine Nummerierung pro Prozess, damit alle Welten und Sitzungen dieselben Masken verwenden
+ITEMS = ItemRegistry()
+WEAPONS = ("P90", "M9", "C4", "Staff Weapon")  # Liste aller Waffen
+WEAPON_MASK = ITEMS.mask_of(WEAPONS)
+ROOM_ACTIONS = ("plant", "drop")  # Aktionen, die ein Raum in world.json unter "actions" anbieten kann
+TRIGGER_NAMES = ("die", "win")  # Auslöser für "on_enter" und "on_travel" in world.json
+
 #################################################################
 # Klasse für Räume im Spiel, erbt von GameObject
 class Room(GameObject):
-    def __init__(self, name, description, planet, objective=None, requirement=None, items=None, picture=None):
+    __slots__ = ("planet", "connections", "items", "requirement", "requirement_mask", "objective", "npc", "picture",
+                 "local_exits", "gate_exits", "special_actions", "enter_trigger", "travel_triggers")
+
+    def __init__(self, name, description, planet, objective=None, requirement=None, items=None, picture=None,
+                 actions=None, on_enter=None, on_travel=None):
         super().__init__(name, description)
         self.planet = planet
         self.connections = []
         self.items = items if items else []
         self.requirement = requirement if requirement else []
+        self.requirement_mask = ITEMS.mask_of(self.requirement)  # Anforderungen als Bitmaske
         self.objective = objective
         self.npc = None
         self.picture = picture 
+        self.local_exits = None  # Aufgelöste lokale Zielräume (Tupel), None = muss neu berechnet werden
+        self.gate_exits = None  # Aufgelöste interplanetare Zielräume (Tupel), None = muss neu berechnet werden
+        self.special_actions = tuple(actions) if actions else ()  # Raumspezifische Aktionen (z. B. "plant")
+        self.enter_trigger = on_enter  # Auslöser beim Betreten (z. B. "die") oder None
+        self.travel_triggers = dict(on_travel) if on_travel else {}  # Zielraumname -> Auslöser bei Stargate-Reise
 
 
     def add_connection(self, connection):
         """Fügt eine Verbindung zu diesem Raum hinzu."""
         self.connections.append(connection)
+        self.invalidate_exits()
+
+    def invalidate_exits(self):
+        """Verwirft die vorberechnete Nachbarschaft, damit sie beim nächsten Zugriff neu aufgebaut wird.
+
+        Muss auch aufgerufen werden, wenn eine bestehende Verbindung nachträglich geändert wird."""
+        self.local_exits = None
+        self.gate_exits = None
 
     def add_npc(self, npc):
         """Weist einen NPC diesem Raum zu."""
@@ -66,6 +137,7 @@ class Room(GameObject):
     
     def remove_requirements(self):
         self.requirement = []
+        self.requirement_mask = 0
 
     def __repr__(self):
         # Gibt eine detaillierte Beschreibung des Raums zurück
@@ -75,6 +147,8 @@ class Room(GameObject):
 # Klasse für Planeten im Spiel, erbt von GameObject
 
 class Planet(GameObject):
+    __slots__ = ("picture", "rooms")
+
     def __init__(self, name, picture):
         # Validieren des Planetennamens mithilfe der statischen Methode
         if not GameObject.is_valid_name(name):
@@ -95,48 +169,67 @@ class Planet(GameObject):
 #################################################################
 # Klasse für Verbindungen zwischen Räumen
 class Connection:
+    __slots__ = ("from_room", "to_room", "connection_type")
+
     def __init__(self, from_room, to_room, connection_type):
-        self._from_room = from_room  # Ausgangsraum (Room-Objekt)
-        self._to_room = to_room.name  # Zielraum (nur Name)
-        self._connection_type = connection_type  # Typ der Verbindung (z.B. 'interplanetary')
+        self.from_room = from_room  # Ausgangsraum (Room-Objekt)
+        self.to_room = to_room.name  # Zielraum (nur Name)
+        self.connection_type = connection_type  # Typ der Verbindung (z.B. 'interplanetary')
+
+    def __repr__(self):
+        # Gibt eine kurze Beschreibung der Verbindung zurück
+        return f"Connection: to {self.to_room}"
+
+#################################################################
+# Inventar des Spielers als Bitmaske; verhält sich nach außen wie ein Dictionary Itemname -> True
+class Inventory(MutableMapping):
+    __slots__ = ("mask",)
+
+    def __init__(self, items=()):
+        self.mask = 0
+        for item in items:
+            self.mask |= 1 << ITEMS.intern(item)
 
-    @property
-    def from_room(self):
-        return self._from_room
+    def __contains__(self, item):
+        item_id = ITEMS.ids.get(item)
+        return item_id is not None and (self.mask >> item_id) & 1 == 1
 
-    @from_room.setter
-    def from_room(self, value):
-        self._from_room = value
+    def __getitem__(self, item):
+        if item not in self:
+            raise KeyError(item)
+        return True
 
-    @property
-    def to_room(self):
-        return self._to_room  # Gibt den Namen des Zielraums zurück
+    def __setitem__(self, item, value):
+        if value:
+            self.mask |= 1 << ITEMS.intern(item)
+        elif item in self:
+            del self[item]
 
-    @to_room.setter
-    def to_room(self, value):
-        self._to_room = value
+    def __delitem__(self, item):
+        if item not in self:
+            raise KeyError(item)
+        self.mask &= ~(1 << ITEMS.ids[item])
 
-    @property
-    def connection_type(self):
-        return self._connection_type
+    def __iter__(self):
+        return iter(ITEMS.names_of(self.mask))
 
-    @connection_type.setter
-    def connection_type(self, value):
-        self._connection_type = value
+    def __len__(self):
+        return bin(self.mask).count("1")
 
     def __repr__(self):
-        # Gibt eine kurze Beschreibung der Verbindung zurück
-        return f"Connection: to {self._to_room}"
+        return f"Inventory({ITEMS.names_of(self.mask)})"
 
 #################################################################
 # Klasse für den Spieler, erbt von GameObject
 class Player(GameObject):
+    __slots__ = ("current_planet", "current_room", "health", "inventory")
+
     def __init__(self, name, health=100):
         super().__init__(name, description="Der Spielercharakter.")
         self.current_planet = None  # Aktueller Planet, auf dem sich der Spieler befindet
         self.current_room = None  # Aktueller Raum, in dem sich der Spieler befindet
         self.health = health  # Gesundheit des Spielers
-        self.inventory = {}  # Inventar des Spielers als Dictionary
+        self.inventory = Inventory()  # Inventar des Spielers (Bitmaske mit Dictionary-Schnittstelle)
 
     def add_item(self, item):
         """Fügt einen Gegenstand zum Inventar hinzu."""
@@ -145,8 +238,7 @@ class Player(GameObject):
 
     def has_weapon(self):
         """Überprüft, ob der Spieler eine Waffe im Inventar hat."""
-        weapons = ["P90", "M9", "C4", "Staff Weapon"]  # Liste aller Waffen
-        return any(item in self.inventory for item in weapons)
+        return self.inventory.mask & WEAPON_MASK != 0
 
     def __repr__(self):
         # Gibt eine Beschreibung des Spielers zurück, einschließlich Inventar
@@ -156,6 +248,9 @@ class Player(GameObject):
 #################################################################
 # Klasse für Nicht-Spieler-Charaktere (NPCs), erbt von GameObject
 class Npc(GameObject):
+    __slots__ = ("firstname", "lastname", "room", "hostile", "dead", "inventory", "dialogues",
+                 "default_lines", "topics", "topic_lines")
+
     def __init__(self, firstname, lastname, room, hostile, inventory=None, dialogues=None):
         super().__init__(name=f"{firstname} {lastname}", description="Ein NPC im Spiel.")
         self.firstname = firstname  # Vorname des NPC
@@ -165,19 +260,23 @@ class Npc(GameObject):
         self.dead = False  # Status, ob der NPC tot ist
         self.inventory = inventory if inventory else []  # Inventar des NPC
         self.dialogues = dialogues if dialogues else {}  # Dialogoptionen des NPC
+        # Dialoge einmal als Tupel vorbereiten, damit die Auswahl nur noch indiziert
+        self.default_lines = tuple(self.dialogues.get("default") or ())  # Standardsätze
+        self.topics = tuple(key for key in self.dialogues if key != "default")  # Gesprächsthemen
+        self.topic_lines = tuple(tuple(self.dialogues[topic] or ()) for topic in self.topics)  # Sätze je Thema
 
-    def interact(self):
+    def interact(self, rng=random):
         """Behandelt die Interaktion mit dem NPC."""
         # Anzeige des Standarddialogs zuerst
-        default_dialogues = self.dialogues.get("default", [])
+        default_dialogues = self.default_lines
         if default_dialogues:
-            print(f"{self.firstname} {self.lastname}: {random.choice(default_dialogues)}")
+            print(f"{self.firstname} {self.lastname}: {rng.choice(default_dialogues)}")
         else:
             print(f"{self.firstname} {self.lastname} has nothing to say.")
             return
 
         # Anzeige verfügbarer Dialogthemen
-        topics = [key for key in self.dialogues.keys() if key != "default"]
+        topics = self.topics
         if not topics:
             print(f"{self.firstname} {self.lastname} has no other topics to discuss.")
             return
@@ -190,10 +289,9 @@ class Npc(GameObject):
         try:
             choice = int(input("\nChoose a topic by entering the number: ").strip())
             if 1 <= choice <= len(topics):
-                topic = topics[choice - 1]
-                topic_dialogues = self.dialogues[topic]
+                topic_dialogues = self.topic_lines[choice - 1]
                 if topic_dialogues:
-                    print(f"\n{self.firstname} {self.lastname}: {random.choice(topic_dialogues)}")
+                    print(f"\n{self.firstname} {self.lastname}: {rng.choice(topic_dialogues)}")
                 else:
                     print(f"{self.firstname} {self.lastname} has no dialogue for this topic.")
             else:
@@ -201,17 +299,84 @@ class Npc(GameObject):
         except ValueError:
             print("⚠️ Invalid input. Please enter a number.")
 
+#################################################################
+# Index über alle Räume der Spielwelt, wird beim Laden einmal aufgebaut
+class WorldIndex:
+    def __init__(self):
+        self.by_name = {}  # Raumname -> Room
+        self.by_lower_name = {}  # Raumname in Kleinbuchstaben -> Room
+        self.planet_of = {}  # Room -> Planet
+        self.rooms_of = {}  # Planet -> Liste der Räume auf diesem Planeten
+        self.room_of_objective = {}  # Ziel -> Name des ersten Raums mit diesem Ziel (für Spielstände)
+
+    def add_room(self, room, planet):
+        """Nimmt einen Raum in alle Lookup-Tabellen auf."""
+        self.by_name[room.name] = room
+        self.by_lower_name.setdefault(room.name.lower(), room)  # bei Kollision gewinnt der erste Raum
+        self.planet_of[room] = planet
+        self.rooms_of.setdefault(planet, []).append(room)
+        if room.objective:
+            self.room_of_objective.setdefault(room.objective, room.name)
+
+    def find(self, room_name):
+        """Gibt den Raum mit exakt diesem Namen zurück oder None."""
+        return self.by_name.get(room_name)
+
+    def find_ignore_case(self, room_name):
+        """Gibt den Raum unabhängig von Groß-/Kleinschreibung zurück oder None."""
+        room = self.by_name.get(room_name)
+        if room is None:
+            room = self.by_lower_name.get(room_name.lower())
+        return room
+
+    def planet_of_room(self, room):
+        """Gibt den Planeten zurück, auf dem der Raum liegt."""
+        return self.planet_of.get(room)
+
+    def rooms_on(self, planet):
+        """Gibt alle Räume eines Planeten als Liste zurück."""
+        return self.rooms_of.get(planet, [])
+
 #################################################################
 # Hauptklasse für das Spiel
 class Game:
     def __init__(self):
-        self.planets = {}  # Dictionary zur Speicherung aller Planeten
-        self.room_map = {}  # Karte zur Zuordnung von Raumnamen zu Room-Objekten
+        self.reset_world()
         self.story_data = {}  # Daten für die Spielgeschichte
-        self.rooms = {}  # Dictionary zur Speicherung aller Räume
         self.player = None  # Spielerobjekt
         self.current_objective = ["Go to the briefing room and talk to General Hammond."]  # Aktuelle Ziele des Spielers
-        
+
+        # Spielstand dieser Sitzung als Overlay über der (geteilten, unveränderten) Welt:
+        # es wird nur gespeichert, was sich gegenüber der geladenen Welt geändert hat
+        self.room_items = {}  # Room -> aktuelle Item-Liste (Kopie, erst beim ersten Aufheben angelegt)
+        self.cleared_requirements = set()  # Räume, deren Anforderungen aufgehoben wurden
+        self.dead_npcs = set()  # getötete NPCs
+        self.npc_inventories = {}  # Npc -> aktuelles Inventar (Kopie, erst beim ersten Handel angelegt)
+        self.rng = SessionRandom()  # eigener Zufallsgenerator der Sitzung (Zustand wird mitgespeichert)
+        self.room_versions = {}  # Room -> Zähler, der bei jeder Änderung von Items, NPC oder Anforderungen steigt
+
+    def reset_world(self):
+        """Verwirft die geladene Welt (Planeten, Räume, Index, Auslöser); Story und Sitzungszustand bleiben."""
+        self.planets = {}  # Dictionary zur Speicherung aller Planeten
+        self.index = WorldIndex()  # Lookup-Index über alle Räume (Name, Planet)
+        self.room_map = self.index.by_name  # Karte zur Zuordnung von Raumnamen zu Room-Objekten
+        self.rooms = {}  # Dictionary zur Speicherung aller Räume
+        self.enter_trigger_rooms = {}  # Auslöser -> Räume, die ihn beim Betreten auslösen
+        self.travel_trigger_rooms = {}  # Auslöser -> Räume mit diesem Auslöser bei einer Stargate-Reise
+
+    @classmethod
+    def from_template(cls, template):
+        """Erstellt eine neue Spielsitzung, die die Welt eines bereits geladenen Spiels mitbenutzt."""
+        game = cls()
+        game.planets = template.planets
+        game.index = template.index
+        game.room_map = template.room_map
+        game.rooms = template.rooms
+        game.enter_trigger_rooms = template.enter_trigger_rooms
+        game.travel_trigger_rooms = template.travel_trigger_rooms
+        game.story_data = template.story_data
+        return game
+
 
     def load_json(self):
         """Lädt die Spielgeschichte aus einer JSON-Datei im gleichen Verzeichnis wie dieses Skript."""
@@ -221,119 +386,270 @@ class Game:
         with open(story_path, 'r', encoding='utf-8') as story_file:
             self.story_data["game_story"] = json.load(story_file)
 
-    def create_game(self, world_file="world.json"):
-        """Erstellt die Spielwelt, indem sie aus einer JSON-Datei im gleichen Verzeichnis geladen wird."""
+    def create_game(self, world_file="world.json", streaming=False, use_cache=False):
+        """Erstellt die Spielwelt, indem sie aus einer JSON-Datei im gleichen Verzeichnis geladen wird.
+
+        Mit streaming=True wird die Datei Raum für Raum gelesen (für sehr große Welten).
+        Mit use_cache=True wird eine kompilierte Binärdatei neben der JSON-Datei verwendet,
+        solange sich die Quelldatei nicht geändert hat, und sonst neu geschrieben."""
 
         # Absoluten Pfad zur JSON-Datei ermitteln – relativ zur Datei, in der diese Funktion steht
         base_path = os.path.dirname(__file__)
         world_path = os.path.join(base_path, world_file)
 
+        if use_cache and not self.rooms:
+            if load_cache(self, world_path):
+                self.finish_world()
+                return
+            self.create_game(world_file, streaming=streaming)
+            try:
+                write_cache(self, world_path)
+            except (OSError, ValueError) as error:
+                print(f"⚠️ Warnung: Welt-Cache konnte nicht geschrieben werden: {error}")
+            return
+
+        if streaming:
+            stream_world(self, world_path)
+            self.finish_world()
+            return
+
         # Lade die Spieldaten aus der JSON-Datei
         with open(world_path, 'r', encoding='utf-8') as file:
             world_data = json.load(file)
 
         # Zwischenspeicher für Verbindungen, die später hinzugefügt werden
-        pending_connections = []
+        pending_connections = EdgeBuffer()
 
         #  Zuerst alle Planeten und Räume erstellen
         for planet_data in world_data["planets"]:
-            planet_name = planet_data["name"]
-
-            # Planet erstellen und im Dictionary speichern
-            if planet_name in self.planets:
-                print(f"⚠️ Warnung: Planet '{planet_name}' existiert bereits und wird übersprungen!")
+            planet = self.add_planet(planet_data["name"], planet_data.get("picture", None))
+            if planet is None:
                 continue
 
-            planet = Planet(name=planet_name, picture = planet_data.get("picture", None))  # Planet-Objekt erstellen
-            self.planets[planet_name] = planet  # Planet in das Dictionary einfügen
-
             for room_data in planet_data["rooms"]:
-                room_name = room_data["name"]
-
-                # Überprüfen, ob der Raumname bereits existiert
-                if room_name in self.rooms:
-                    print(f"⚠️ Warnung: Raum '{room_name}' existiert bereits und wird übersprungen!")
+                room = self.add_room(room_data, planet)
+                if room is None:
                     continue
 
-                # Raum-Objekt erstellen
-                room = Room(
-                    name=room_name,
-                    description=room_data["description"],
-                    planet=planet,
-                    objective=room_data.get("objective"),
-                    requirement=room_data.get("requirement", []),
-                    items=room_data.get("items", []),
-                    picture=room_data.get("picture", None)
-                )
-
-                # NPCs verarbeiten, falls vorhanden
-                npc_data = room_data.get("npc")
-                if npc_data:
-                    npc = Npc(
-                        firstname=npc_data["first_name"],
-                        lastname=npc_data["last_name"],
-                        room=room,
-                        hostile=npc_data.get("hostile", False),
-                        inventory=npc_data.get("inventory", []),
-                        dialogues=npc_data.get("dialogues", {})
-                    )
-                    room.npc = npc  # NPC dem Raum zuweisen
-
-                # Raum zur Raumliste und zum Planeten hinzufügen
-                self.rooms[room_name] = room  # Raum im Raum-Dictionary speichern
-                planet.add_room(room)  # Raum zum Planeten hinzufügen
-
                 # Verbindungen zwischenspeichern, da andere Räume vielleicht noch nicht existieren
                 for connection_data in room_data.get("connections", []):
-                    pending_connections.append({
-                        "from_room": room_name,
-                        "to_room": connection_data["to_room"],
-                        "type": connection_data["type"]
-                    })
+                    pending_connections.add(room.name, connection_data["to_room"], connection_data["type"])
 
         #  Verbindungen verarbeiten, nachdem alle Räume erstellt wurden
-        for connection in pending_connections:
-            from_room = self.rooms.get(connection["from_room"])
-            to_room = self.rooms.get(connection["to_room"])
-
-            if from_room and to_room:
-                conn = Connection(
-                    from_room=from_room,
-                    to_room=to_room,
-                    connection_type=connection["type"]
-                )
-                from_room.add_connection(conn)
-            else:
-                if not from_room:
-                    print(f"⚠️ Warnung: Ausgangsraum '{connection['from_room']}' nicht gefunden!")
-                if not to_room:
-                    print(f"⚠️ Warnung: Zielraum '{connection['to_room']}' nicht gefunden!")
+        for from_room, to_room, connection_type in pending_connections:
+            self.connect_rooms(from_room, to_room, connection_type)
 
         #  Interplanetare Verbindungen verarbeiten (optional, wenn sie außerhalb der Planeten definiert sind)
         for connection_data in world_data.get("connections", []):
-            from_room = self.rooms.get(connection_data["from_room"])
-            to_room = self.rooms.get(connection_data["to_room"])
-
-            if from_room and to_room:
-                connection = Connection(
-                    from_room=from_room,
-                    to_room=to_room,
-                    connection_type=connection_data["type"]
-                )
-                from_room.add_connection(connection)
+            self.connect_rooms(connection_data["from_room"], connection_data["to_room"], connection_data["type"])
+
+        self.finish_world()
+
+    def add_planet(self, planet_name, picture=None):
+        """Legt einen Planeten an; gibt None zurück, wenn es ihn bereits gibt."""
+        # Planet erstellen und im Dictionary speichern
+        if planet_name in self.planets:
+            print(f"⚠️ Warnung: Planet '{planet_name}' existiert bereits und wird übersprungen!")
+            return None
+
+        planet = Planet(name=planet_name, picture=picture)  # Planet-Objekt erstellen
+        self.planets[planet_name] = planet  # Planet in das Dictionary einfügen
+        return planet
+
+    def add_room(self, room_data, planet):
+        """Legt einen Raum (samt NPC) aus seinen JSON-Daten an; gibt None zurück, wenn es ihn bereits gibt."""
+        room_name = room_data["name"]
+
+        # Überprüfen, ob der Raumname bereits existiert
+        if room_name in self.rooms:
+            print(f"⚠️ Warnung: Raum '{room_name}' existiert bereits und wird übersprungen!")
+            return None
+
+        # Raum-Objekt erstellen
+        room = Room(
+            name=room_name,
+            description=room_data["description"],
+            planet=planet,
+            objective=room_data.get("objective"),
+            requirement=room_data.get("requirement", []),
+            items=room_data.get("items", []),
+            picture=room_data.get("picture", None),
+            actions=room_data.get("actions"),
+            on_enter=room_data.get("on_enter"),
+            on_travel=room_data.get("on_travel")
+        )
+
+        # NPCs verarbeiten, falls vorhanden
+        npc_data = room_data.get("npc")
+        if npc_data:
+            npc = Npc(
+                firstname=npc_data["first_name"],
+                lastname=npc_data["last_name"],
+                room=room,
+                hostile=npc_data.get("hostile", False),
+                inventory=npc_data.get("inventory", []),
+                dialogues=npc_data.get("dialogues", {})
+            )
+            room.npc = npc  # NPC dem Raum zuweisen
+
+        self.register_room(room, planet)
+        return room
+
+    def register_room(self, room, planet):
+        """Nimmt einen fertigen Raum in die Raumliste, den Planeten und den Lookup-Index auf."""
+        ITEMS.mask_of(room.items)  # Itemnummern schon beim Laden vergeben
+        self.compile_room_rules(room)
+        if room.npc is not None:
+            ITEMS.mask_of(room.npc.inventory)
+        self.rooms[room.name] = room  # Raum im Raum-Dictionary speichern
+        planet.add_room(room)  # Raum zum Planeten hinzufügen
+        self.index.add_room(room, planet)  # Raum im Lookup-Index registrieren
+
+    def compile_room_rules(self, room):
+        """Prüft Aktionen und Auslöser eines Raums beim Laden und trägt die Auslöser in die Nachschlagetabellen ein.
+
+        Unbekannte Namen werden gemeldet und verworfen, damit sie im Spiel nie nachgeschlagen werden."""
+        unknown = [action for action in room.special_actions if action not in ROOM_ACTIONS]
+        if unknown:
+            print(f"⚠️ Warnung: Unbekannte Aktion(en) {', '.join(unknown)} in Raum '{room.name}' werden ignoriert!")
+            room.special_actions = tuple(action for action in room.special_actions if action in ROOM_ACTIONS)
+        if room.enter_trigger is not None:
+            if room.enter_trigger in TRIGGER_NAMES:
+                self.enter_trigger_rooms.setdefault(room.enter_trigger, []).append(room)
+            else:
+                print(f"⚠️ Warnung: Unbekannter Auslöser '{room.enter_trigger}' in Raum '{room.name}' wird ignoriert!")
+                room.enter_trigger = None
+        for target, trigger in list(room.travel_triggers.items()):
+            if trigger in TRIGGER_NAMES:
+                self.travel_trigger_rooms.setdefault(trigger, []).append(room)
+            else:
+                print(f"⚠️ Warnung: Unbekannter Auslöser '{trigger}' in Raum '{room.name}' wird ignoriert!")
+                del room.travel_triggers[target]
+
+    def connect_rooms(self, from_room_name, to_room_name, connection_type):
+        """Verbindet zwei bereits angelegte Räume; fehlende Räume werden gemeldet."""
+        from_room = self.rooms.get(from_room_name)
+        to_room = self.rooms.get(to_room_name)
+
+        if from_room and to_room:
+            connection = Connection(
+                from_room=from_room,
+                to_room=to_room,
+                connection_type=connection_type
+            )
+            from_room.add_connection(connection)
+        else:
+            if not from_room:
+                print(f"⚠️ Warnung: Ausgangsraum '{from_room_name}' nicht gefunden!")
+            if not to_room:
+                print(f"⚠️ Warnung: Zielraum '{to_room_name}' nicht gefunden!")
+
+    def finish_world(self):
+        """Schließt das Laden ab: Nachbarschaft einmalig vorberechnen, damit Bewegungen nicht mehr filtern müssen."""
+        for room in self.rooms.values():
+            if room.local_exits is None:  # bereits aus dem Welt-Cache übernommen
+                self.build_exits(room)
+
+    def build_exits(self, room):
+        """Teilt die Verbindungen eines Raums in lokale und interplanetare Zielräume auf."""
+        local_exits = []
+        gate_exits = []
+        for conn in room.connections:
+            target = self.index.find(conn.to_room)
+            if target is None:  # Verbindungen zu unbekannten Räumen werden übersprungen
+                continue
+            if conn.connection_type == "interplanetary":
+                gate_exits.append(target)
             else:
-                if not from_room:
-                    print(f"⚠️ Warnung: Ausgangsraum '{connection_data['from_room']}' nicht gefunden!")
-                if not to_room:
-                    print(f"⚠️ Warnung: Zielraum '{connection_data['to_room']}' nicht gefunden!")
+                local_exits.append(target)
+        room.local_exits = tuple(local_exits)
+        room.gate_exits = tuple(gate_exits)
+
+    def get_local_exits(self, room):
+        """Gibt die lokalen Nachbarräume als Tupel von Room-Objekten zurück."""
+        if room.local_exits is None:
+            self.build_exits(room)
+        return room.local_exits
+
+    def get_gate_exits(self, room):
+        """Gibt die über das Stargate erreichbaren Räume als Tupel von Room-Objekten zurück."""
+        if room.gate_exits is None:
+            self.build_exits(room)
+        return room.gate_exits
 
     def find_room_by_name(self, room_name):
         """Findet einen Raum anhand seines Namens über alle Planeten hinweg."""
-        for planet in self.planets.values():  # Zugriff auf die Werte des Planeten-Dictionary
-            for room in planet.rooms.values():  # Zugriff auf die Räume des Planeten
-                if room.name == room_name:
-                    return room
-        return None  # Rückgabe von None, wenn der Raum nicht gefunden wird
+        return self.index.find(room_name)  # None, wenn der Raum nicht gefunden wird
+
+    def find_room_ignore_case(self, room_name):
+        """Findet einen Raum anhand seines Namens, ohne auf Groß-/Kleinschreibung zu achten."""
+        return self.index.find_ignore_case(room_name)
+
+    def planet_of_room(self, room):
+        """Gibt den Planeten zurück, auf dem sich der Raum befindet."""
+        return self.index.planet_of_room(room)
+
+    #################################################################
+    # Zugriff auf den veränderlichen Zustand der Welt (Copy-on-Write pro Sitzung)
+    def items_in(self, room):
+        """Gibt die Items zurück, die in dieser Sitzung noch im Raum liegen."""
+        return self.room_items.get(room, room.items)
+
+    def take_item(self, room, item):
+        """Entfernt ein Item nur für diese Sitzung aus dem Raum; gibt False zurück, wenn es nicht da ist."""
+        items = self.items_in(room)
+        if item not in items:
+            return False
+        items = list(items)  # die Item-Liste der Welt bleibt unverändert
+        items.remove(item)
+        self.room_items[room] = items
+        self.touch_room(room)
+        return True
+
+    def requirements_of(self, room):
+        """Gibt die Anforderungen eines Raums in dieser Sitzung zurück."""
+        if room in self.cleared_requirements:
+            return []
+        return room.requirement
+
+    def requirement_mask(self, room):
+        """Gibt die Anforderungen eines Raums in dieser Sitzung als Bitmaske zurück."""
+        if room in self.cleared_requirements:
+            return 0
+        return room.requirement_mask
+
+    def can_enter(self, room):
+        """Prüft mit einer einzigen Maskenoperation, ob der Spieler alle Anforderungen des Raums erfüllt."""
+        return self.requirement_mask(room) & ~self.player.inventory.mask == 0
+
+    def clear_requirements(self, room):
+        """Hebt die Anforderungen eines Raums für diese Sitzung auf."""
+        self.cleared_requirements.add(room)
+        self.touch_room(room)
+
+    def npc_in(self, room):
+        """Gibt den lebenden NPC im Raum zurück oder None."""
+        npc = room.npc
+        if npc is None or npc.dead or npc in self.dead_npcs:
+            return None
+        return npc
+
+    def kill_npc(self, npc):
+        """Markiert einen NPC in dieser Sitzung als tot."""
+        self.dead_npcs.add(npc)
+        self.touch_room(npc.room)
+
+    def room_version(self, room):
+        """Gibt den Änderungszähler eines Raums in dieser Sitzung zurück (0 = unverändert)."""
+        return self.room_versions.get(room, 0)
+
+    def touch_room(self, room):
+        """Markiert einen Raum als verändert, damit davon abgeleitete Caches neu berechnet werden."""
+        self.room_versions[room] = self.room_versions.get(room, 0) + 1
+
+    def npc_inventory(self, npc):
+        """Gibt das Inventar eines NPCs in dieser Sitzung zurück."""
+        return self.npc_inventories.get(npc, npc.inventory)
 
     def update_current_objective(self, room):
         """Aktualisiert das aktuelle Ziel des Spielers basierend auf dem betretenen Raum."""
@@ -342,8 +658,9 @@ class Game:
 
     def handle_trade(self, npc):
         """Behandelt den Handel mit einem NPC."""
-        print(f"{npc.firstname} {npc.lastname}'s Inventory: {', '.join(npc.inventory)}")
-        if not npc.inventory:
+        inventory = self.npc_inventory(npc)
+        print(f"{npc.firstname} {npc.lastname}'s Inventory: {', '.join(inventory)}")
+        if not inventory:
             print("The NPC has nothing to trade.")
             return
 
@@ -352,8 +669,11 @@ class Game:
             print("You decided not to trade.")
             return
 
-        if choice in npc.inventory:
-            npc.inventory.remove(choice)
+        if choice in inventory:
+            inventory = list(inventory)  # das Inventar in der Welt bleibt unverändert
+            inventory.remove(choice)
+            self.npc_inventories[npc] = inventory
+            self.touch_room(npc.room)
             self.player.add_item(choice)
             print(f"You received {choice}!")
         else:
@@ -366,14 +686,16 @@ class Game:
         print(f"📍 Current Location: {self.player.current_room.name}")
         print("-" * 40)
         print(f"{self.player.current_room.description}")
-        if self.player.current_room.npc:
-            print(f"🧑 You see {self.player.current_room.npc.firstname} {self.player.current_room.npc.lastname} here.")
+        npc = self.npc_in(self.player.current_room)
+        if npc:
+            print(f"🧑 You see {npc.firstname} {npc.lastname} here.")
         print("=" * 40)
 
-    def kill_player(self):
+    def kill_player(self, announce=True):
         """Tötet den Spieler und beendet das Spiel."""
-        print("⚠️ You have been captured by the Jaffa forces and have been killed!")
-        print("Game Over.")
+        if announce:
+            print("⚠️ You have been captured by the Jaffa forces and have been killed!")
+            print("Game Over.")
         self.player.current_room = self.rooms["Ascend"]
         
         
@@ -381,20 +703,21 @@ class Game:
     def pickup_item(self):
         """Ermöglicht dem Spieler, einen Gegenstand aus dem aktuellen Raum aufzuheben."""
         room = self.player.current_room
-        if not room.items:
+        items = self.items_in(room)
+        if not items:
             print(f"There are no items in {room.name}.")
             return
 
         print(f"\nItems in {room.name}:")
-        for index, item in enumerate(room.items, start=1):
+        for index, item in enumerate(items, start=1):
             print(f"[{index}] {item}")
 
         try:
             choice = int(input("Enter the number of the item you want to pick up: ").strip())
-            if 1 <= choice <= len(room.items):
-                item = room.items[choice - 1]
+            if 1 <= choice <= len(items):
+                item = items[choice - 1]
                 self.player.add_item(item)  # Füge den Gegenstand zum Inventar des Spielers hinzu
-                room.remove_item(item)  # Entferne den Gegenstand aus dem Raum
+                self.take_item(room, item)  # Entferne den Gegenstand aus dem Raum
                 print(f"You picked up {item}.")
             else:
                 print("⚠️ Invalid choice. Please select a valid item number.")
@@ -428,17 +751,17 @@ class Game:
         # Hauptspielschleife
         while True:
             print("\n--- Available Actions ---")
-            if self.player.current_room.items:
+            if self.items_in(self.player.current_room):
                 print("[pickup] Pick up an item.")
-            if self.player.current_room.npc:
+            if self.npc_in(self.player.current_room):
                 print("[interact] Interact with the NPC.")
-            if any(conn.connection_type == "interplanetary" for conn in self.player.current_room.connections):
+            if self.get_gate_exits(self.player.current_room):
                 print("[travel] Travel to another planet.")
             print("[move] Move to another room.")
             # Zusätzliche Aktionen für spezifische Räume hinzufügen
-            if self.player.current_room.name.lower() == "reactor":
+            if "plant" in self.player.current_room.special_actions:
                 print("[plant] Plant C4.")
-            if self.player.current_room.name.lower() == "shield generator":
+            if "drop" in self.player.current_room.special_actions:
                 print("[drop] Drop a grenade.")
             print("[quit] Quit the game.")
             print("-" * 40)
@@ -446,17 +769,17 @@ class Game:
             action = input("What do you want to do? ").strip().lower()
             print("=" * 40)
 
-            if action == "pickup" and self.player.current_room.items:
+            if action == "pickup" and self.items_in(self.player.current_room):
                 self.pickup_item()
-            elif action == "interact" and self.player.current_room.npc:
+            elif action == "interact" and self.npc_in(self.player.current_room):
                 self.interact_with_npc()
-            elif action == "travel" and any(conn.connection_type == "interplanetary" for conn in self.player.current_room.connections):
+            elif action == "travel" and self.get_gate_exits(self.player.current_room):
                 self.handle_gate_travel()
             elif action == "move":
                 self.move()
-            elif action == "plant" and self.player.current_room.name.lower() == "reactor":
+            elif action == "plant" and "plant" in self.player.current_room.special_actions:
                 self.plant_c4()
-            elif action == "drop" and self.player.current_room.name.lower() == "shield generator":
+            elif action == "drop" and "drop" in self.player.current_room.special_actions:
                 self.drop_grenade()
             elif action == "quit":
                 print("Thanks for playing!")
@@ -472,14 +795,14 @@ class Game:
             return
 
         # Wenn der NPC bereits tot ist
-        if npc.dead:
+        if self.npc_in(self.player.current_room) is None:
             print(f"{npc.firstname} {npc.lastname} is already dead. There is nothing more to interact with.")
             return
 
         # Anzeige des Standarddialogs
-        default_dialogues = npc.dialogues.get("default", [])
+        default_dialogues = npc.default_lines
         if default_dialogues:
-            print(f"{npc.firstname} {npc.lastname}: {random.choice(default_dialogues)}")
+            print(f"{npc.firstname} {npc.lastname}: {self.rng.choice(default_dialogues)}")
         else:
             print(f"{npc.firstname} {npc.lastname} has nothing to say.")
 
@@ -490,8 +813,7 @@ class Game:
                 choice = input(f"\nYou have a weapon. Do you want to attack {npc.firstname}? (yes/no): ").strip().lower()
                 if choice == "yes":
                     print(f"\n🔫 You attacked and killed {npc.firstname} {npc.lastname}!")
-                    npc.dead = True
-                    self.player.current_room.npc = None  # Entferne den NPC aus dem Raum
+                    self.kill_npc(npc)  # NPC ist ab jetzt nicht mehr im Raum
                     return
                 else:
                     print("\nYou chose not to attack.")
@@ -500,7 +822,7 @@ class Game:
             return  # Beende die Interaktion, wenn der NPC feindlich ist
 
         # Umgang mit nicht feindlichen NPCs mit zusätzlichen Dialogthemen
-        topics = [key for key in npc.dialogues.keys() if key != "default"]
+        topics = npc.topics
         if not topics:
             print(f"{npc.firstname} {npc.lastname} has no additional topics to discuss.")
             return
@@ -517,9 +839,9 @@ class Game:
                 choice = int(input("\nChoose a topic by entering the number: ").strip())
                 if 1 <= choice <= len(topics):
                     topic = topics[choice - 1]
-                    topic_dialogues = npc.dialogues.get(topic, [])
+                    topic_dialogues = npc.topic_lines[choice - 1]
                     if topic_dialogues:
-                        print(f"\n{npc.firstname} {npc.lastname}: {random.choice(topic_dialogues)}")
+                        print(f"\n{npc.firstname} {npc.lastname}: {self.rng.choice(topic_dialogues)}")
                     else:
                         print(f"{npc.firstname} {npc.lastname} has nothing more to say about {topic}.")
                 elif choice == len(topics) + 1:
@@ -532,55 +854,55 @@ class Game:
 
     def check_room_requirements(self, next_room):
         """Überprüft, ob der Spieler die Anforderungen erfüllt, um einen Raum zu betreten."""
-        requirements = next_room.requirement
-        if all(item in self.player.inventory for item in requirements):
+        missing_items = self.missing_requirements(next_room)
+        if not missing_items:
             return True
         else:
-            missing_items = [item for item in requirements if item not in self.player.inventory]
             print(f"⚠️ You cannot enter {next_room.name}. Missing items: {', '.join(missing_items)}.")
             return False
 
+    def missing_requirements(self, next_room):
+        """Gibt die Items zurück, die dem Spieler zum Betreten des Raums fehlen (leere Liste = darf hinein)."""
+        if self.can_enter(next_room):  # häufiger Fall: eine Maskenoperation, keine Liste
+            return []
+        inventory = self.player.inventory
+        return [item for item in self.requirements_of(next_room) if item not in inventory]
+
     def handle_gate_travel(self):
         """Behandelt das Reisen durch das Stargate zwischen Planeten."""
-        interplanetary_connections = [
-            conn for conn in self.player.current_room.connections if conn.connection_type == "interplanetary"
-        ]
-        if not interplanetary_connections:
+        gate_exits = self.get_gate_exits(self.player.current_room)
+        if not gate_exits:
             print("⚠️ No Stargate connections available from this room.")
             return
 
-        current_room_name = self.player.current_room.name.lower()
+        travel_triggers = self.player.current_room.travel_triggers
 
         print("\nAvailable Stargate Destinations:")
-        for index, connection in enumerate(interplanetary_connections, start=1):
-            print(f"[{index}] {connection.to_room}")
+        for index, destination in enumerate(gate_exits, start=1):
+            print(f"[{index}] {destination.name}")
 
         try:
             choice = int(input("Enter the number of the destination: ").strip())
-            if 1 <= choice <= len(interplanetary_connections):
-                connection = interplanetary_connections[choice - 1]
-                next_room = self.find_room_by_name(connection.to_room)
-                if next_room:
-                    if self.check_room_requirements(next_room):
-                        # Spezifische Reisebedingung: Shuttlebay -> Briefing Room
-                        if current_room_name == "shuttle bay" and connection.to_room.lower() == "briefing room":
-                            print("You travel back to the Briefing Room by using a deathglider.")
-                            outro = self.story_data.get("game_story", {}).get("outro", {})
-                            for line in outro:
-                                print(line)
-                            exit(0)
-                        else:
-                            print("You step through the event horizon.")  # Standardnachricht für andere Reisen
-
-                        # Aktualisieren des Spielerstandorts
-                        self.player.current_room = next_room
-                        self.player.current_planet = next(
-                            planet for planet in self.planets.values() if next_room.name in planet.rooms
-                        )
-                        self.update_current_objective(next_room)  # Aktualisiere das Ziel
-                        self.display_room_status()
-                else:
-                    print(f"⚠️ The room '{connection.to_room}' could not be found.")
+            if 1 <= choice <= len(gate_exits):
+                next_room = gate_exits[choice - 1]
+                if self.check_room_requirements(next_room):
+                    # Auslöser der Reise aus world.json (z. B. Shuttlebay -> Briefing Room gewinnt)
+                    if travel_triggers.get(next_room.name) == "win":
+                        print("You travel back to the Briefing Room by using a deathglider.")
+                        outro = self.story_data.get("game_story", {}).get("outro", {})
+                        for line in outro:
+                            print(line)
+                        exit(0)
+                    else:
+                        print("You step through the event horizon.")  # Standardnachricht für andere Reisen
+
+                    # Aktualisieren des Spielerstandorts
+                    self.player.current_room = next_room
+                    self.player.current_planet = self.planet_of_room(next_room)
+                    self.update_current_objective(next_room)  # Aktualisiere das Ziel
+                    self.display_room_status()
+                    if next_room.enter_trigger == "die":
+                        self.kill_player()
             else:
                 print("⚠️ Invalid choice. Please select a valid destination number.")
         except ValueError:
@@ -588,34 +910,28 @@ class Game:
 
     def move(self):
         """Behandelt die lokale Bewegung zwischen Räumen."""
-        local_connections = [
-            conn for conn in self.player.current_room.connections if conn.connection_type != "interplanetary"
-        ]
+        local_exits = self.get_local_exits(self.player.current_room)
 
-        if not local_connections:
+        if not local_exits:
             print("⚠️ There are no local connections from this room.")
             return
 
         print("\nAvailable rooms:")
-        for index, connection in enumerate(local_connections, start=1):
-            print(f"[{index}] {connection.to_room}")
+        for index, destination in enumerate(local_exits, start=1):
+            print(f"[{index}] {destination.name}")
 
         try:
             choice = int(input("Enter the number of the room you want to move to: ").strip())
-            if 1 <= choice <= len(local_connections):
-                connection = local_connections[choice - 1]
-                next_room = self.find_room_by_name(connection.to_room)
-                if not next_room:
-                    print(f"⚠️ The room '{connection.to_room}' could not be found.")
-                    return
+            if 1 <= choice <= len(local_exits):
+                next_room = local_exits[choice - 1]
 
                 if self.check_room_requirements(next_room):
                     self.player.current_room = next_room
                     self.update_current_objective(next_room)  # Aktualisiere das Ziel
                     self.display_room_status()
 
-                    # Beispiel: Wenn der Spieler den "Front Gate" betritt, wird er getötet
-                    if next_room.name.lower() == "front gate":
+                    # Auslöser beim Betreten aus world.json (z. B. Front Gate tötet den Spieler)
+                    if next_room.enter_trigger == "die":
                         self.kill_player()
             else:
                 print("⚠️ Invalid choice. Please select a valid room number.")
@@ -626,15 +942,14 @@ class Game:
     # Neue Methode zum Pflanzen von C4 im Reactor-Raum
     def plant_c4(self):
         """Ermöglicht dem Spieler, C4 im Reactor-Raum zu pflanzen."""
-        reactor_room = self.find_room_by_name("Reactor")
-        if reactor_room and reactor_room == self.player.current_room:
+        if "plant" in self.player.current_room.special_actions:  # Raumaktion aus world.json
             # Überprüfen, ob der Spieler C4 bereits im Inventar hat
             if "C4" in self.player.inventory:
                 print("You carefully plant the C4 in the Reactor.")
                 # Entferne C4 aus dem Inventar nach dem Pflanzen
                 del self.player.inventory["C4"]
                 # Füge eine neue Bedingung oder ein neues Ziel hinzu
-                self.player.current_room.remove_requirements()
+                self.clear_requirements(self.player.current_room)
                 
                 print("C4 is planted. It will explode soon.")
             else:
@@ -646,8 +961,7 @@ class Game:
     # Neue Methode zum Werfen einer Granate im ShieldGenerator-Raum
     def drop_grenade(self):
         """Ermöglicht dem Spieler, eine Granate im ShieldGenerator-Raum zu werfen."""
-        shield_room = self.find_room_by_name("Shield Generator")
-        if shield_room and shield_room == self.player.current_room:
+        if "drop" in self.player.current_room.special_actions:  # Raumaktion aus world.json
             # Überprüfen, ob der Spieler eine Granate im Inventar hat
             if "Grenade" in self.player.inventory:
                 print("You throw the grenade at the Shield Generator.")
@@ -661,6 +975,29 @@ class Game:
             print("⚠️ You are not in the Shield Generator room.")
 
 
+#################################################################
+# Pro Prozess geteilte Welt-Vorlagen (Welt und Story werden nur einmal geladen)
+_world_templates = {}
+_world_templates_lock = threading.Lock()
+
+
+def get_world_template(world_file="world.json", streaming=True):
+    """Gibt ein fertig geladenes Game-Objekt zurück, das alle Sitzungen im Prozess als Vorlage teilen.
+
+    Die Vorlage darf während des Spiels nicht verändert werden; Sitzungen entstehen mit Game.from_template.
+    Ohne gültigen Cache wird die Weltdatei standardmäßig gestreamt, damit auch sehr große Welten ladbar sind.
+    """
+    world_path = os.path.abspath(os.path.join(os.path.dirname(__file__), world_file))
+    with _world_templates_lock:
+        template = _world_templates.get(world_path)
+        if template is None:
+            template = Game()
+            template.load_json()
+            template.create_game(world_path, streaming=streaming, use_cache=True)
+            _world_templates[world_path] = template
+        return template
+
+
 #################################################################
 # Funktion zum Starten des Spiels
 def startgame(): 
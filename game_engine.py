@@ -1,14 +1,21 @@
-import random
-from game import Game, Player
+from action_result import ActionResult, Outcome, RoomState
+from game import Game, Player, get_world_template
+from game_rules import (apply_drop, apply_interact, apply_kill, apply_move, apply_pickup, apply_plant,
+                        apply_travel)
+from pathfinding import RouteFinder
+from savegame import dump_session, load_session
+from session_random import SessionRandom
 
 
 # Hauptklasse, die das Spiel steuert
 class GameEngine:
-    def __init__(self):
-        self.game = Game()  # Neues Spielobjekt
-        self.game.load_json()  # Lädt Story und Spielwelt aus JSON
-        self.game.create_game()  # Erstellt Spielstruktur
+    def __init__(self, seed=None):
+        # Neue Sitzung über der im Prozess geteilten Welt (Story und Welt werden nur einmal geladen)
+        self.game = Game.from_template(get_world_template())
+        self.game.rng = SessionRandom(seed)  # gleicher Seed -> gleiche Dialoge (ohne Seed zufällig)
         self.player = None  # Spielerobjekt (noch leer)
+        self.routes = None  # RouteFinder für goto (wird beim ersten Aufruf angelegt)
+        self.action_cache = {}  # Room -> (Raumversion, Aktionen) für get_available_actions
 
     # Initialisiert das Spiel mit einem Spielernamen
     def initialize_game(self, player_name):
@@ -19,148 +26,201 @@ class GameEngine:
         self.player.current_room = self.player.current_planet.rooms["Quarters"]
         return self.get_room_status()
 
-    # Gibt aktuellen Raumstatus (Name, Beschreibung, NPCs, Items, Ziel)
-    def get_room_status(self):
+    # Gibt den aktuellen Raumzustand als RoomState zurück (nur Referenzen, Text erst bei Bedarf)
+    def get_room_state(self):
         room = self.player.current_room
-        msg = f"\n Location: {room.name}\n{room.description}"
-        if room.npc and not room.npc.dead:  #falls npc im raum
-            msg += f"\n You see {room.npc.name} here."  #an msg wird angehängt
-        if room.items:
-            msg += f"\n Items in room: {', '.join(room.items)}"
-        msg += f"\n Current Objective: {self.game.current_objective[-1]}"
-        return msg
+        return RoomState(room, self.game.npc_in(room), self.game.items_in(room), self.game.current_objective[-1])
+
+    # Gibt aktuellen Raumstatus (Name, Beschreibung, NPCs, Items, Ziel) als Text zurück
+    def get_room_status(self):
+        return self.get_room_state().render()
 
     # Gibt verfügbare Aktionen basierend auf Rauminhalt zurück
     def get_available_actions(self):
+        """Gibt die Aktionen im aktuellen Raum als Tupel zurück.
+
+        Das Ergebnis wird pro Raum gespeichert und erst neu berechnet, wenn sich der Raum in dieser Sitzung
+        geändert hat (Game.room_version)."""
         room = self.player.current_room
+        version = self.game.room_version(room)
+        cached = self.action_cache.get(room)
+        if cached is not None and cached[0] == version:
+            return cached[1]
         actions = ["move", "quit"]
-        if room.items:  #wenn items existieren
+        if self.game.items_in(room):  #wenn items existieren
             actions.append("pickup")
-        if room.npc and not room.npc.dead:
+        npc = self.game.npc_in(room)
+        if npc:
             actions.append("interact")
-            if room.npc.hostile:    #falls npc hostile
+            if npc.hostile:    #falls npc hostile
                 actions.append("kill")
-        if any(conn.connection_type == "interplanetary" for conn in room.connections):  #falls interplanetary connections existieren, iterate über alle connections
-            actions.append("travel")    
-        if room.name.lower() == "reactor":  #falls im raum reactor
-            actions.append("plant")
-        if room.name.lower() == "shield generator": #falls im raum shield generator
-            actions.append("drop")
+        if self.game.get_gate_exits(room):  #falls interplanetary connections existieren
+            actions.append("travel")
+        actions.extend(room.special_actions)  # z. B. plant im Reaktor, drop am Schildgenerator
+        actions = tuple(actions)
+        self.action_cache[room] = (version, actions)
         return actions
 
     # Bewegung zu einem benachbarten Raum (nicht interplanetar)
     def move(self, direction_name):
-        room = self.player.current_room
-        connections = [
-            conn for conn in room.connections if conn.connection_type != "interplanetary" # iterate über alle connections, die nicht interplanetary sind
-        ]
-        for conn in connections:
-            if conn.to_room.lower() == direction_name.lower():   # falls der Raum existiert
-                next_room = self.game.find_room_by_name(conn.to_room) # suche den Raum mit namen
-                if not next_room:                                      # falls der Raum nicht existiert
-                    return f" The room '{conn.to_room}' could not be found."
-                if self.game.check_room_requirements(next_room):       # prüfe ob die Anforderungen erfüllt sind
-                    self.player.current_room = next_room               # setze den aktuellen Raum auf den nächsten Raum
-                    self.game.update_current_objective(next_room)       # aktualisiere das aktuelle Ziel
-                    if next_room.name.lower() == "front gate":          # falls der Raum der Front Gate ist
-                        self.game.kill_player()                         # töte den Spieler
-                    return f" You moved to {next_room.name}.\n" + self.get_room_status() # gebe den neuen Raumstatus zurück
-                else:
-                    return f"🚫 Requirements not met for room {next_room.name}, you're missing {next_room.requirement[0]} ."
-        return f" No connection to room '{direction_name}'."
+        target = self.game.find_room_ignore_case(direction_name)  # Zielraum über den Index (ohne Groß-/Kleinschreibung)
+        outcome = apply_move(self.game, self.player, target)
+        if outcome is Outcome.NO_CONNECTION:
+            return ActionResult(outcome, direction_name)
+        if outcome is Outcome.BLOCKED:
+            return ActionResult(outcome, target.name, detail=self.game.missing_requirements(target))
+        return self._arrival(outcome, target)
 
     # Reisen zu einem anderen Planeten (interplanetar)
     def travel(self, destination_index):
-        room = self.player.current_room  # Raum des Spielers
-        interplanetary = [
-            conn for conn in room.connections if conn.connection_type == "interplanetary" # alle interplanetary connections
-        ]
-        if 0 <= destination_index < len(interplanetary):    # falls der Index gültig ist
-            conn = interplanetary[destination_index]        # Verbindung zu einem anderen Raum
-            next_room = self.game.find_room_by_name(conn.to_room)   # suche den Raum mit dem Namen
-            if not next_room:                                   # falls der Raum nicht existiert
-                return f" Room '{conn.to_room}' not found."     
-            if self.game.check_room_requirements(next_room):    # prüfe ob die Anforderungen erfüllt sind
-                if room.name.lower() == "shuttle bay" and next_room.name.lower() == "briefing room":    # falls der Raum Shuttle Bay ist und der nächste Raum Briefing Room ist
-                    # Spielsieg bei Zielerreichung
-                    outro = self.game.story_data.get("game_story", {}).get("outro", [])     # gebe die Outro-Story zurück
-                    return "\n".join(outro) + "\n You win!"     
-                self.player.current_room = next_room           # setze den aktuellen Raum auf den nächsten Raum
-                self.player.current_planet = next(              # setze den aktuellen Planeten auf den nächsten Planeten
-                    planet for planet in self.game.planets.values() # iteriere über alle Planeten
-                    if next_room.name in planet.rooms               # falls der Raum im Planeten existiert
-                )
-                self.game.update_current_objective(next_room)       # aktualisiere das aktuelle Ziel
-                return f" You traveled to {next_room.name}.\n" + self.get_room_status() # gebe den neuen Raumstatus zurück
+        gate_exits = self.game.get_gate_exits(self.player.current_room)   # vor der Reise merken (für den Zielraum)
+        outcome = apply_travel(self.game, self.player, destination_index)
+        if outcome is Outcome.INVALID_DESTINATION:
+            return ActionResult(outcome, destination_index)
+        target = gate_exits[destination_index]
+        if outcome is Outcome.TRAVEL_BLOCKED:
+            return ActionResult(outcome, target.name, detail=self.game.requirements_of(target))
+        return self._arrival(outcome, target)
+
+    # Ergebnis nach Betreten eines Raums (auch Tod und Sieg durch Auslöser aus world.json)
+    def _arrival(self, outcome, room):
+        if outcome is Outcome.WON:
+            outro = self.game.story_data.get("game_story", {}).get("outro", [])     # Outro-Story für die Anzeige
+            return ActionResult(outcome, room.name, detail=outro)
+        return ActionResult(outcome, room.name, self.get_room_state(), (self.player,))
+
+    # Läuft auf dem kürzesten erlaubten Weg in einen beliebigen Raum (auch über das Stargate)
+    def goto(self, room_name):
+        target = self.game.find_room_ignore_case(room_name)
+        if target is None:
+            return ActionResult(Outcome.NO_ROUTE, room_name)
+        if self.routes is None or self.routes.game is not self.game:
+            deadly = self.game.enter_trigger_rooms.get("die", ())      # tödliche Räume, nie Zwischenstation
+            self.routes = RouteFinder(self.game, avoid=deadly)
+        path = self.routes.route(self.player.current_room, target)
+        if path is None:
+            return ActionResult(Outcome.NO_ROUTE, target.name)
+
+        # Jeder Schritt läuft über move/travel, damit Ziele, Tod und Sieg genauso ausgelöst werden
+        for next_room in path:
+            room = self.player.current_room
+            if next_room in self.game.get_local_exits(room):
+                result = self.move(next_room.name)
             else:
-                return f" Cannot travel. Requirements not met for {next_room.requirement}."
-        return " Invalid travel destination index."
+                result = self.travel(self.game.get_gate_exits(room).index(next_room))
+            if result.outcome not in (Outcome.MOVED, Outcome.TRAVELED):   # z. B. gestorben oder gewonnen
+                return result
+        return ActionResult(Outcome.ARRIVED, target.name, self.get_room_state(), (self.player,),
+                            [room.name for room in path])
 
     # Interaktion mit einem NPC im Raum
     def interact(self):
-        npc = self.player.current_room.npc  # NPC im aktuellen Raum
-        if not npc or npc.dead:             # falls kein NPC existiert oder der NPC tot ist
-            return "There's no one to interact with."
-
+        npc = self.game.npc_in(self.player.current_room)  # lebender NPC im aktuellen Raum
         lines = []                          # Liste für Dialogzeilen
-        default_dialog = npc.dialogues.get("default", [])
-        if default_dialog:
-            lines.append(f"{npc.name}: {random.choice(default_dialog)}")    # zufällige Zeile aus dem Standarddialog
-
-        if npc.hostile:                             # falls der NPC feindlich ist
-            if self.player.has_weapon():            # falls der Spieler bewaffnet ist
-                lines.append(f" {npc.name} is hostile. You are armed.") 
-            else:
-                lines.append(f" {npc.name} is hostile, and you're unarmed. Be careful.")
-        else:
-            topics = [k for k in npc.dialogues.keys() if k != "default"]    # erstes k ist was zur liste hinzugefügt wird, was nicht default ist, zweites k ist was in der liste ist
-            if topics:                       # falls Themen existieren
-                lines.append(f"🗣️ Topics: {', '.join(topics)} (not interactive in GUI yet)")
-        return "\n".join(lines)
+        outcome = apply_interact(self.game, self.player, lines)
+        if outcome is Outcome.NO_ONE_HERE:
+            return ActionResult(outcome)
+        return ActionResult(outcome, npc.name, detail=lines)
 
     # Gegenstand im Raum aufnehmen
     def pickup(self, item_name):
         room = self.player.current_room     # aktueller Raum des Spielers
-        if item_name in room.items:       # falls der Gegenstand im Raum existiert
-            room.remove_item(item_name)     # entferne den Gegenstand aus dem Raum
-            self.player.add_item(item_name)   # füge den Gegenstand zum Inventar des Spielers hinzu
-            return f"✅ You picked up {item_name}." 
-        return f" '{item_name}' is not in this room."
+        outcome = apply_pickup(self.game, self.player, item_name)
+        if outcome is Outcome.PICKED_UP:
+            return ActionResult(outcome, item_name, self.get_room_state(), (self.player, room))
+        return ActionResult(outcome, item_name)
 
     # Gegner töten, wenn Spieler bewaffnet ist
     def kill(self, enemy_name):
-        npc = self.player.current_room.npc  # NPC im aktuellen Raum
-        if not npc or npc.dead:             # falls kein NPC existiert oder der NPC tot ist
-            return " There's no enemy here."
-        if npc.firstname.lower() != enemy_name.lower(): # falls der Name des NPCs nicht mit dem eingegebenen Namen übereinstimmt
-            return f" No enemy named '{enemy_name}' here."
-        if not self.player.has_weapon():        # falls der Spieler keine Waffe hat
-            return " You don't have a weapon!"
-        npc.dead = True                # setze den NPC auf tot
-        self.player.current_room.npc = None # entferne den NPC aus dem Raum
-        return f" You killed {npc.firstname} {npc.lastname}."
+        npc = self.game.npc_in(self.player.current_room)  # vor dem Kampf merken, danach ist er tot
+        outcome = apply_kill(self.game, self.player, enemy_name)
+        if outcome is Outcome.KILLED:
+            return ActionResult(outcome, npc.name, self.get_room_state(), (npc,))
+        if outcome is Outcome.WRONG_ENEMY:
+            return ActionResult(outcome, enemy_name)
+        if outcome is Outcome.NO_WEAPON:
+            return ActionResult(outcome, npc.name)
+        return ActionResult(outcome)
 
     # C4 im Reaktor platzieren
     def plant(self):
-        room = self.player.current_room 
-        if room.name.lower() != "reactor":  # falls der Raum nicht der Reaktor ist
-            return " You're not in the Reactor."
-        if "C4" in self.player.inventory:   # falls C4 im Inventar des Spielers ist
-            del self.player.inventory["C4"] # entferne C4 aus dem Inventar
-            room.remove_requirements()  # entferne die Anforderungen des Raums
-            return "💣 You planted C4 in the reactor!"  
-        return " You don't have C4."
+        room = self.player.current_room
+        outcome = apply_plant(self.game, self.player)
+        if outcome is Outcome.PLANTED:
+            return ActionResult(outcome, "C4", self.get_room_state(), (self.player, room))
+        return ActionResult(outcome)
 
     # Granate beim Generator werfen
     def drop(self):
-        room = self.player.current_room # aktueller Raum des Spielers
-        if room.name.lower() != "shield generator": # falls der Raum nicht der Schildgenerator ist
-            return "⚠️ You're not in the Shield Generator."
-        if "Grenade" in self.player.inventory:  # falls Granate im Inventar des Spielers ist    
-            del self.player.inventory["Grenade"]    # entferne Granate aus dem Inventar
-            return "💥 You threw the grenade at the generator!"
-        return "❌ You don't have a grenade."
+        outcome = apply_drop(self.game, self.player)
+        if outcome is Outcome.GRENADE_THROWN:
+            return ActionResult(outcome, "Grenade", self.get_room_state(), (self.player,))
+        return ActionResult(outcome)
+
+    # Führt einen Befehl über seinen Namen aus (für Server und andere Frontends ohne GUI)
+    def execute(self, command, args=()):
+        handler = self.COMMANDS.get(command)
+        if handler is None:
+            return ActionResult(Outcome.UNKNOWN_COMMAND, command)
+        return handler(self, *args)
+
+    # Spielstand als kompakte Bytes (nur Änderungen gegenüber der Welt)
+    def save_state(self):
+        return dump_session(self.game)
+
+    # Spielstand aus Bytes wiederherstellen
+    def restore_state(self, data):
+        self.player = load_session(self.game, data)
+        self.action_cache.clear()  # Raumversionen beginnen nach dem Laden wieder bei 0
+        return self.get_room_status()
+
+    # Spielstand in eine Datei schreiben
+    def save_game(self, path):
+        with open(path, "wb") as file:
+            file.write(self.save_state())
+        return f"💾 Game saved to {path}."
+
+    # Spielstand aus einer Datei laden
+    def load_game(self, path):
+        with open(path, "rb") as file:
+            return self.restore_state(file.read())
 
     # Spiel beenden
     def quit_game(self):
-        return "🛑 Game ended. Thanks for playing!"
+        return ActionResult(Outcome.QUIT)
+
+    # Befehle, die execute über ihren Namen erlaubt
+    COMMANDS = {
+        "status": get_room_state,
+        "actions": get_available_actions,
+        "move": move,
+        "travel": travel,
+        "goto": goto,
+        "interact": interact,
+        "pickup": pickup,
+        "kill": kill,
+        "plant": plant,
+        "drop": drop,
+        "quit": quit_game,
+    }
+
+    # Typ des einzigen Arguments der Befehle mit Argument (alle anderen Befehle erwarten keine Argumente)
+    ARGUMENT_TYPES = {
+        "move": str,
+        "travel": int,
+        "goto": str,
+        "pickup": str,
+        "kill": str,
+    }
+
+    @classmethod
+    def arguments_valid(cls, command, args):
+        """Prüft Anzahl und Typ der Argumente, bevor ein Befehl von außen (Server, Stapel) ausgeführt wird.
+
+        Unbekannte Befehle gelten als gültig, execute antwortet darauf mit UNKNOWN_COMMAND."""
+        if type(command) is not str:
+            return False
+        kind = cls.ARGUMENT_TYPES.get(command)
+        if kind is None:
+            return not args or command not in cls.COMMANDS
+        return len(args) == 1 and type(args[0]) is kind
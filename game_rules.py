@@ -0,0 +1,121 @@
+from action_result import Outcome
+
+# Spielregeln der Befehle an genau einer Stelle: jede Funktion ändert den Sitzungszustand (Game und Player)
+# und gibt nur einen Outcome-Code zurück. GameEngine baut daraus ActionResult mit Raumzustand und Texten,
+# BatchEngine verwendet die Codes direkt.
+
+
+def _die(game):
+    game.kill_player(announce=False)
+    return Outcome.DIED
+
+
+def _win(game):
+    return Outcome.WON
+
+
+# Auslöser aus world.json ("on_enter", "on_travel") -> Wirkung und Ergebniscode
+TRIGGERS = {
+    "die": _die,
+    "win": _win,
+}
+
+
+def apply_move(game, player, target):
+    """Bewegung in den benachbarten Raum target (None = unbekannter Raumname)."""
+    if target is None or target not in game.get_local_exits(player.current_room):
+        return Outcome.NO_CONNECTION
+    if game.requirement_mask(target) & ~player.inventory.mask:
+        return Outcome.BLOCKED
+    player.current_room = target
+    game.update_current_objective(target)
+    if target.enter_trigger:  # z. B. Tod am Front Gate
+        return TRIGGERS[target.enter_trigger](game)
+    return Outcome.MOVED
+
+
+def apply_travel(game, player, destination_index):
+    """Reise durch das Stargate zum Ziel mit diesem Index in game.get_gate_exits."""
+    room = player.current_room
+    gate_exits = game.get_gate_exits(room)
+    if not 0 <= destination_index < len(gate_exits):
+        return Outcome.INVALID_DESTINATION
+    target = gate_exits[destination_index]
+    if game.requirement_mask(target) & ~player.inventory.mask:
+        return Outcome.TRAVEL_BLOCKED
+    trigger = room.travel_triggers.get(target.name) if room.travel_triggers else None
+    if trigger:  # z. B. Sieg Shuttle Bay -> Briefing Room
+        return TRIGGERS[trigger](game)
+    player.current_room = target
+    player.current_planet = game.planet_of_room(target)
+    game.update_current_objective(target)
+    if target.enter_trigger:
+        return TRIGGERS[target.enter_trigger](game)
+    return Outcome.TRAVELED
+
+
+def apply_interact(game, player, lines=None):
+    """Gespräch mit dem NPC im Raum; zieht immer dieselbe Zufallszahl.
+
+    Ist lines eine Liste, werden die Dialogzeilen dort angehängt (ohne lines entsteht kein Text).
+    """
+    npc = game.npc_in(player.current_room)
+    if not npc:
+        return Outcome.NO_ONE_HERE
+    default_dialog = npc.default_lines
+    if default_dialog:
+        line = game.rng.choice(default_dialog)  # zufällige Zeile aus dem Standarddialog
+        if lines is not None:
+            lines.append(f"{npc.name}: {line}")
+    if lines is not None:
+        if npc.hostile:
+            if player.has_weapon():
+                lines.append(f" {npc.name} is hostile. You are armed.")
+            else:
+                lines.append(f" {npc.name} is hostile, and you're unarmed. Be careful.")
+        elif npc.topics:  # alle Themen außer default, beim Laden vorbereitet
+            lines.append(f"🗣️ Topics: {', '.join(npc.topics)} (not interactive in GUI yet)")
+    return Outcome.TALKED
+
+
+def apply_pickup(game, player, item_name):
+    """Nimmt einen Gegenstand aus dem Raum (nur in dieser Sitzung) ins Inventar."""
+    if game.take_item(player.current_room, item_name):
+        player.add_item(item_name)
+        return Outcome.PICKED_UP
+    return Outcome.ITEM_NOT_HERE
+
+
+def apply_kill(game, player, enemy_name):
+    """Tötet den NPC im Raum, wenn der Name passt und der Spieler bewaffnet ist."""
+    npc = game.npc_in(player.current_room)
+    if not npc:
+        return Outcome.NO_ENEMY
+    if npc.firstname.lower() != enemy_name.lower():
+        return Outcome.WRONG_ENEMY
+    if not player.has_weapon():
+        return Outcome.NO_WEAPON
+    game.kill_npc(npc)  # nur in dieser Sitzung tot
+    return Outcome.KILLED
+
+
+def apply_plant(game, player):
+    """Platziert C4 in einem Raum mit der Aktion "plant" und hebt dessen Anforderungen auf."""
+    room = player.current_room
+    if "plant" not in room.special_actions:
+        return Outcome.NOT_IN_REACTOR
+    if "C4" not in player.inventory:
+        return Outcome.NO_C4
+    del player.inventory["C4"]
+    game.clear_requirements(room)  # nur in dieser Sitzung
+    return Outcome.PLANTED
+
+
+def apply_drop(game, player):
+    """Wirft eine Granate in einem Raum mit der Aktion "drop"."""
+    if "drop" not in player.current_room.special_actions:
+        return Outcome.NOT_AT_GENERATOR
+    if "Grenade" not in player.inventory:
+        return Outcome.NO_GRENADE
+    del player.inventory["Grenade"]
+    return Outcome.GRENADE_THROWN
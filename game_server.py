@@ -0,0 +1,261 @@
+import argparse
+import asyncio
+import json
+import os
+import secrets
+import time
+
+from action_result import ActionResult, RoomState
+from batch_engine import BAD_ARGUMENTS, UNKNOWN_SESSION, BatchEngine
+from game_engine import GameEngine
+from journal import Journal, recover
+
+# Protokoll: eine JSON-Nachricht pro Zeile.
+#   Anfrage:  {"id": 1, "cmd": "new", "args": ["Name"]}       (optional ["Name", seed] für reproduzierbare Dialoge)
+#             {"id": 2, "session": "<id>", "cmd": "move", "args": ["Armory"]}
+#   Antwort:  {"id": 2, "ok": true, "session": "<id>", "result": {"outcome": "MOVED", ...}, "actions": [...]}
+#             {"id": 2, "ok": false, "error": "..."}
+# Mit "text": true in der Anfrage enthält die Antwort zusätzlich den fertigen Text unter "text".
+# "new" legt eine Sitzung an (Ergebnis: Raumzustand wie bei "status"), "close" beendet sie;
+# alle anderen Befehle gehen an GameEngine.execute.
+# "batch" führt Befehle vieler Sitzungen in einer Anfrage aus und antwortet nur mit Ergebniscodes:
+#             {"id": 3, "cmd": "batch", "args": [["<id>", "move", ["Armory"]], ["<id2>", "travel", [0]]]}
+#             {"id": 3, "ok": true, "codes": [1, 5]}      (Outcome-Werte, siehe batch_engine für Sondercodes)
+# Mit einem Journal werden alle Befehle mitgeschrieben und die Sitzungen beim nächsten Start wiederhergestellt.
+
+
+#################################################################
+# Eine Spielsitzung auf dem Server
+class Session:
+    __slots__ = ("session_id", "engine", "last_used")
+
+    def __init__(self, session_id, engine):
+        self.session_id = session_id
+        self.engine = engine
+        self.last_used = time.monotonic()
+
+
+#################################################################
+# Asynchroner Server, der viele GameEngine-Sitzungen in einem Prozess hält
+class GameServer:
+    def __init__(self, max_sessions=10000, idle_timeout=300.0, max_line=64 * 1024, journal_path=None):
+        self.sessions = {}  # Sitzungs-ID -> Session
+        self.max_sessions = max_sessions  # mehr Sitzungen werden abgelehnt
+        self.idle_timeout = idle_timeout  # Sekunden ohne Befehl, bis eine Sitzung verworfen wird
+        self.max_line = max_line  # maximale Länge einer Anfragezeile
+        self.journal_path = journal_path  # None = Sitzungen überleben keinen Neustart
+        self.journal = None
+        self.server = None
+        self._evict_task = None
+        self._sync_task = None
+        self.batch_engine = BatchEngine()
+
+    async def start(self, host="127.0.0.1", port=8765, unix_path=None):
+        """Startet den Server auf einem lokalen TCP-Port oder einem Unix-Socket."""
+        if self.journal_path:
+            self.recover_sessions()
+            self._sync_task = asyncio.create_task(self._sync_journal())
+        if unix_path:
+            self.server = await asyncio.start_unix_server(self.handle_client, unix_path, limit=self.max_line)
+        else:
+            self.server = await asyncio.start_server(self.handle_client, host, port, limit=self.max_line)
+        self._evict_task = asyncio.create_task(self._evict_idle_sessions())
+        return self.server
+
+    async def close(self):
+        """Beendet den Server und die Aufräumaufgaben."""
+        if self._evict_task:
+            self._evict_task.cancel()
+        if self._sync_task:
+            self._sync_task.cancel()
+        if self.server:
+            self.server.close()
+            await self.server.wait_closed()
+        if self.journal:
+            self.journal.close()
+
+    def recover_sessions(self):
+        """Stellt die Sitzungen aus dem Journal wieder her und verdichtet es auf einen Snapshot pro Sitzung.
+
+        Ist das Journal mitten in der Datei beschädigt, wird es vorher zur Untersuchung umbenannt
+        (<journal>.damaged-<Zeit>) statt überschrieben.
+        """
+        engines, clean = recover(self.journal_path, GameEngine)
+        if not clean:
+            damaged_path = f"{self.journal_path}.damaged-{time.strftime('%Y%m%d-%H%M%S')}"
+            os.replace(self.journal_path, damaged_path)
+            print(f"Journal {self.journal_path} is damaged; kept as {damaged_path}")
+        for session_id, engine in engines.items():
+            self.sessions[session_id] = Session(session_id, engine)
+        self.journal = Journal(self.journal_path)
+        self.journal.compact(engines)
+        return len(engines)
+
+    async def handle_client(self, reader, writer):
+        """Bearbeitet die Anfragen einer Verbindung nacheinander.
+
+        Die nächste Zeile wird erst gelesen, wenn die Antwort auf die vorherige abgeschickt werden konnte
+        (writer.drain); ein langsamer Client bremst so nur sich selbst und füllt keine Puffer im Server.
+        """
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:  # Zeile länger als max_line
+                    writer.write(self._encode({"ok": False, "error": "request too long"}))
+                    break
+                if not line:
+                    break
+                writer.write(self._encode(self.handle_request(line)))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    def handle_request(self, line):
+        """Verarbeitet eine Anfragezeile und gibt das Antwort-Dictionary zurück."""
+        try:
+            request = json.loads(line)
+            command = request["cmd"]
+            args = request.get("args", [])
+        except (ValueError, KeyError, TypeError):
+            return {"ok": False, "error": "invalid request"}
+
+        if command == "batch":
+            return self.handle_batch(request, args)
+        response = {"id": request.get("id")}
+        if not isinstance(args, list):
+            response.update(ok=False, error="bad arguments: args must be a list")
+            return response
+        if command == "new":
+            if len(self.sessions) >= self.max_sessions:
+                response.update(ok=False, error="server full")
+                return response
+            try:
+                seed = int(args[1]) if len(args) > 1 else None
+            except (TypeError, ValueError):
+                response.update(ok=False, error="bad arguments: seed must be an integer")
+                return response
+            session = Session(secrets.token_hex(8), GameEngine(seed=seed))
+            session.engine.initialize_game(str(args[0]) if args else "Player")
+            self.sessions[session.session_id] = session  # erst nach erfolgreicher Initialisierung registrieren
+            result = session.engine.get_room_state()  # gleiche Form wie bei allen anderen Befehlen
+            if self.journal:
+                self.journal.snapshot(session.session_id, session.engine)
+        else:
+            session_id = request.get("session")
+            session = self.sessions.get(session_id) if isinstance(session_id, str) else None
+            if session is None:
+                response.update(ok=False, error="unknown session")
+                return response
+            session.last_used = time.monotonic()
+            if command == "close":
+                del self.sessions[session.session_id]
+                result = session.engine.quit_game()
+                if self.journal:
+                    self.journal.close_session(session.session_id)
+            else:
+                if not session.engine.arguments_valid(command, args):  # z. B. Zahl statt Raumname
+                    response.update(ok=False, error=f"bad arguments for {command}")
+                    return response
+                result = session.engine.execute(command, args)
+                if self.journal:
+                    self.journal.record(session.session_id, session.engine, command, args)
+
+        response.update(ok=True, session=session.session_id, actions=session.engine.get_available_actions())
+        if isinstance(result, (ActionResult, RoomState)):
+            response["result"] = result.to_payload()  # kompakt: Ergebniscode bzw. Raumzustand statt Fließtext
+            if request.get("text"):
+                response["text"] = result.render()
+        else:
+            response["result"] = result
+        return response
+
+    def handle_batch(self, request, entries):
+        """Führt [Sitzung, Befehl, Argumente]-Einträge vieler Sitzungen in einem Durchlauf aus (z. B. für Bot-Flotten).
+
+        Die Antwort enthält nur einen Ergebniscode pro Eintrag, keine Aktionen und keinen Text.
+        """
+        if not isinstance(entries, list):
+            return {"id": request.get("id"), "ok": False, "error": "invalid request"}
+        codes = [UNKNOWN_SESSION] * len(entries)
+        batch = []
+        positions = []  # Position im Stapel -> Index des Eintrags
+        session_ids = []
+        now = time.monotonic()
+        for index, entry in enumerate(entries):
+            if not isinstance(entry, list) or not 2 <= len(entry) <= 3:
+                codes[index] = BAD_ARGUMENTS
+                continue
+            args = entry[2] if len(entry) == 3 else []
+            if not isinstance(args, list) or entry[1] in ("new", "close", "batch"):
+                codes[index] = BAD_ARGUMENTS
+                continue
+            session = self.sessions.get(entry[0]) if isinstance(entry[0], str) else None
+            if session is None:
+                continue
+            session.last_used = now
+            batch.append((session.engine, entry[1], args))
+            positions.append(index)
+            session_ids.append(session.session_id)
+
+        def record(position, code):
+            if code != BAD_ARGUMENTS:
+                engine, command, args = batch[position]
+                self.journal.record(session_ids[position], engine, command, args)
+
+        for position, code in enumerate(self.batch_engine.step(batch, record if self.journal else None)):
+            codes[positions[position]] = code
+        return {"id": request.get("id"), "ok": True, "codes": codes}
+
+    def _encode(self, response):
+        return json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n"
+
+    async def _evict_idle_sessions(self):
+        """Verwirft regelmäßig Sitzungen, die länger als idle_timeout nicht benutzt wurden."""
+        interval = max(1.0, self.idle_timeout / 4)
+        while True:
+            await asyncio.sleep(interval)
+            deadline = time.monotonic() - self.idle_timeout
+            for session_id in [sid for sid, session in self.sessions.items() if session.last_used < deadline]:
+                del self.sessions[session_id]
+                if self.journal:
+                    self.journal.close_session(session_id)
+
+    async def _sync_journal(self):
+        """Schreibt gepufferte Journaleinträge spätestens nach sync_interval auf die Platte
+        und verdichtet das Journal, sobald es deutlich größer ist als ein Snapshot pro Sitzung."""
+        while True:
+            await asyncio.sleep(self.journal.sync_interval)
+            self.journal.maybe_sync()
+            if self.journal.needs_compaction():
+                self.journal.compact({session_id: session.engine for session_id, session in self.sessions.items()})
+
+
+async def serve(host, port, unix_path, max_sessions, idle_timeout, journal_path=None):
+    server = GameServer(max_sessions=max_sessions, idle_timeout=idle_timeout, journal_path=journal_path)
+    await server.start(host, port, unix_path)
+    if journal_path:
+        print(f"Recovered {len(server.sessions)} sessions from {journal_path}")
+    print(f"Stargate server listening on {unix_path or f'{host}:{port}'}")
+    try:
+        await server.server.serve_forever()
+    finally:
+        await server.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Headless Stargate Adventure server (JSON lines).")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", dest="unix_path", help="Unix-Socket statt TCP verwenden")
+    parser.add_argument("--max-sessions", type=int, default=10000)
+    parser.add_argument("--idle-timeout", type=float, default=300.0)
+    parser.add_argument("--journal", dest="journal_path", help="command journal file; sessions survive restarts")
+    options = parser.parse_args()
+    try:
+        asyncio.run(serve(options.host, options.port, options.unix_path, options.max_sessions, options.idle_timeout,
+                          options.journal_path))
+    except KeyboardInterrupt:
+        pass
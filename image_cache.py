@@ -0,0 +1,179 @@
+import os
+import queue
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import customtkinter as ctk
+from PIL import Image
+
+
+def decode_image(path, size):
+    """Liest eine Bilddatei und skaliert sie auf die Zielgröße (ohne Tk, darf in einem Thread laufen).
+
+    Gibt None zurück, wenn die Datei fehlt.
+    """
+    if not os.path.exists(path):
+        return None
+    with Image.open(path) as img:
+        if img.size == size:  # schon mit build_assets.py auf Anzeigegröße gebracht
+            return img.copy()
+        return img.resize(size)  # einziges Skalieren: direkt auf die Anzeigegröße
+
+
+#################################################################
+# LRU-Cache für fertig dekodierte und auf Anzeigegröße skalierte Bilder
+class ImageCache:
+    def __init__(self, max_bytes=64 * 1024 * 1024, max_entries=256):
+        self.max_bytes = max_bytes  # Obergrenze für den geschätzten Speicher aller Bilder
+        self.max_entries = max_entries  # Obergrenze für die Anzahl der Bilder
+        self.entries = OrderedDict()  # (Pfad, Größe) -> (CTkImage, Bytes), älteste zuerst
+        self.missing = set()  # Pfade, die es nicht gibt (keine erneute Prüfung auf der Platte)
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()  # schützt Einträge und Zähler (Prefetch-Threads fragen mit contains ab)
+
+    def contains(self, path, size):
+        """Prüft, ob das Bild schon im Cache liegt oder als fehlend bekannt ist (ohne Zähler zu ändern)."""
+        with self.lock:
+            return (path, size) in self.entries or path in self.missing
+
+    def get(self, path, size):
+        """Gibt ein CTkImage in genau dieser Größe zurück oder None, wenn die Datei fehlt.
+
+        Das Bild wird nur beim ersten Zugriff gelesen und einmal auf die Zielgröße skaliert;
+        danach kostet ein erneuter Besuch weder Plattenzugriff noch Dekodieren.
+        """
+        key = (path, size)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            if path in self.missing:
+                self.hits += 1
+                return None
+            self.misses += 1
+        return self.put(path, size, decode_image(path, size))
+
+    def put(self, path, size, img):
+        """Legt ein bereits dekodiertes PIL-Bild ab und gibt das zugehörige CTkImage zurück."""
+        key = (path, size)
+        with self.lock:
+            if img is None:
+                self.missing.add(path)
+                return None
+            entry = self.entries.get(key)
+            if entry is not None:  # schon von anderer Stelle geladen
+                self.entries.move_to_end(key)
+                return entry[0]
+            ctk_image = ctk.CTkImage(light_image=img, dark_image=img, size=size)
+            nbytes = img.width * img.height * len(img.getbands())
+            self.entries[key] = (ctk_image, nbytes)
+            self.total_bytes += nbytes
+            self._evict()
+            return ctk_image
+
+    def _evict(self):
+        """Verwirft die am längsten nicht benutzten Bilder, bis die Grenzen eingehalten werden."""
+        while self.entries and (self.total_bytes > self.max_bytes or len(self.entries) > self.max_entries):
+            if len(self.entries) == 1:  # das gerade geladene Bild immer behalten
+                break
+            _, (_, nbytes) = self.entries.popitem(last=False)
+            self.total_bytes -= nbytes
+            self.evictions += 1
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.missing.clear()
+            self.total_bytes = 0
+
+    def stats(self):
+        """Zähler für Treffer, Fehlzugriffe und Speicherverbrauch."""
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self.entries),
+                "bytes": self.total_bytes,
+            }
+
+
+#################################################################
+# Dekodiert die Bilder der Nachbarräume im Hintergrund, bevor der Spieler dorthin klickt
+class ImagePrefetcher:
+    def __init__(self, cache, widget, workers=2, poll_ms=30):
+        self.cache = cache
+        self.widget = widget  # Tk-Widget, über dessen after() Ergebnisse im Tk-Thread ankommen
+        self.poll_ms = poll_ms
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="image-prefetch")
+        self.results = queue.Queue()  # (Pfad, Größe, PIL-Bild) aus den Threads
+        self.pending = {}  # (Pfad, Größe) -> Future der laufenden Aufträge
+        self.generation = 0  # wird bei jedem neuen Prefetch erhöht; ältere Aufträge gelten als abgebrochen
+        self.polling = False
+
+    def prefetch(self, requests):
+        """Bricht alte Aufträge ab und dekodiert die angegebenen (Pfad, Größe)-Paare im Hintergrund."""
+        self.cancel()
+        generation = self.generation
+        for path, size in requests:
+            key = (path, size)
+            if not path or key in self.pending or self.cache.contains(path, size):
+                continue
+            self.pending[key] = self.executor.submit(self._decode, generation, path, size)
+        if self.pending and not self.polling:
+            self.polling = True
+            self.widget.after(self.poll_ms, self._poll)
+
+    def cancel(self):
+        """Bricht noch nicht gestartete Aufträge ab (z. B. wenn der Spieler weitergezogen ist)."""
+        self.generation += 1
+        for key, future in list(self.pending.items()):
+            if future.cancel():
+                del self.pending[key]
+
+    def get(self, path, size):
+        """Wie ImageCache.get, wartet aber auf ein bereits laufendes Dekodieren, statt es zu wiederholen."""
+        future = self.pending.pop((path, size), None)
+        if future is not None and not future.cancelled():
+            img = future.result()
+            if img is not None or not os.path.exists(path):
+                return self.cache.put(path, size, img)
+        return self.cache.get(path, size)
+
+    def shutdown(self):
+        self.cancel()
+        self.executor.shutdown(wait=False)
+
+    def _decode(self, generation, path, size):
+        """Läuft im Thread-Pool; übergibt das Ergebnis über die Queue an den Tk-Thread."""
+        if generation != self.generation:  # inzwischen überholt
+            self.results.put((path, size, None))
+            return None
+        try:
+            img = decode_image(path, size)
+        except OSError:  # defekte Datei: beim Anzeigen erneut versuchen und Fehler dort melden
+            img = None
+        self.results.put((path, size, img))
+        return img
+
+    def _poll(self):
+        """Läuft im Tk-Thread (über after) und übernimmt fertige Bilder in den Cache."""
+        while True:
+            try:
+                path, size, img = self.results.get_nowait()
+            except queue.Empty:
+                break
+            if img is not None:  # auch Bilder älterer Generationen sind fertig und dürfen in den Cache
+                self.cache.put(path, size, img)
+        for key in [key for key, future in self.pending.items() if future.done()]:
+            del self.pending[key]
+        if self.pending:
+            self.widget.after(self.poll_ms, self._poll)
+        else:
+            self.polling = False
@@ -0,0 +1,4 @@
+# Anzeigegrößen der Bilder (werden genau einmal auf diese Größe skaliert)
+# Eigenes Modul ohne GUI-Abhängigkeiten, damit build_assets.py auch ohne Tk/Display läuft.
+ROOM_IMAGE_SIZE = (600, 300)
+MINIMAP_SIZE = (300, 200)
@@ -0,0 +1,184 @@
+import json
+import os
+import struct
+import time
+import zlib
+
+# Aufbau der Journaldatei (nur anhängen):
+#   je Eintrag  Kopf (Länge der Nutzdaten, CRC32 der Nutzdaten, Typ) und Nutzdaten
+#   Nutzdaten   Sitzungs-ID, NUL, Inhalt
+# Typen:
+#   SNAPSHOT  Inhalt ist ein Spielstand aus GameEngine.save_state (ersetzt alles davor)
+#   COMMAND   Inhalt ist JSON [Befehl, Argumente], wird bei der Wiederherstellung erneut ausgeführt
+#   CLOSE     Sitzung beendet, Inhalt leer
+# Ein abgeschnittener oder beschädigter letzter Eintrag (Absturz beim Schreiben) wird beim Lesen ignoriert;
+# ein beschädigter Eintrag mitten in der Datei beendet das Lesen ebenfalls (siehe read_records).
+RECORD_HEADER = struct.Struct("<IIB")
+SNAPSHOT = 1
+COMMAND = 2
+CLOSE = 3
+
+READ_ONLY_COMMANDS = frozenset({"status", "actions"})  # ändern nichts, werden nicht aufgezeichnet
+
+
+def _encode(kind, session_id, body):
+    payload = session_id.encode("utf-8") + b"\0" + body
+    return RECORD_HEADER.pack(len(payload), zlib.crc32(payload), kind) + payload
+
+
+def read_records(path, status=None):
+    """Liest die Datei als Datenstrom und liefert alle vollständigen Einträge als (Typ, Sitzungs-ID, Inhalt).
+
+    Gelesen wird bis zum ersten beschädigten Eintrag. Ist status ein Dictionary, steht danach unter "clean",
+    ob dieser Eintrag nur das abgeschnittene Ende war (True) oder mitten in der Datei liegt (False);
+    im zweiten Fall fehlen alle Einträge dahinter.
+    """
+    if status is not None:
+        status["clean"] = True
+    with open(path, "rb") as file:
+        while True:
+            header = file.read(RECORD_HEADER.size)
+            if len(header) < RECORD_HEADER.size:
+                return  # Dateiende oder abgeschnittener Kopf
+            length, crc, kind = RECORD_HEADER.unpack(header)
+            payload = file.read(length)
+            if len(payload) < length:
+                return  # abgeschnittenes Ende
+            if zlib.crc32(payload) != crc:
+                if status is not None and file.read(1):
+                    status["clean"] = False  # Daten hinter dem beschädigten Eintrag gehen verloren
+                return
+            session_id, _, body = payload.partition(b"\0")
+            yield kind, session_id.decode("utf-8"), body
+
+
+#################################################################
+# Journal aller Befehle der Sitzungen eines Servers
+class Journal:
+    def __init__(self, path, sync_every=64, sync_interval=0.05, snapshot_every=500, compact_factor=4,
+                 compact_min_size=1 << 20):
+        self.path = path
+        self.sync_every = sync_every  # spätestens nach so vielen Einträgen fsync
+        self.sync_interval = sync_interval  # oder nach so vielen Sekunden (bei der nächsten Aktion oder maybe_sync)
+        self.snapshot_every = snapshot_every  # nach so vielen Befehlen einer Sitzung einen Snapshot schreiben
+        self.compact_factor = compact_factor  # verdichten, wenn die Datei so viel größer ist als die Snapshots
+        self.compact_min_size = compact_min_size  # kleinere Dateien nie verdichten
+        self.file = open(path, "ab")
+        self.size = os.path.getsize(path)  # aktuelle Dateigröße in Bytes
+        self.snapshot_sizes = {}  # Sitzungs-ID -> Größe des letzten Snapshots
+        self.live_size = 0  # Summe von snapshot_sizes: Größe des Journals direkt nach compact
+        self.unsynced = 0  # Einträge seit dem letzten fsync
+        self.last_sync = time.monotonic()
+        self.commands_since_snapshot = {}  # Sitzungs-ID -> Anzahl Befehle seit dem letzten Snapshot
+        self.records_written = 0
+        self.syncs = 0
+
+    def snapshot(self, session_id, engine):
+        """Schreibt den vollständigen Spielstand einer Sitzung; ältere Einträge der Sitzung werden überflüssig."""
+        record = _encode(SNAPSHOT, session_id, engine.save_state())
+        self._append(record)
+        self.live_size += len(record) - self.snapshot_sizes.get(session_id, 0)
+        self.snapshot_sizes[session_id] = len(record)
+        self.commands_since_snapshot[session_id] = 0
+
+    def record(self, session_id, engine, command, args):
+        """Hält einen ausgeführten Befehl fest und schreibt bei Bedarf einen neuen Snapshot."""
+        if command in READ_ONLY_COMMANDS or command not in engine.COMMANDS:
+            return
+        count = self.commands_since_snapshot.get(session_id, 0) + 1
+        if count >= self.snapshot_every:
+            self.snapshot(session_id, engine)  # Snapshot nach dem Befehl ersetzt den Befehl selbst
+            return
+        self.commands_since_snapshot[session_id] = count
+        body = json.dumps([command, list(args)], ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        self._append(_encode(COMMAND, session_id, body))
+
+    def close_session(self, session_id):
+        self.commands_since_snapshot.pop(session_id, None)
+        self.live_size -= self.snapshot_sizes.pop(session_id, 0)
+        self._append(_encode(CLOSE, session_id, b""))
+
+    def _append(self, record):
+        self.file.write(record)
+        self.size += len(record)
+        self.records_written += 1
+        self.unsynced += 1
+        if self.unsynced >= self.sync_every or time.monotonic() - self.last_sync >= self.sync_interval:
+            self.sync()
+
+    def maybe_sync(self):
+        """Für einen Timer: schreibt offene Einträge, sobald sync_interval abgelaufen ist."""
+        if self.unsynced and time.monotonic() - self.last_sync >= self.sync_interval:
+            self.sync()
+
+    def sync(self):
+        """Schreibt alle gepufferten Einträge mit einem einzigen fsync auf die Platte."""
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.unsynced = 0
+        self.last_sync = time.monotonic()
+        self.syncs += 1
+
+    def needs_compaction(self):
+        """True, wenn die Datei compact_factor-mal größer ist als ein Snapshot pro offener Sitzung."""
+        return self.size >= self.compact_min_size and self.size > self.compact_factor * self.live_size
+
+    def close(self):
+        if not self.file.closed:
+            self.sync()
+            self.file.close()
+
+    def compact(self, engines):
+        """Ersetzt das Journal durch je einen Snapshot pro offener Sitzung (atomar über eine temporäre Datei)."""
+        self.close()
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        self.snapshot_sizes = {}
+        with open(temp_path, "wb") as file:
+            for session_id, engine in engines.items():
+                record = _encode(SNAPSHOT, session_id, engine.save_state())
+                file.write(record)
+                self.snapshot_sizes[session_id] = len(record)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, self.path)
+        self.file = open(self.path, "ab")
+        self.live_size = self.size = sum(self.snapshot_sizes.values())
+        self.unsynced = 0
+        self.commands_since_snapshot = dict.fromkeys(engines, 0)
+
+
+def recover(path, engine_factory):
+    """Stellt alle offenen Sitzungen aus einem Journal wieder her.
+
+    Pro Sitzung wird nur der letzte Snapshot geladen und danach nur der Rest der Befehle erneut ausgeführt.
+    Gibt (Dictionary Sitzungs-ID -> Engine, clean) zurück; clean ist False, wenn das Journal mitten in der
+    Datei beschädigt ist und Einträge dahinter fehlen (siehe read_records).
+    """
+    if not os.path.exists(path):
+        return {}, True
+    status = {}
+    snapshots = {}  # Sitzungs-ID -> letzter Snapshot
+    tails = {}  # Sitzungs-ID -> Befehle nach dem letzten Snapshot (noch als Bytes)
+    for kind, session_id, body in read_records(path, status):
+        if kind == SNAPSHOT:
+            snapshots[session_id] = body
+            tails[session_id] = []
+        elif kind == COMMAND:
+            if session_id in tails:
+                tails[session_id].append(body)
+        elif kind == CLOSE:
+            snapshots.pop(session_id, None)
+            tails.pop(session_id, None)
+
+    engines = {}
+    for session_id, snapshot in snapshots.items():
+        engine = engine_factory()
+        engine.restore_state(snapshot)
+        for body in tails[session_id]:
+            command, args = json.loads(body)
+            try:
+                engine.execute(command, args)
+            except (TypeError, ValueError, AttributeError):  # lief schon beim ersten Mal nicht
+                pass
+        engines[session_id] = engine
+    return engines, status["clean"]
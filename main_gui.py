@@ -1,8 +1,11 @@
 import os
+import time
+STARTUP_START = time.perf_counter()     # Bezugspunkt für die Startzeit-Messung (vor den großen Imports)
+import threading
+from collections import deque
 import customtkinter as ctk
-from PIL import Image
-from game_engine import GameEngine 
-import random
+from image_cache import ImageCache, ImagePrefetcher
+from image_sizes import MINIMAP_SIZE, ROOM_IMAGE_SIZE
 
 
 # Name small window
@@ -41,15 +44,143 @@ class ConfirmDialog(ctk.CTkToplevel):
 
 
 
+# Speichergrenze des Bild-Caches in MB, einstellbar mit STARGATE_IMAGE_CACHE_MB
+IMAGE_CACHE_MB = int(os.environ.get("STARGATE_IMAGE_CACHE_MB", "64"))
+
+# Story-Log: maximale Zeilenzahl im Textfeld und optionale Datei für den vollständigen Verlauf
+LOG_MAX_LINES = int(os.environ.get("STARGATE_LOG_LINES", "2000"))
+LOG_FILE = os.environ.get("STARGATE_LOG_FILE")
+
+# Zeitmessung pro Klick (Aktion + Neuaufbau der Oberfläche) und der Startphasen, aktivieren mit STARGATE_UI_TIMING=1
+UI_TIMING = bool(os.environ.get("STARGATE_UI_TIMING"))
+
+
+# Button-Leiste, die ihre Buttons wiederverwendet statt sie nach jedem Klick zu zerstören und neu zu bauen
+class ButtonBar:
+    def __init__(self, frame, padx=5):
+        self.frame = frame
+        self.padx = padx
+        self.buttons = []       # alle bisher erzeugten Buttons (Pool)
+        self.labels = []        # aktuelle Beschriftung je Button
+        self.commands = []      # aktuelle Funktion je sichtbarem Button
+        self.visible = 0        # Anzahl der gerade angezeigten Buttons
+        self.frame_times = []   # gemessene Zeiten pro Klick in ms (nur mit UI_TIMING)
+
+    def show(self, entries):
+        """Zeigt genau diese (Text, Funktion)-Paare an; vorhandene Buttons werden nur umbeschriftet."""
+        self.commands = [command for _, command in entries]
+        for index, (text, _) in enumerate(entries):
+            if index < len(self.buttons):
+                button = self.buttons[index]
+                if self.labels[index] != text:      # nur konfigurieren, wenn sich der Text geändert hat
+                    button.configure(text=text)
+                    self.labels[index] = text
+            else:
+                button = ctk.CTkButton(self.frame, text=text, command=lambda i=index: self._click(i))
+                self.buttons.append(button)
+                self.labels.append(text)
+            if index >= self.visible:               # versteckte oder neue Buttons hinten anfügen
+                button.pack(side="left", padx=self.padx)
+        for button in self.buttons[len(entries):self.visible]:  # überzählige Buttons nur verstecken
+            button.pack_forget()
+        self.visible = len(entries)
+
+    def clear(self):
+        self.show([])
+
+    def _click(self, index):
+        if index >= len(self.commands):
+            return
+        if not UI_TIMING:
+            self.commands[index]()
+            return
+        start = time.perf_counter()
+        self.commands[index]()
+        self.frame.update_idletasks()               # Layout und Zeichnen mitmessen
+        elapsed = (time.perf_counter() - start) * 1000
+        self.frame_times.append(elapsed)
+        print(f"UI frame: {elapsed:.1f} ms (avg {sum(self.frame_times) / len(self.frame_times):.1f} ms)")
+
+
+
+
+# Begrenztes Story-Log: sammelt Nachrichten eines Event-Loop-Durchlaufs und schreibt sie in einem Schritt ins Textfeld
+class StoryLog:
+    def __init__(self, textbox, max_lines=2000, trim_batch=200, spill_path=None):
+        self.textbox = textbox
+        self.max_lines = max_lines      # so viele Zeilen bleiben mindestens sichtbar
+        self.trim_batch = trim_batch    # erst kürzen, wenn so viele Zeilen zu viel sind (ein delete statt vieler)
+        self.messages = deque()         # Ringpuffer: Zeilenanzahl jeder Nachricht im Textfeld, älteste zuerst
+        self.line_count = 0             # Zeilen im Textfeld
+        self.pending = []               # Nachrichten, die beim nächsten flush eingefügt werden
+        self.scheduled = False
+        self.spill = open(spill_path, "a", encoding="utf-8") if spill_path else None   # vollständiger Verlauf
+
+    def append(self, message):
+        """Merkt sich eine Nachricht; das Textfeld wird erst im nächsten Leerlauf der Event-Loop aktualisiert."""
+        text = f"{message}\n"            # Aktionsergebnisse werden erst hier in Text umgewandelt
+        self.pending.append(text)
+        if self.spill:
+            self.spill.write(text)
+        if not self.scheduled:
+            self.scheduled = True
+            self.textbox.after_idle(self.flush)
+
+    def flush(self):
+        """Fügt alle gesammelten Nachrichten auf einmal ein, kürzt alte Zeilen und scrollt einmal ans Ende."""
+        self.scheduled = False
+        if not self.pending or not self.textbox.winfo_exists():
+            return
+        texts = self.pending
+        self.pending = []
+        for text in texts:
+            lines = text.count("\n")
+            self.messages.append(lines)
+            self.line_count += lines
+
+        trim = 0
+        if self.line_count > self.max_lines + self.trim_batch:
+            while self.line_count > self.max_lines and len(self.messages) > 1:     # nur ganze Nachrichten entfernen
+                lines = self.messages.popleft()
+                trim += lines
+                self.line_count -= lines
+
+        self.textbox.configure(state="normal")
+        self.textbox.insert("end", "".join(texts))
+        if trim:
+            self.textbox.delete("1.0", f"{trim + 1}.0")
+        self.textbox.configure(state="disabled")
+        self.textbox.yview("end")
+        if self.spill:
+            self.spill.flush()
+
+    def close(self):
+        self.flush()
+        if self.spill:
+            self.spill.close()
+            self.spill = None
+
+
+
+
 # Main GUI class
 class MainApp(ctk.CTk):
     def __init__(self):
+        self.startup_phases = [("imports", time.perf_counter())]   # (Phase, Zeitpunkt) für den Startbericht
         super().__init__()
         self.title("Stargate Adventure (CustomTkinter)")
         self.geometry("800x600")
         
-        self.engine = GameEngine()
+        # Die Welt wird im Hintergrund geladen, während der Spieler seinen Namen eingibt
+        self.engine = None
+        self.engine_error = None
+        self.engine_loaded_at = None
+        self.engine_thread = threading.Thread(target=self.load_engine, name="world-loader", daemon=True)
+        self.engine_thread.start()
         self.current_ctk_image = None
+        self.planet_ctk_image = None
+        self.images = ImageCache(max_bytes=IMAGE_CACHE_MB * 1024 * 1024)  # dekodierte Raum- und Planetenbilder
+        self.prefetcher = ImagePrefetcher(self.images, self)  # dekodiert Bilder der Nachbarräume im Hintergrund
 
         # 'bg_image = Image.open("img/background.jpeg")
         # bg_image = bg_image.resize((800, 600))
@@ -70,6 +201,7 @@ class MainApp(ctk.CTk):
         #Textbox for story
         self.textbox = ctk.CTkTextbox(self.middle_frame, width=500, text_color="white")
         self.textbox.pack(side="left", fill="both", expand=True, padx=(10, 5), pady=5)
+        self.story = StoryLog(self.textbox, max_lines=LOG_MAX_LINES, spill_path=LOG_FILE)
 
         #Minimap for planet
         self.minimap = ctk.CTkLabel(self.middle_frame, text="Mini-Map", width=200, anchor="center")
@@ -83,86 +215,129 @@ class MainApp(ctk.CTk):
         self.sub_button_frame = ctk.CTkFrame(self)
         self.sub_button_frame.pack(side="top", fill="x", pady=5)
 
+        #Wiederverwendbare Button-Leisten für Aktionen und Auswahlmöglichkeiten
+        self.action_bar = ButtonBar(self.action_frame)
+        self.sub_bar = ButtonBar(self.sub_button_frame)
+
 
         
+        self.startup_phases.append(("window", time.perf_counter()))
+
         # Ask for player name 
         self.after(100, self.ask_player_name)
 
 
 
+    def load_engine(self):      # läuft im Hintergrund-Thread
+        start = time.perf_counter()
+        try:
+            from game_engine import GameEngine      # erst hier importieren: lädt beide JSON-Dateien bzw. den Welt-Cache
+            self.engine = GameEngine()
+        except Exception as error:                 # Fehler im Tk-Thread anzeigen statt den Thread still sterben zu lassen
+            self.engine_error = error
+        self.engine_loaded_at = (start, time.perf_counter())
+
+
 
     def ask_player_name(self):      # calls input mini GUI
         dialog = ctk.CTkInputDialog(text="Enter your name:", title="Player Name")
         player_name = dialog.get_input()
         if not player_name or player_name.strip() == "":
             player_name = "Player"
+        self.startup_phases.append(("name entered", time.perf_counter()))
         self.start_game(player_name)
 
 
 
     def start_game(self, player_name):      #starts the game
+        if self.engine_thread.is_alive():       # Welt noch nicht fertig: später erneut versuchen, Fenster bleibt bedienbar
+            self.after(20, lambda: self.start_game(player_name))
+            return
+        if self.engine_error is not None:
+            self.update_text(f"Error loading the world: {self.engine_error}")
+            return
         status = self.engine.initialize_game(player_name)
         self.update_text(status)
         self.update_room_image()
         self.update_planet_image()
         self.update_actions()
+        if UI_TIMING:
+            self.update_idletasks()
+            self.startup_phases.append(("first interaction", time.perf_counter()))
+            self.report_startup()
+
+
 
+    def report_startup(self):       # gibt die Dauer der einzelnen Startphasen aus
+        previous = STARTUP_START
+        for phase, moment in self.startup_phases:
+            print(f"startup {phase:18} +{(moment - previous) * 1000:8.1f} ms  (t={(moment - STARTUP_START) * 1000:8.1f} ms)")
+            previous = moment
+        start, end = self.engine_loaded_at
+        print(f"startup {'world (background)':18} {(end - start) * 1000:9.1f} ms  "
+              f"(ready at t={(end - STARTUP_START) * 1000:8.1f} ms)")
 
 
-    def update_text(self, message):     #updates the text box with the message
+
+    def update_text(self, message):     #updates the text box with the message (gesammelt, siehe StoryLog)
         if not self.textbox.winfo_exists():
             return
-        try:
-            self.textbox.configure(state="normal")
-            self.textbox.insert("end", message + "\n")
-            self.textbox.configure(state="disabled")
-            self.textbox.yview("end")
-        except Exception:
-            print("Error updating text:", Exception)
+        self.story.append(message)
 
 
 
     def update_room_image(self):    #updates the room image
         room = self.engine.player.current_room
-        if room.picture and os.path.exists(room.picture):
-            img = Image.open(room.picture)
-            img = img.resize((600, 300))
-            self.current_ctk_image = ctk.CTkImage(light_image=img, dark_image=img, size=(600, 300))
-            self.image_label.configure(image=self.current_ctk_image, text="")
+        image = self.prefetcher.get(room.picture, ROOM_IMAGE_SIZE) if room.picture else None
+        if image is not None:
+            if image is not self.current_ctk_image:     # gleiches Bild: Label nicht neu konfigurieren
+                self.current_ctk_image = image
+                self.image_label.configure(image=image, text="")
         else:
+            self.current_ctk_image = None
             if room.picture:
                 self.image_label.configure(text=f"Image not found: {room.picture}", image=None)
             else:
                 self.image_label.configure(text="No image", image=None)
+        self.prefetch_neighbour_images(room)
+
+
+
+    def prefetch_neighbour_images(self, room):
+        """Startet das Dekodieren der Bilder aller direkt erreichbaren Räume; alte Aufträge werden abgebrochen."""
+        game = self.engine.game
+        requests = [(target.picture, ROOM_IMAGE_SIZE) for target in game.get_local_exits(room) if target.picture]
+        for target in game.get_gate_exits(room):        # nach einer Gate-Reise wechselt auch die Minimap
+            if target.picture:
+                requests.append((target.picture, ROOM_IMAGE_SIZE))
+            if target.planet.picture:
+                requests.append((target.planet.picture, MINIMAP_SIZE))
+        self.prefetcher.prefetch(requests)
 
 
 
     def update_planet_image(self):
         planet = self.engine.player.current_planet
-        if planet.picture and os.path.exists(planet.picture):
-            img = Image.open(planet.picture)
-            img = img.resize((180, 120))
-            self.planet_ctk_image = ctk.CTkImage(light_image=img, dark_image=img, size=(300, 200))
-            self.minimap.configure(image=self.planet_ctk_image, text="")
+        image = self.prefetcher.get(planet.picture, MINIMAP_SIZE) if planet.picture else None
+        if image is not None:
+            if image is not self.planet_ctk_image:
+                self.planet_ctk_image = image
+                self.minimap.configure(image=image, text="")
         else:
+            self.planet_ctk_image = None
             self.minimap.configure(text="No minimap available", image=None)
 
     
 
 
-    def clear_frame(self, frame):
-        for widget in frame.winfo_children():       # Iteriere über alle Widgets im Frame
-            widget.destroy()                        # Zerstöre jedes Widget
-
-
-
     # Erstellt eine Funktion, die beim Klick eine Antwort des NPC zu einem bestimmten Gesprächsthema anzeigt
-    def create_topic_response(self, npc, topic):
-        def cmd():                                       # cmd() speichert topic und den NPC und führt die Antwortlogik aus
-            responses = npc.dialogues.get(topic, [])     # Holt mögliche Antworten des NPCs zum gewählten Thema
+    def create_topic_response(self, npc, index):
+        def cmd():                                       # cmd() speichert das Thema und den NPC und führt die Antwortlogik aus
+            topic = npc.topics[index]
+            responses = npc.topic_lines[index]           # vorbereitete Antworten des NPCs zum gewählten Thema
             if responses:
-                # Zeigt eine zufällige Antwort zum Thema
-                self.update_text(f"{npc.name}: {random.choice(responses)}")
+                # Zeigt eine zufällige Antwort zum Thema (Zufall der Sitzung, reproduzierbar)
+                self.update_text(f"{npc.name}: {self.engine.game.rng.choice(responses)}")
             else:
                 # Falls es keine Antwort mehr gibt, entsprechende Meldung anzeigen
                 self.update_text(f"{npc.name} has nothing more to say about {topic}.")
@@ -172,31 +347,27 @@ class MainApp(ctk.CTk):
     
 
     def display_npc_dialogue(self):
-        self.clear_frame(self.sub_button_frame)
-        npc = self.engine.player.current_room.npc
-        if not npc or npc.dead:
+        self.sub_bar.clear()
+        npc = self.engine.game.npc_in(self.engine.player.current_room)
+        if not npc:
             self.update_text("There's no one to talk to.")
             return
 
         # Standart Dialog
-        default_lines = npc.dialogues.get("default", [])
+        default_lines = npc.default_lines
         if default_lines:
-            self.update_text(f"{npc.name}: {random.choice(default_lines)}")
+            self.update_text(f"{npc.name}: {self.engine.game.rng.choice(default_lines)}")
 
         # Topics
-        topics = [topic for topic in npc.dialogues if topic != "default"]
+        topics = npc.topics
         if not topics:
             self.update_text(f"{npc.name} has no topics to discuss.")
             return
 
         self.update_text("🗣️ Topics:")
-        for topic in topics:          #für jeden Topic wird ein Button erstellt
-            btn = ctk.CTkButton(self.sub_button_frame, text=topic.capitalize())
-            btn.configure(command=self.create_topic_response(npc, topic))
-            btn.pack(side="left", padx=5)
-
-        cancel_btn = ctk.CTkButton(self.sub_button_frame, text="End", command=self.cancel_sub_buttons)
-        cancel_btn.pack(side="left", padx=5)
+        entries = [(topic.capitalize(), self.create_topic_response(npc, index)) for index, topic in enumerate(topics)]   #für jeden Topic ein Button
+        entries.append(("End", self.cancel_sub_buttons))
+        self.sub_bar.show(entries)
 
 
 
@@ -210,19 +381,16 @@ class MainApp(ctk.CTk):
 
 
     def update_actions(self):                   
-        self.clear_frame(self.action_frame)
-        self.clear_frame(self.sub_button_frame)
+        self.sub_bar.clear()
         actions = self.engine.get_available_actions()
 
-        for action in actions:
-            btn = ctk.CTkButton(self.action_frame, text=action.capitalize())    # Erstellt einen Button für jede Aktion
-            btn.configure(command=self.create_action_command(action))           # Weist jedem Button eine Funktion zu, die beim Klick die Aktion ausführt
-            btn.pack(side="left", padx=5)
+        # Ein Button pro Aktion; vorhandene Buttons werden nur umbeschriftet statt neu erstellt
+        self.action_bar.show([(action.capitalize(), self.create_action_command(action)) for action in actions])
 
 
 
     def handle_action(self, action):
-        self.clear_frame(self.sub_button_frame)
+        self.sub_bar.clear()
         major_action = False
 
         if action == "move":
@@ -239,22 +407,24 @@ class MainApp(ctk.CTk):
         elif action == "kill":
             self.show_kill_dialog()
         elif action == "plant":
-            text = self.engine.plant()
-            self.update_text(text)
+            result = self.engine.plant()
+            self.update_text(result)
             major_action = True     # große Aktion, die den Raumstatus ändert
         elif action == "drop":
-            text = self.engine.drop()
-            self.update_text(text)
+            result = self.engine.drop()
+            self.update_text(result)
             major_action = True     
         elif action == "quit":
             dialog = ConfirmDialog(self, message="Do you really want to quit?")
             if dialog.result:
                 self.update_text(self.engine.quit_game())
+                self.story.close()
+                self.prefetcher.shutdown()
                 self.destroy()
                 return
 
         if major_action:   # Wenn eine große Aktion ausgeführt wurde, aktualisiere den Status und die Bilder
-            self.update_text(self.engine.get_room_status())
+            self.update_text(result.room_state or self.engine.get_room_state())   # Raumzustand steckt bereits im Ergebnis
             self.update_room_image()
             self.update_planet_image()
             self.update_actions()
@@ -278,23 +448,21 @@ class MainApp(ctk.CTk):
             self.update_actions()
             return
 
+        entries = []
         for conn in connections:    # Iteriere über alle Verbindungen
             room_name = conn.to_room    # Hole den Namen des Ziels
             self.directions_map[room_name] = room_name  # Speichere die Verbindung in der Map
-            btn = ctk.CTkButton(self.sub_button_frame, text=room_name.capitalize()) # Erstelle einen Button für die Verbindung
-            btn.pack(side="left", padx=5)
+            entries.append((room_name.capitalize(), self.create_move_command(room_name)))
 
-        cancel_btn = ctk.CTkButton(self.sub_button_frame, text="Cancel", command=self.cancel_sub_buttons)
-        cancel_btn.pack(side="left", padx=5)
+        entries.append(("Cancel", self.cancel_sub_buttons))
+        self.sub_bar.show(entries)
 
 
 
     def move_to_direction(self, direction):
-        result = self.engine.move(direction)    # Führt die Bewegung in die angegebene Richtung aus und gibt einen Text zurück
-        self.update_text(result)                # Zeigt das Ergebnis im Textfeld    
-        self.clear_frame(self.sub_button_frame) # Entfernt die vorherigen Buttons
-        status = self.engine.get_room_status()  # Holt den neuen Raumstatus
-        self.update_text(status)                # Zeigt den neuen Raumstatus im Textfeld an
+        result = self.engine.move(direction)    # Führt die Bewegung in die angegebene Richtung aus und gibt ein Ergebnis zurück
+        self.update_text(result)                # Zeigt das Ergebnis (inkl. neuem Raumstatus) im Textfeld    
+        self.sub_bar.clear() # Entfernt die vorherigen Buttons
         self.update_room_image()                
         self.update_actions()                   
 
@@ -312,40 +480,33 @@ class MainApp(ctk.CTk):
         else:
             destinations = ["Mars"]
 
-        # Erzeuge für jedes Reiseziel einen Button
-        for idx, dest in enumerate(destinations):       # Iteriere über die Ziele
-            btn = ctk.CTkButton(self.sub_button_frame, text=dest)
-            # Weise jedem Button eine Funktion zu, die beim Klick das Reisen auslöst
-            btn.configure(command=self.create_travel_destination_command(idx))
-            btn.pack(side="left", padx=5)
+        # Ein Button pro Reiseziel, der beim Klick das Reisen auslöst
+        entries = [(dest, self.create_travel_destination_command(idx)) for idx, dest in enumerate(destinations)]
 
         # Füge einen Cancel-Button hinzu, um das Auswahlmenü zu schließen
-        cancel_btn = ctk.CTkButton(self.sub_button_frame, text="Cancel", command=self.cancel_sub_buttons)
-        cancel_btn.pack(side="left", padx=5)
+        entries.append(("Cancel", self.cancel_sub_buttons))
+        self.sub_bar.show(entries)
 
     # Führt die Reiselogik aus, wenn ein Ziel gewählt wurde
     def travel_to_destination(self, choice_idx):
-        result = self.engine.travel(choice_idx)  # Führt den Reisemechanismus aus und gibt einen Text zurück
-        self.update_text(result)                 # Zeigt das Ergebnis im Textfeld
-        self.clear_frame(self.sub_button_frame)  # Entfernt die Reise-Buttons
-        status = self.engine.get_room_status()   # Holt und zeigt den neuen Raumstatus
-        self.update_text(status)
+        result = self.engine.travel(choice_idx)  # Führt den Reisemechanismus aus und gibt ein Ergebnis zurück
+        self.update_text(result)                 # Zeigt das Ergebnis (inkl. neuem Raumstatus) im Textfeld
+        self.sub_bar.clear()  # Entfernt die Reise-Buttons
         self.update_room_image()                 # Aktualisiert das Raumbild
         self.update_planet_image()               # Aktualisiert das Planetenbild
         self.update_actions()                    # Aktualisiert die möglichen Aktionen
 
 
     def cancel_sub_buttons(self):           
-        self.clear_frame(self.sub_button_frame) # Entfernt alle Buttons im Sub-Button-Frame
-        status = self.engine.get_room_status()  # Holt den aktuellen Raumstatus
-        self.update_text(status)                # Zeigt den Raumstatus im Textfeld an
+        self.sub_bar.clear() # Entfernt alle Buttons im Sub-Button-Frame
+        self.update_text(self.engine.get_room_state())  # Zeigt den aktuellen Raumstatus im Textfeld an
         self.update_actions()                   # Aktualisiert die möglichen Aktionen im Action-Frame
     
         # Erstellt eine Funktion (Closure), die beim Klick den Spieler in einen anderen Raum bewegt und die UI aktualisiert
     def create_move_command(self, room_name):
         def cmd():                                     # cmd() speichert den Raum-Namen und führt den Raumwechsel aus
             text = self.engine.move(room_name)         # Führt den Raumwechsel zum angegebenen Raum aus
-            self.clear_frame(self.sub_button_frame)    # Entfernt vorherige Buttons oder UI-Elemente
+            self.sub_bar.clear()    # Entfernt vorherige Buttons oder UI-Elemente
             self.update_text(text)                     # Zeigt den neuen Raumtext oder eine Beschreibung
             self.update_room_image()                   # Aktualisiert das Bild des aktuellen Raums
             self.update_actions()                      # Aktualisiert die möglichen Aktionen im neuen Raum
@@ -354,9 +515,9 @@ class MainApp(ctk.CTk):
     
 
     def show_pickup_dialog(self):
-        self.clear_frame(self.sub_button_frame) # Löscht vorherige Buttons oder UI-Elemente
+        self.sub_bar.clear() # Löscht vorherige Buttons oder UI-Elemente
         room = self.engine.player.current_room  # Holt den aktuellen Raum des Spielers
-        items = room.items                      # Holt die Items im Raum
+        items = self.engine.game.items_in(room) # Holt die Items im Raum
 
         if not items:   
             self.update_text("There are no items to pick up.")
@@ -364,13 +525,10 @@ class MainApp(ctk.CTk):
 
         self.update_text(" Choose an item to pick up:") 
 
-        for item_name in items: # Iteriere über alle Items im Raum
-            btn = ctk.CTkButton(self.sub_button_frame, text=item_name)      # Erstelle einen Button für jedes Item
-            btn.configure(command=self.create_pickup_command(item_name))    # Weist jedem Button eine Funktion zu, die beim Klick das Item aufhebt
-            btn.pack(side="left", padx=5)
-
-        cancel_btn = ctk.CTkButton(self.sub_button_frame, text="Cancel", command=self.cancel_sub_buttons)
-        cancel_btn.pack(side="left", padx=5)
+        # Ein Button pro Item, der beim Klick das Item aufhebt
+        entries = [(item_name, self.create_pickup_command(item_name)) for item_name in items]
+        entries.append(("Cancel", self.cancel_sub_buttons))
+        self.sub_bar.show(entries)
 
 
     # Erstellt eine Funktion (Closure), die beim Klick ein Item aufhebt und die UI aktualisiert
@@ -378,7 +536,7 @@ class MainApp(ctk.CTk):
         def cmd():                                     # cmd() speichert den Item-Namen und führt das Aufheben aus
             result = self.engine.pickup(item_name)     # Führt das Aufheben des angegebenen Items aus
             self.update_text(result)                   # Zeigt das Ergebnis im Textfeld
-            self.clear_frame(self.sub_button_frame)    # Entfernt vorherige Buttons oder UI-Elemente
+            self.sub_bar.clear()    # Entfernt vorherige Buttons oder UI-Elemente
             self.update_actions()                      # Aktualisiert die möglichen Aktionen nach dem Aufheben
         return cmd
 
@@ -388,7 +546,7 @@ class MainApp(ctk.CTk):
         def cmd():                                     # cmd() speichert den Gegner-Namen und führt den Angriff aus
             result = self.engine.kill(enemy_name)      # Führt den Angriff auf den angegebenen Gegner aus
             self.update_text(result)                   # Zeigt das Ergebnis im Textfeld (z. B. "Feind besiegt")
-            self.clear_frame(self.sub_button_frame)    # Entfernt vorherige Buttons oder Auswahlmöglichkeiten
+            self.sub_bar.clear()    # Entfernt vorherige Buttons oder Auswahlmöglichkeiten
             self.update_actions()                      # Aktualisiert die möglichen Aktionen nach dem Kampf
         return cmd
     
@@ -397,7 +555,7 @@ class MainApp(ctk.CTk):
     def create_travel_command(self, index):
         def cmd():                                     # cmd() speichert den Index und führt die Reise aus
             result = self.engine.travel(index)         # Führe die Reise zum Ziel mit dem gegebenen Index aus
-            self.clear_frame(self.sub_button_frame)    # Entferne vorherige Buttons oder UI-Elemente
+            self.sub_bar.clear()    # Entferne vorherige Buttons oder UI-Elemente
             self.update_text(result)                   # Zeige das Ergebnis der Reise im Textfeld
             self.update_room_image()                   # Aktualisiere das Bild des neuen Raums
             self.update_planet_image()                 # Aktualisiere das Bild des neuen Planeten
@@ -408,17 +566,15 @@ class MainApp(ctk.CTk):
 
 
     def show_kill_dialog(self):
-        self.clear_frame(self.sub_button_frame)     # Löscht vorherige Buttons oder UI-Elemente
-        npc = self.engine.player.current_room.npc   # Holt den NPC im aktuellen Raum    
+        self.sub_bar.clear()     # Löscht vorherige Buttons oder UI-Elemente
+        npc = self.engine.game.npc_in(self.engine.player.current_room)   # Holt den lebenden NPC im aktuellen Raum
 
-        if npc and not npc.dead and npc.hostile:    # Wenn ein feindlicher NPC vorhanden ist
+        if npc and npc.hostile:    # Wenn ein feindlicher NPC vorhanden ist
             self.update_text("Choose an enemy to attack:")  #
-            btn = ctk.CTkButton(self.sub_button_frame, text=npc.name)       # Erstelle einen Button für den NPC
-            btn.configure(command=self.create_kill_command(npc.firstname))  # Weist dem Button eine Funktion zu, die beim Klick den NPC umbringt
-            btn.pack(side="left", padx=5)   
-
-            cancel_btn = ctk.CTkButton(self.sub_button_frame, text="Cancel", command=self.cancel_sub_buttons) 
-            cancel_btn.pack(side="left", padx=5)
+            self.sub_bar.show([
+                (npc.name, self.create_kill_command(npc.firstname)),    # Button, der beim Klick den NPC umbringt
+                ("Cancel", self.cancel_sub_buttons),
+            ])
         else:
             self.update_text("There are no enemies to kill.")
 
@@ -431,34 +587,26 @@ class MainApp(ctk.CTk):
 
     def display_travel_options(self):
         current_room = self.engine.player.current_room  # Holt den aktuellen Raum des Spielers
-        interplanetary_conns = [    
-            conn for conn in current_room.connections if conn.connection_type == "interplanetary" # holt alle interplanetaren Verbindungen
-        ]
+        gate_exits = self.engine.game.get_gate_exits(current_room)  # vorberechnete interplanetare Zielräume
 
-        if not interplanetary_conns:    # falls keine interplanetaren Verbindungen vorhanden sind
+        if not gate_exits:    # falls keine interplanetaren Verbindungen vorhanden sind
             self.update_text("No interplanetary connections available.")
             return
 
-        self.clear_frame(self.sub_button_frame) # Löscht vorherige Buttons oder UI-Elemente
+        self.sub_bar.clear() # Löscht vorherige Buttons oder UI-Elemente
         self.update_text("Choose a destination:")   
 
-        for index, conn in enumerate(interplanetary_conns):     # Iteriere über alle interplanetaren Verbindungen
-            to_room = self.engine.game.find_room_by_name(conn.to_room) # Holt den Zielraum
-            if to_room:                                                 # Wenn der Zielraum existiert
-                planet_name = to_room.planet.name                       # Holt den Planeten-Namen
-                btn = ctk.CTkButton(self.sub_button_frame, text=planet_name)    # Erstelle einen Button für den Planeten
-                btn.configure(command=self.create_travel_command(index))    # Weist dem Button eine Funktion zu, die beim Klick die Reise ausführt
-                btn.pack(side="left", padx=5)
-
-        cancel_btn = ctk.CTkButton(self.sub_button_frame, text="Cancel", command=self.cancel_sub_buttons)
-        cancel_btn.pack(side="left", padx=5)
+        # Ein Button pro Zielplanet, der beim Klick die Reise ausführt
+        entries = [(to_room.planet.name, self.create_travel_command(index)) for index, to_room in enumerate(gate_exits)]
+        entries.append(("Cancel", self.cancel_sub_buttons))
+        self.sub_bar.show(entries)
 
 
 
     
     def display_move_options(self):
         current_room = self.engine.player.current_room # Holt den aktuellen Raum des Spielers
-        connections = [conn.to_room for conn in current_room.connections if conn.connection_type != "interplanetary"] # iteriert über alle Verbindungen und filtert interplanetare Verbindungen heraus
+        connections = [room.name for room in self.engine.game.get_local_exits(current_room)] # vorberechnete lokale Nachbarräume
 
         
         if not connections:
@@ -467,16 +615,10 @@ class MainApp(ctk.CTk):
             self.update_actions()
             return
 
-        self.move_buttons = [] # Liste für die Buttons, falls sie später benötigt werden
-
-        for room_name in connections:   # Iteriere über alle Verbindungen
-            btn = ctk.CTkButton(self.sub_button_frame, text=room_name.capitalize()) # Erstelle einen Button für jede Verbindung
-            btn.configure(command=self.create_move_command(room_name)) # Weist jedem Button eine Funktion zu, die beim Klick den Raumwechsel ausführt
-            btn.pack(side="left", padx=5) 
-            self.move_buttons.append(btn) # Speichert die Buttons in einer Liste, falls sie später benötigt werden
-
-        cancel_btn = ctk.CTkButton(self.sub_button_frame, text="Cancel", command=self.cancel_sub_buttons)
-        cancel_btn.pack(side="left", padx=5)
+        # Ein Button pro Verbindung, der beim Klick den Raumwechsel ausführt
+        entries = [(room_name.capitalize(), self.create_move_command(room_name)) for room_name in connections]
+        entries.append(("Cancel", self.cancel_sub_buttons))
+        self.sub_bar.show(entries)
 
 
     
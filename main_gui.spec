@@ -1,11 +1,19 @@
 # -*- mode: python ; coding: utf-8 -*-
+import os
+
+# Mit "python build_assets.py" erzeugte Bilder in Anzeigegröße bündeln, sonst die Originale aus img/
+if os.path.exists(os.path.join('assets', 'manifest.json')):
+    datas = [(os.path.join('assets', 'img'), 'img'), (os.path.join('assets', 'world.json'), '.')]
+else:
+    datas = [('img', 'img'), ('world.json', '.')]
+datas.append(('game_story.json', '.'))
 
 
 a = Analysis(
     ['main_gui.py'],
     pathex=[],
     binaries=[],
-    datas=[('img', 'img')],
+    datas=datas,
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
@@ -0,0 +1,122 @@
+import threading
+import weakref
+from collections import OrderedDict, deque
+
+
+#################################################################
+# Suchbäume aller Sitzungen einer Welt (eine Instanz pro geteilter Welt-Vorlage)
+# Begrenzt wird die Summe der Räume über alle gespeicherten Bäume, nicht die Anzahl der Bäume pro Sitzung.
+class RouteCache:
+    def __init__(self, max_rooms=1 << 20):
+        self.max_rooms = max_rooms  # Obergrenze für die Einträge aller Bäume zusammen
+        self.trees = OrderedDict()  # (gemiedene Räume, Start, relevante Items, aufgehobene Anforderungen) -> {Raum: Vorgänger}
+        self.total_rooms = 0
+        self.requirement_items = None  # Bitmaske aller Items, die irgendwo als Anforderung vorkommen (einmal berechnet)
+        self.lock = threading.Lock()  # GUI und Server können Wege aus mehreren Threads suchen
+
+    def get(self, key):
+        with self.lock:
+            parents = self.trees.get(key)
+            if parents is not None:
+                self.trees.move_to_end(key)
+            return parents
+
+    def put(self, key, parents):
+        with self.lock:
+            if key in self.trees:
+                return
+            self.trees[key] = parents
+            self.total_rooms += len(parents)
+            while self.total_rooms > self.max_rooms and len(self.trees) > 1:  # der neueste Baum bleibt immer
+                _, oldest = self.trees.popitem(last=False)
+                self.total_rooms -= len(oldest)
+
+
+_route_caches = weakref.WeakKeyDictionary()  # WorldIndex -> RouteCache
+_route_caches_lock = threading.Lock()
+
+
+def route_cache_for(game):
+    """Gibt den gemeinsamen RouteCache aller Sitzungen über derselben Welt zurück."""
+    with _route_caches_lock:
+        cache = _route_caches.get(game.index)
+        if cache is None:
+            cache = _route_caches[game.index] = RouteCache()
+        return cache
+
+
+#################################################################
+# Kürzeste Wege über lokale und interplanetare Verbindungen (Breitensuche, jeder Schritt kostet 1)
+class RouteFinder:
+    def __init__(self, game, avoid=(), cache=None):
+        self.game = game
+        self.avoid = frozenset(avoid)  # Räume, die nur Ziel, aber nie Zwischenstation sein dürfen (z. B. tödliche Räume)
+        self.cache = cache if cache is not None else route_cache_for(game)  # ohne Angabe: geteilt pro Welt
+        self.hits = 0
+        self.misses = 0
+
+    def route(self, source, target):
+        """Gibt die Räume auf dem kürzesten Weg von source nach target zurück (ohne source).
+
+        Räume, deren Anforderungen das aktuelle Inventar nicht erfüllt, werden nicht betreten.
+        Gibt None zurück, wenn es keinen Weg gibt, und eine leere Liste, wenn source schon das Ziel ist.
+        """
+        if source is target:
+            return []
+        parents = self._tree(source)
+        if target not in parents:
+            return None
+        path = []
+        room = target
+        while room is not source:
+            path.append(room)
+            room = parents[room]
+        path.reverse()
+        return path
+
+    def reachable(self, source):
+        """Gibt alle Räume zurück, die mit dem aktuellen Inventar von source aus erreichbar sind."""
+        return self._tree(source).keys()
+
+    def _state_key(self, source):
+        """Schlüssel für den Suchbaum: nur Items, die für Anforderungen zählen, ändern die Wege."""
+        cache = self.cache
+        if cache.requirement_items is None:
+            requirement_items = 0
+            for room in self.game.rooms.values():
+                requirement_items |= room.requirement_mask
+            cache.requirement_items = requirement_items
+        items = self.game.player.inventory.mask & cache.requirement_items
+        return self.avoid, source, items, frozenset(self.game.cleared_requirements)
+
+    def _tree(self, source):
+        """Gibt den (gecachten) Baum der kürzesten Wege ab source als {Raum: Vorgänger} zurück."""
+        key = self._state_key(source)
+        parents = self.cache.get(key)
+        if parents is not None:
+            self.hits += 1
+            return parents
+
+        self.misses += 1
+        game = self.game
+        missing_mask = ~game.player.inventory.mask  # gesetzte Bits = Items, die dem Spieler fehlen
+        avoid = self.avoid
+        parents = {source: None}
+        queue = deque([source])
+        while queue:
+            room = queue.popleft()
+            travel_triggers = room.travel_triggers
+            for exits, gate in ((game.get_local_exits(room), False), (game.get_gate_exits(room), True)):
+                for next_room in exits:
+                    if next_room in parents:
+                        continue
+                    if gate and travel_triggers and travel_triggers.get(next_room.name) == "die":
+                        continue  # tödliche Stargate-Reise ("on_travel" in world.json)
+                    if game.requirement_mask(next_room) & missing_mask:
+                        continue  # mit diesem Inventar gesperrt
+                    parents[next_room] = room
+                    if next_room not in avoid:  # gemiedene Räume sind nur als Ziel erlaubt
+                        queue.append(next_room)
+
+        self.cache.put(key, parents)  # Bäume werden danach nie verändert, alle Sitzungen lesen sie nur
+        return parents
@@ -0,0 +1,190 @@
+from game import Player
+
+# Aufbau eines Spielstands (nur die Änderungen gegenüber der geladenen Welt):
+#   MAGIC, Versionsbyte
+#   Spielername, Gesundheit, aktueller Raum
+#   Inventar                      Anzahl, Items
+#   Ziele                         Anzahl, je Markierung (0 = Text, 1 = Ziel des genannten Raums) und Text/Raum
+#   aufgehobene Items             Anzahl Räume, je Raum, Anzahl, Items
+#   aufgehobene Anforderungen     Anzahl, Räume
+#   tote NPCs                     Anzahl, Räume der NPCs
+#   gehandelte NPC-Inventare      Anzahl Räume, je Raum, Anzahl, verbleibende Items
+#   Zufallsgenerator              Zustand des SessionRandom (ab Version 2)
+# Zahlen sind Varints, Texte sind UTF-8 mit vorangestellter Länge.
+MAGIC = b"SGS"
+VERSION = 2
+SUPPORTED_VERSIONS = (1, 2)  # Version 1 hat noch keinen Zufallszustand
+
+OBJECTIVE_TEXT = 0
+OBJECTIVE_ROOM = 1
+
+
+#################################################################
+# Schreiben
+class _Writer:
+    def __init__(self):
+        self.data = bytearray(MAGIC)
+        self.data.append(VERSION)
+
+    def varint(self, value):
+        while value >= 0x80:
+            self.data.append((value & 0x7F) | 0x80)
+            value >>= 7
+        self.data.append(value)
+
+    def text(self, value):
+        encoded = value.encode("utf-8")
+        self.varint(len(encoded))
+        self.data += encoded
+
+    def texts(self, values):
+        self.varint(len(values))
+        for value in values:
+            self.text(value)
+
+
+def dump_session(game):
+    """Kodiert den Spielstand einer Sitzung als kompakte Bytes."""
+    player = game.player
+    writer = _Writer()
+    writer.text(player.name)
+    writer.varint(player.health)
+    writer.text(player.current_room.name)
+    writer.texts(list(player.inventory))
+
+    # Ziele stammen fast immer aus Räumen: dann reicht der (kürzere) Raumname
+    objective_rooms = game.index.room_of_objective
+    writer.varint(len(game.current_objective))
+    for objective in game.current_objective:
+        room_name = objective_rooms.get(objective)
+        if room_name is not None and len(room_name) < len(objective):
+            writer.varint(OBJECTIVE_ROOM)
+            writer.text(room_name)
+        else:
+            writer.varint(OBJECTIVE_TEXT)
+            writer.text(objective)
+
+    writer.varint(len(game.room_items))
+    for room, items in game.room_items.items():
+        remaining = list(items)
+        removed = []
+        for item in room.items:
+            if item in remaining:
+                remaining.remove(item)
+            else:
+                removed.append(item)
+        writer.text(room.name)
+        writer.texts(removed)
+
+    writer.texts([room.name for room in game.cleared_requirements])
+    writer.texts([npc.room.name for npc in game.dead_npcs])
+
+    writer.varint(len(game.npc_inventories))
+    for npc, inventory in game.npc_inventories.items():
+        writer.text(npc.room.name)
+        writer.texts(inventory)
+
+    writer.varint(game.rng.state)
+    return bytes(writer.data)
+
+
+#################################################################
+# Lesen
+class _Reader:
+    def __init__(self, data):
+        self.data = memoryview(data)
+        self.pos = 0
+
+    def varint(self):
+        result = 0
+        shift = 0
+        while True:
+            if self.pos >= len(self.data):
+                raise ValueError("Spielstand ist unvollständig.")
+            byte = self.data[self.pos]
+            self.pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def text(self):
+        length = self.varint()
+        end = self.pos + length
+        if end > len(self.data):
+            raise ValueError("Spielstand ist unvollständig.")
+        value = str(self.data[self.pos:end], "utf-8")
+        self.pos = end
+        return value
+
+    def texts(self):
+        return [self.text() for _ in range(self.varint())]
+
+
+def load_session(game, data):
+    """Stellt einen mit dump_session gespeicherten Spielstand in einer frischen Sitzung wieder her."""
+    if len(data) <= len(MAGIC) or data[:len(MAGIC)] != MAGIC:
+        raise ValueError("Keine gültige Spielstand-Datei.")
+    version = data[len(MAGIC)]
+    if version not in SUPPORTED_VERSIONS:
+        raise ValueError(f"Nicht unterstützte Spielstand-Version: {version}")
+    reader = _Reader(data)
+    reader.pos = len(MAGIC) + 1
+
+    def room_named(name):
+        room = game.find_room_by_name(name)
+        if room is None:
+            raise ValueError(f"Spielstand passt nicht zur Welt: Raum '{name}' unbekannt.")
+        return room
+
+    player = Player(reader.text(), health=reader.varint())
+    player.current_room = room_named(reader.text())
+    player.current_planet = game.planet_of_room(player.current_room)
+    for item in reader.texts():
+        player.add_item(item)
+
+    objectives = []
+    for _ in range(reader.varint()):
+        kind = reader.varint()
+        value = reader.text()
+        objectives.append(room_named(value).objective if kind == OBJECTIVE_ROOM else value)
+
+    room_items = {}
+    for _ in range(reader.varint()):
+        room = room_named(reader.text())
+        items = list(room.items)
+        for item in reader.texts():
+            if item in items:
+                items.remove(item)
+        room_items[room] = items
+
+    cleared_requirements = {room_named(name) for name in reader.texts()}
+
+    dead_npcs = set()
+    for name in reader.texts():
+        npc = room_named(name).npc
+        if npc is None:
+            raise ValueError(f"Spielstand passt nicht zur Welt: kein NPC in '{name}'.")
+        dead_npcs.add(npc)
+
+    npc_inventories = {}
+    for _ in range(reader.varint()):
+        name = reader.text()
+        npc = room_named(name).npc
+        inventory = reader.texts()
+        if npc is not None:
+            npc_inventories[npc] = inventory
+
+    rng_state = reader.varint() if version >= 2 else None
+
+    # Erst übernehmen, wenn alles gelesen werden konnte
+    game.player = player
+    game.current_objective = objectives
+    game.room_items = room_items
+    game.cleared_requirements = cleared_requirements
+    game.dead_npcs = dead_npcs
+    game.npc_inventories = npc_inventories
+    game.room_versions = {}
+    if rng_state is not None:
+        game.rng.state = rng_state  # Dialoge laufen nach dem Laden genauso weiter wie im gespeicherten Spiel
+    return player
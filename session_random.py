@@ -0,0 +1,33 @@
+import os
+
+MASK64 = (1 << 64) - 1
+GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+
+
+#################################################################
+# Kleiner, seedbarer Zufallsgenerator pro Sitzung (SplitMix64)
+# Der gesamte Zustand ist eine 64-Bit-Zahl und passt damit in wenige Bytes eines Spielstands.
+class SessionRandom:
+    __slots__ = ("state",)
+
+    def __init__(self, seed=None):
+        if seed is None:
+            seed = int.from_bytes(os.urandom(8), "little")
+        self.state = seed & MASK64
+
+    def next_u64(self):
+        """Gibt die nächste 64-Bit-Zufallszahl zurück."""
+        self.state = z = (self.state + GOLDEN_GAMMA) & MASK64
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASK64
+        return z ^ (z >> 31)
+
+    def below(self, n):
+        """Zufallszahl in [0, n) (Multiplizieren und Schieben statt Modulo)."""
+        return (self.next_u64() * n) >> 64
+
+    def choice(self, sequence):
+        """Wie random.choice: ein zufälliges Element einer nicht-leeren Sequenz."""
+        if not sequence:
+            raise IndexError("Cannot choose from an empty sequence")
+        return sequence[self.below(len(sequence))]
@@ -0,0 +1,158 @@
+import argparse
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from action_result import Outcome
+from game_engine import GameEngine
+from world_analyzer import END_ROOM
+
+# Ergebnis eines Durchlaufs
+WON = "won"
+DIED = "died"
+SCRIPT_END = "script_end"  # Skript zu Ende, ohne Sieg oder Tod
+STUCK = "stuck"  # keine sinnvolle Aktion mehr möglich
+MAX_STEPS = "max_steps"  # Schrittgrenze erreicht
+
+
+def parse_script(lines):
+    """Wandelt Zeilen wie "move Armory" oder "travel 0" in (Befehl, Argumente)-Paare um."""
+    script = []
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        command, _, arg = line.partition(" ")
+        if not arg:
+            args = ()
+        elif arg.lstrip("-").isdigit():
+            args = (int(arg),)
+        else:
+            args = (arg,)
+        script.append((command, args))
+    return script
+
+
+def random_command(engine, rng):
+    """Wählt eine zufällige ausführbare Aktion samt Argument (ohne quit); None, wenn es keine gibt."""
+    game = engine.game
+    room = engine.player.current_room
+    choices = []
+    for action in engine.get_available_actions():
+        if action == "move":
+            choices.extend(("move", (next_room.name,)) for next_room in game.get_local_exits(room))
+        elif action == "travel":
+            choices.extend(("travel", (index,)) for index in range(len(game.get_gate_exits(room))))
+        elif action == "pickup":
+            choices.extend(("pickup", (item,)) for item in game.items_in(room))
+        elif action == "kill":
+            choices.append(("kill", (game.npc_in(room).firstname,)))
+        elif action != "quit":  # interact und die Raumaktionen aus world.json brauchen kein Argument
+            choices.append((action, ()))
+    return rng.choice(choices) if choices else None
+
+
+def run_playthrough(seed, script=None, max_steps=200):
+    """Spielt einen Durchlauf und gibt (Ergebnis, Schritte, Todesraum oder None) zurück.
+
+    Ohne Skript wird zufällig gespielt; seed bestimmt die Zufallsentscheidungen und die Dialogauswahl.
+    """
+    rng = random.Random(seed)  # Entscheidungen des Zufallsspielers
+    engine = GameEngine(seed=seed)  # Dialogzeilen der Sitzung
+    engine.initialize_game("Sim")
+    commands = iter(script) if script is not None else None
+
+    for step in range(1, max_steps + 1):
+        if commands is not None:
+            command = next(commands, None)
+            if command is None:
+                return SCRIPT_END, step - 1, None
+        else:
+            command = random_command(engine, rng)
+            if command is None:
+                return STUCK, step - 1, None
+
+        result = engine.execute(*command)
+        outcome = getattr(result, "outcome", None)
+        if outcome is Outcome.WON or engine.player.current_room.name == END_ROOM:
+            return WON, step, None
+        if outcome is Outcome.DIED:
+            return DIED, step, result.subject
+    return MAX_STEPS, max_steps, None
+
+
+def run_batch(first_seed, count, script=None, max_steps=200):
+    """Führt count Durchläufe in einem Prozess aus und gibt nur die Summen zurück (wenig Datenverkehr)."""
+    results = Counter()
+    death_rooms = Counter()
+    total_steps = 0
+    for seed in range(first_seed, first_seed + count):
+        result, steps, death_room = run_playthrough(seed, script, max_steps)
+        results[result] += 1
+        total_steps += steps
+        if death_room is not None:
+            death_rooms[death_room] += 1
+    return results, death_rooms, total_steps
+
+
+def simulate(runs, workers=None, seed=0, script=None, max_steps=200, batch_size=500):
+    """Verteilt runs Durchläufe auf einen Prozesspool und gibt die zusammengefassten Statistiken zurück."""
+    workers = workers or os.cpu_count() or 1
+    results = Counter()
+    death_rooms = Counter()
+    total_steps = 0
+    start = time.perf_counter()
+    batches = [(first, min(batch_size, seed + runs - first)) for first in range(seed, seed + runs, batch_size)]
+    if workers == 1:
+        outputs = (run_batch(first, count, script, max_steps) for first, count in batches)
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        outputs = executor.map(run_batch, *zip(*batches), [script] * len(batches), [max_steps] * len(batches))
+    for batch_results, batch_deaths, batch_steps in outputs:
+        results.update(batch_results)
+        death_rooms.update(batch_deaths)
+        total_steps += batch_steps
+    if workers != 1:
+        executor.shutdown()
+    elapsed = time.perf_counter() - start
+    return {
+        "runs": runs,
+        "workers": workers,
+        "seconds": elapsed,
+        "per_second": runs / elapsed if elapsed else 0.0,
+        "results": dict(results),
+        "win_rate": results[WON] / runs if runs else 0.0,
+        "death_rate": results[DIED] / runs if runs else 0.0,
+        "death_rooms": dict(death_rooms),
+        "avg_steps": total_steps / runs if runs else 0.0,
+    }
+
+
+def print_stats(stats):
+    runs = stats["runs"]
+    print(f"{runs} playthroughs on {stats['workers']} workers in {stats['seconds']:.2f}s "
+          f"({stats['per_second']:.0f} playthroughs/s)")
+    print(f"win rate:   {stats['win_rate']:.2%}")
+    print(f"death rate: {stats['death_rate']:.2%}")
+    for room, deaths in sorted(stats["death_rooms"].items(), key=lambda entry: -entry[1]):
+        print(f"  died at {room}: {deaths / runs:.2%}")
+    print(f"avg steps:  {stats['avg_steps']:.1f}")
+    print("results:    " + ", ".join(f"{name}={count}" for name, count in sorted(stats["results"].items())))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run headless Stargate Adventure playthroughs in parallel.")
+    parser.add_argument("--runs", type=int, default=10000)
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: all cores)")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first playthrough")
+    parser.add_argument("--max-steps", type=int, default=200)
+    parser.add_argument("--script", help="file with one command per line, e.g. 'move Briefing Room'")
+    options = parser.parse_args()
+
+    script = None
+    if options.script:
+        with open(options.script, "r", encoding="utf-8") as file:
+            script = parse_script(file)
+    print_stats(simulate(options.runs, options.workers, options.seed, script, options.max_steps))
@@ -0,0 +1,243 @@
+import argparse
+import json
+import os
+import sys
+from collections import deque
+
+from game import Game
+
+# Tödliche Räume und die Sieges-Reise kommen aus den Auslösern der Welt ("on_enter": "die", "on_travel": ... "win")
+DEATH_TARGET = "Ascend"  # dort landet der Spieler nach dem Tod (Game.kill_player)
+END_ROOM = "The End"  # letzter Raum der Geschichte (Ziel, wenn es die Sieges-Reise nicht gibt)
+DEFAULT_START = "Quarters"
+
+
+#################################################################
+# Ergebnis der Analyse einer Welt
+class WorldReport:
+    __slots__ = ("start", "goal", "reachable", "locked", "unreachable", "item_order", "room_levels",
+                 "needed_items", "dead_ends", "death_rooms")
+
+    def __init__(self, start, goal):
+        self.start = start  # Startraum
+        self.goal = goal  # Zielraum oder None
+        self.reachable = {}  # erreichbarer Raum -> Raum, von dem aus er zuerst betreten wurde
+        self.locked = {}  # gesehener, aber nie betretbarer Raum -> fehlende Items
+        self.unreachable = []  # Räume, zu denen gar kein Weg führt
+        self.item_order = []  # (Item, Raum) in der Reihenfolge, in der die Suche sie einsammelt
+        self.room_levels = {}  # Raum -> Anzahl nacheinander nötiger Item-Freischaltungen
+        self.needed_items = []  # kleinste Item-Reihenfolge zum Ziel (Abhängigkeiten zuerst)
+        self.dead_ends = []  # erreichbare Räume, von denen aus das Ziel nicht mehr erreichbar ist
+        self.death_rooms = []  # erreichbare tödliche Räume
+
+    @property
+    def winnable(self):
+        return self.goal is not None and self.goal in self.reachable
+
+    def to_payload(self):
+        """Kompakte Darstellung für die Build-Pipeline (JSON)."""
+        return {
+            "start": self.start.name,
+            "goal": self.goal.name if self.goal else None,
+            "winnable": self.winnable,
+            "reachable": len(self.reachable),
+            "locked": {room.name: items for room, items in self.locked.items()},
+            "unreachable": [room.name for room in self.unreachable],
+            "item_order": [[item, room.name] for item, room in self.item_order],
+            "needed_items": [[item, room.name] for item, room in self.needed_items],
+            "max_level": max(self.room_levels.values(), default=0),
+            "dead_ends": [room.name for room in self.dead_ends],
+            "death_rooms": [room.name for room in self.death_rooms],
+        }
+
+    def render(self, limit=20):
+        """Lesbarer Bericht; lange Listen werden nach limit Einträgen gekürzt."""
+        def names(rooms):
+            listed = ", ".join(room.name for room in rooms[:limit])
+            return listed + (f", … (+{len(rooms) - limit})" if len(rooms) > limit else "")
+
+        lines = [f"Start: {self.start.name}", f"Reachable rooms: {len(self.reachable)}"]
+        if self.goal is not None:
+            lines.append(f"Goal: {self.goal.name} ({'winnable' if self.winnable else 'NOT winnable'})")
+        if self.needed_items:
+            lines.append("Item order to goal: " + " → ".join(f"{item} ({room.name})" for item, room in self.needed_items))
+        if self.locked:
+            locked = list(self.locked.items())
+            lines.append(f"Locked rooms ({len(locked)}): " + ", ".join(
+                f"{room.name} [{', '.join(items)}]" for room, items in locked[:limit]))
+        if self.unreachable:
+            lines.append(f"Unreachable rooms ({len(self.unreachable)}): {names(self.unreachable)}")
+        if self.death_rooms:
+            lines.append(f"Deadly rooms: {names(self.death_rooms)}")
+        if self.dead_ends:
+            lines.append(f"Dead ends ({len(self.dead_ends)}): {names(self.dead_ends)}")
+        return "\n".join(lines)
+
+
+def analyze_world(game, start=None, goal=None):
+    """Analysiert die Welt eines geladenen Game-Objekts.
+
+    Items werden als dauerhaft betrachtet: ein Raum ist betretbar, sobald alle Items seiner Anforderung
+    irgendwo erreichbar eingesammelt wurden. Die Suche ist eine Breitensuche mit Warteliste: ein gesperrter
+    Raum wartet auf jedes fehlende Item und wird eingereiht, sobald das letzte davon gefunden ist.
+    Jeder Raum, jede Verbindung und jede Anforderung wird dabei nur einmal angefasst (nahezu linear).
+    """
+    if start is None:
+        start = game.find_room_by_name(DEFAULT_START) or next(iter(game.rooms.values()))
+    if goal is None:
+        goal = _default_goal(game)
+    report = WorldReport(start, goal)
+    death_rooms = set(game.enter_trigger_rooms.get("die", ()))
+    death_target = game.find_room_by_name(DEATH_TARGET)
+
+    parent = report.reachable
+    levels = report.room_levels
+    have = {}  # Item -> Raum, in dem es zuerst eingesammelt wurde
+    item_levels = {}  # Item -> Level des Raums, in dem es liegt
+    pending = {}  # gesperrter Raum -> [entdeckt von, Anzahl fehlender Items]
+    waiting = {}  # Item -> Räume, die darauf warten
+    queue = deque()
+
+    def enter(room, from_room):
+        parent[room] = from_room
+        if from_room is None:  # Startraum: der Spieler ist schon drin
+            levels[room] = 0
+        else:
+            level = levels[from_room]
+            for item in game.requirements_of(room):
+                level = max(level, item_levels[item] + 1)
+            levels[room] = level
+        queue.append(room)
+
+    def discover(room, from_room):
+        if room in parent or room in pending:
+            return
+        missing = {item for item in game.requirements_of(room) if item not in have}
+        if not missing:
+            enter(room, from_room)
+            return
+        pending[room] = [from_room, len(missing)]
+        for item in missing:
+            waiting.setdefault(item, []).append(room)
+
+    enter(start, None)
+    while queue:
+        room = queue.popleft()
+        if room in death_rooms:
+            report.death_rooms.append(room)
+            if death_target is not None:
+                discover(death_target, room)
+            continue  # tödlicher Raum: keine Items, keine Ausgänge
+
+        for item in room.items:
+            if item in have:
+                continue
+            have[item] = room
+            item_levels[item] = levels[room]
+            report.item_order.append((item, room))
+            for waiting_room in waiting.pop(item, ()):
+                entry = pending[waiting_room]
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del pending[waiting_room]
+                    enter(waiting_room, entry[0])
+
+        for next_room in game.get_local_exits(room):
+            discover(next_room, room)
+        for next_room in game.get_gate_exits(room):
+            discover(next_room, room)
+
+    for room in pending:
+        report.locked[room] = [item for item in game.requirements_of(room) if item not in have]
+    report.unreachable = [room for room in game.rooms.values() if room not in parent and room not in pending]
+    report.dead_ends = _dead_ends(game, report, death_rooms)
+    if report.winnable:
+        report.needed_items = _needed_items(game, report, have, goal)
+    return report
+
+
+def _default_goal(game):
+    """Ein Raum, der beim Betreten gewinnt, oder der Ausgangsraum einer Sieges-Reise, sonst der letzte Raum
+    der Geschichte (oder None)."""
+    for room in game.enter_trigger_rooms.get("win", ()):
+        return room
+    for from_room in game.travel_trigger_rooms.get("win", ()):
+        for to_room in game.get_gate_exits(from_room):
+            if from_room.travel_triggers.get(to_room.name) == "win":
+                return from_room
+    return game.find_room_by_name(END_ROOM)
+
+
+def _dead_ends(game, report, death_rooms):
+    """Erreichbare Räume, von denen aus das Ziel (mit allen erreichbaren Items) nicht mehr erreichbar ist.
+
+    Ohne Ziel: erreichbare Räume ohne Ausgang in einen anderen erreichbaren Raum.
+    """
+    reachable = report.reachable
+    if report.goal is None or report.goal not in reachable:
+        return [room for room in reachable if room not in death_rooms and not any(
+            next_room in reachable and next_room is not room
+            for next_room in game.get_local_exits(room) + game.get_gate_exits(room))]
+
+    # Rückwärtssuche vom Ziel über die Verbindungen zwischen erreichbaren Räumen
+    incoming = {}
+    for room in reachable:
+        if room in death_rooms:
+            continue
+        for next_room in game.get_local_exits(room) + game.get_gate_exits(room):
+            if next_room in reachable:
+                incoming.setdefault(next_room, []).append(room)
+    can_win = {report.goal}
+    queue = deque([report.goal])
+    while queue:
+        for room in incoming.get(queue.popleft(), ()):
+            if room not in can_win:
+                can_win.add(room)
+                queue.append(room)
+    return [room for room in reachable if room not in can_win]
+
+
+def _needed_items(game, report, have, goal):
+    """Items, die auf dem Weg zum Ziel wirklich gebraucht werden, in einer gültigen Sammelreihenfolge."""
+    order = []
+    done = set()
+
+    def require(room):
+        # Alle Anforderungen auf dem Weg vom Start zu diesem Raum, jeweils mit ihren eigenen Abhängigkeiten
+        path = []
+        while report.reachable[room] is not None:  # der Startraum selbst braucht keine Items
+            path.append(room)
+            room = report.reachable[room]
+        for step in reversed(path):
+            for item in game.requirements_of(step):
+                if item not in done:
+                    done.add(item)
+                    require(have[item])
+                    order.append((item, have[item]))
+
+    require(goal)
+    return order
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check that a Stargate Adventure world is winnable.")
+    parser.add_argument("world", nargs="?", default="world.json")
+    parser.add_argument("--start", help=f"start room (default: {DEFAULT_START})")
+    parser.add_argument("--goal", help=f"goal room (default: the room of the winning stargate trip or {END_ROOM})")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    parser.add_argument("--strict", action="store_true", help="also fail on locked or unreachable rooms")
+    options = parser.parse_args()
+
+    game = Game()
+    game.create_game(os.path.abspath(options.world), streaming=True, use_cache=True)
+    start = game.find_room_ignore_case(options.start) if options.start else None
+    goal = game.find_room_ignore_case(options.goal) if options.goal else None
+    if (options.start and start is None) or (options.goal and goal is None):
+        print(f"Unknown room: {options.start if options.start and start is None else options.goal}", file=sys.stderr)
+        sys.exit(2)
+
+    report = analyze_world(game, start, goal)
+    print(json.dumps(report.to_payload(), ensure_ascii=False, indent=2) if options.json else report.render())
+    failed = (report.goal is not None and not report.winnable) or (
+        options.strict and (report.locked or report.unreachable))
+    sys.exit(1 if failed else 0)
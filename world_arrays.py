@@ -0,0 +1,233 @@
+import argparse
+import os
+
+import numpy as np  # optional: nur für Auswertungen über große Welten, das Spiel selbst braucht NumPy nicht
+
+from game import ITEMS, Game
+
+MASK64 = (1 << 64) - 1
+
+
+def _summary(values):
+    """Kennzahlen eines Grad-Arrays."""
+    if not values.size:
+        return {"min": 0, "max": 0, "mean": 0.0, "zero": 0}
+    return {"min": int(values.min()), "max": int(values.max()), "mean": float(values.mean()),
+            "zero": int(np.count_nonzero(values == 0))}
+
+
+def _csr(exit_lists):
+    """Baut aus Listen von Zielindizes ein CSR-Paar (Offsets, Ziele)."""
+    offsets = np.zeros(len(exit_lists) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(exits) for exits in exit_lists])
+    targets = np.fromiter((target for exits in exit_lists for target in exits), dtype=np.int64, count=int(offsets[-1]))
+    return offsets, targets
+
+
+#################################################################
+# Array-Sicht auf eine geladene Welt für Massenabfragen (Erreichbarkeit, Statistiken, viele Spieler auf einmal)
+# Die Sicht ist eine Momentaufnahme der Welt-Vorlage; Änderungen einzelner Sitzungen (Overlay) enthält sie nicht.
+class WorldArrays:
+    def __init__(self, game):
+        self.rooms = list(game.rooms.values())  # Raumindex -> Room
+        self.room_ids = {room: index for index, room in enumerate(self.rooms)}
+        self.planet_names = list(game.planets)  # Planetenindex -> Name
+        planet_ids = {planet: index for index, planet in enumerate(game.planets.values())}
+        count = len(self.rooms)
+        self.room_count = count
+        self.planet = np.fromiter((planet_ids[room.planet] for room in self.rooms), dtype=np.int32, count=count)
+
+        # Nachbarschaft als CSR: Ausgänge von Raum i sind targets[offsets[i]:offsets[i + 1]]
+        ids = self.room_ids
+        local = [[ids[next_room] for next_room in game.get_local_exits(room)] for room in self.rooms]
+        gate = [[ids[next_room] for next_room in game.get_gate_exits(room)] for room in self.rooms]
+        self.local_offsets, self.local_targets = _csr(local)
+        self.gate_offsets, self.gate_targets = _csr(gate)
+        self.offsets, self.targets = _csr([l + g for l, g in zip(local, gate)])  # alle Ausgänge, lokale zuerst
+        self.edge_sources = np.repeat(np.arange(count, dtype=np.int64), np.diff(self.offsets))
+
+        # Items und Anforderungen als Bitmatrix: Zeile = Raum, Spalte = 64-Bit-Wort der Itemmaske
+        self.words = max(1, (len(ITEMS.names) + 63) // 64)
+        self.items = np.array([self._words(ITEMS.mask_of(room.items)) for room in self.rooms],
+                              dtype=np.uint64).reshape(count, self.words)
+        self.requirements = np.array([self._words(room.requirement_mask) for room in self.rooms],
+                                     dtype=np.uint64).reshape(count, self.words)
+        self.locked_rooms = np.flatnonzero(self.requirements.any(axis=1))  # Räume mit Anforderungen
+
+        # NPC- und Auslöser-Flags pro Raum
+        self.has_npc = np.fromiter((room.npc is not None for room in self.rooms), dtype=bool, count=count)
+        self.hostile = np.fromiter((room.npc is not None and bool(room.npc.hostile) for room in self.rooms),
+                                   dtype=bool, count=count)
+        self.deadly = np.fromiter((room.enter_trigger == "die" for room in self.rooms), dtype=bool, count=count)
+
+        # Auslöser pro Kante: Betreten des Zielraums oder eine Stargate-Reise mit "on_travel"
+        edge_die = self.deadly[self.targets].copy()
+        edge_win = np.fromiter((room.enter_trigger == "win" for room in self.rooms), dtype=bool, count=count)[self.targets]
+        for room in game.travel_trigger_rooms.get("win", ()):
+            source = ids[room]
+            for edge in range(self.offsets[source], self.offsets[source + 1]):
+                if room.travel_triggers.get(self.rooms[self.targets[edge]].name) == "win" \
+                        and edge - self.offsets[source] >= len(local[source]):  # nur Stargate-Kanten
+                    edge_win[edge] = True
+        self.edge_die = edge_die
+        self.edge_win = edge_win
+
+    def _words(self, mask):
+        """Zerlegt eine Itemmaske in words 64-Bit-Wörter (Bits jenseits der Matrix spielen keine Rolle)."""
+        return [(mask >> (64 * word)) & MASK64 for word in range(self.words)]
+
+    def _edges_of(self, nodes):
+        """Indizes aller Kanten, die von den Räumen in nodes ausgehen."""
+        starts = self.offsets[nodes]
+        counts = self.offsets[nodes + 1] - starts
+        total = int(counts.sum())
+        if not total:
+            return np.empty(0, dtype=np.int64)
+        # Startkante des Raums plus laufende Nummer innerhalb seiner Kanten
+        return np.repeat(starts - (np.cumsum(counts) - counts), counts) + np.arange(total)
+
+    def enterable(self, inventory_mask=0, cleared=()):
+        """Bool-Array: welche Räume mit diesem Inventar betreten werden dürfen."""
+        inventory = np.array(self._words(inventory_mask), dtype=np.uint64)
+        allowed = ~(self.requirements & ~inventory).any(axis=1)
+        for room in cleared:
+            allowed[self.room_ids[room]] = True
+        return allowed
+
+    def enterable_many(self, inventory_masks):
+        """Bool-Matrix (Spieler × Räume) für viele Inventare; gerechnet wird nur über Räume mit Anforderungen."""
+        inventories = np.array([self._words(mask) for mask in inventory_masks], dtype=np.uint64)
+        inventories = inventories.reshape(len(inventory_masks), self.words)
+        allowed = np.ones((len(inventory_masks), self.room_count), dtype=bool)
+        required = self.requirements[self.locked_rooms]
+        allowed[:, self.locked_rooms] = ~(required[None, :, :] & ~inventories[:, None, :]).any(axis=2)
+        return allowed
+
+    def reachable(self, start, inventory_mask=0, cleared=()):
+        """Bool-Array der Räume, die mit diesem Inventar von start aus erreichbar sind.
+
+        Wie RouteFinder: gesperrte Räume werden nicht betreten, tödliche Räume sind nur Ziel, nie Zwischenstation.
+        Jede Ebene der Breitensuche ist eine Handvoll Array-Operationen über die Kanten der aktuellen Front.
+        """
+        allowed = self.enterable(inventory_mask, cleared)
+        visited = np.zeros(self.room_count, dtype=bool)
+        frontier = np.array([self.room_ids[start]], dtype=np.int64)
+        visited[frontier] = True
+        while frontier.size:
+            targets = self.targets[self._edges_of(frontier)]
+            targets = np.unique(targets[allowed[targets] & ~visited[targets]])
+            visited[targets] = True
+            frontier = targets[~self.deadly[targets]]
+        return visited
+
+    def reachable_many(self, starts, inventory_masks):
+        """Bool-Matrix (Spieler × Räume) der erreichbaren Räume für viele Start/Inventar-Paare gleichzeitig.
+
+        Alle Spieler teilen sich eine Front aus Räumen; pro Raum sind die Spieler als Bits gepackt (8 pro Byte),
+        jede Ebene verknüpft nur die Kanten der Fronträume. Am schnellsten, wenn viele Spieler im selben Raum starten.
+        """
+        players = len(starts)
+        allowed = np.packbits(self.enterable_many(inventory_masks), axis=0).T  # Raum × Spielerbytes
+        visited = np.zeros_like(allowed)
+        start_ids = np.array([self.room_ids[room] for room in starts], dtype=np.int64)
+        at_start = np.zeros((players, self.room_count), dtype=bool)
+        at_start[np.arange(players), start_ids] = True
+        columns = np.unique(start_ids)  # Räume der Front (sortiert)
+        block = np.packbits(at_start[:, columns], axis=0).T  # Frontraum × Spielerbytes: wer steht gerade dort?
+        visited[columns] = block
+        while columns.size:
+            edges = self._edges_of(columns)
+            if not edges.size:
+                break
+            targets = self.targets[edges]
+            order = np.argsort(targets, kind="stable")
+            targets = targets[order]
+            sources = np.searchsorted(columns, self.edge_sources[edges][order])  # Zeile im Block
+            columns, first = np.unique(targets, return_index=True)
+            block = np.bitwise_or.reduceat(block[sources], first, axis=0)  # Zielraum über irgendeine Kante erreicht
+            block &= allowed[columns] & ~visited[columns]
+            visited[columns] |= block
+            keep = block.any(axis=1) & ~self.deadly[columns]
+            columns, block = columns[keep], block[keep]
+        return np.unpackbits(visited, axis=1, count=players).T.astype(bool)
+
+    def degree_stats(self):
+        """Aus- und Eingangsgrade aller Räume (lokal, Stargate, gesamt)."""
+        return {
+            "local_out": _summary(np.diff(self.local_offsets)),
+            "gate_out": _summary(np.diff(self.gate_offsets)),
+            "in": _summary(np.bincount(self.targets, minlength=self.room_count)),
+        }
+
+    def per_planet(self, flags):
+        """Zählt pro Planet die Räume, für die flags gesetzt ist (z. B. per_planet(arrays.hostile))."""
+        counts = np.bincount(self.planet, weights=flags, minlength=len(self.planet_names))
+        return dict(zip(self.planet_names, counts.astype(np.int64).tolist()))
+
+
+#################################################################
+# Viele simulierte Spieler als Arrays; ein Aufruf bewegt alle auf einmal
+# Items gelten wie im world_analyzer als dauerhaft: Betreten eines Raums sammelt alle seine Items ein.
+class ArrayPlayers:
+    def __init__(self, world, count, start, inventory_mask=0):
+        self.world = world
+        self.position = np.full(count, world.room_ids[start], dtype=np.int64)
+        self.inventory = np.tile(np.array(world._words(inventory_mask), dtype=np.uint64), (count, 1))
+        self.inventory |= world.items[self.position]
+        self.alive = np.ones(count, dtype=bool)  # noch im Spiel (weder tot noch gewonnen)
+        self.dead = np.zeros(count, dtype=bool)
+        self.won = np.zeros(count, dtype=bool)
+        self.steps = 0
+
+    def step_random(self, rng):
+        """Jeder Spieler im Spiel nimmt einen zufälligen Ausgang, falls er dessen Anforderungen erfüllt.
+
+        rng ist ein numpy.random.Generator. Gibt die Anzahl der Spieler zurück, die sich bewegt haben.
+        """
+        world = self.world
+        players = np.flatnonzero(self.alive)
+        starts = world.offsets[self.position[players]]
+        degree = world.offsets[self.position[players] + 1] - starts
+        movable = degree > 0
+        players, starts, degree = players[movable], starts[movable], degree[movable]
+        edges = starts + (rng.random(players.size) * degree).astype(np.int64)
+        targets = world.targets[edges]
+        allowed = ~(world.requirements[targets] & ~self.inventory[players]).any(axis=1)
+        players, edges, targets = players[allowed], edges[allowed], targets[allowed]
+
+        won = world.edge_win[edges]
+        self.won[players[won]] = True
+        self.alive[players[won]] = False
+        players, edges, targets = players[~won], edges[~won], targets[~won]
+        self.position[players] = targets
+        self.inventory[players] |= world.items[targets]
+        died = world.edge_die[edges]
+        self.dead[players[died]] = True
+        self.alive[players[died]] = False
+        self.steps += 1
+        return int(players.size + np.count_nonzero(won))
+
+    def run(self, rng, max_steps=200):
+        """Läuft, bis alle Spieler fertig sind oder max_steps erreicht ist."""
+        while self.steps < max_steps and self.alive.any():
+            self.step_random(rng)
+        return {"players": self.alive.size, "steps": self.steps, "won": int(self.won.sum()),
+                "died": int(self.dead.sum()), "running": int(self.alive.sum())}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bulk statistics over a Stargate Adventure world (needs NumPy).")
+    parser.add_argument("world", nargs="?", default="world.json")
+    parser.add_argument("--start", default="Quarters", help="start room for the reachability count")
+    options = parser.parse_args()
+
+    game = Game()
+    game.create_game(os.path.abspath(options.world), streaming=True, use_cache=True)
+    start = game.find_room_ignore_case(options.start) or next(iter(game.rooms.values()))
+    arrays = WorldArrays(game)
+    print(f"rooms: {arrays.room_count}, planets: {len(arrays.planet_names)}, exits: {arrays.targets.size}")
+    for name, stats in arrays.degree_stats().items():
+        print(f"degree {name:9s} min={stats['min']} max={stats['max']} mean={stats['mean']:.2f} zero={stats['zero']}")
+    print(f"reachable from {start.name} with an empty inventory: {int(arrays.reachable(start).sum())}")
+    hostile = arrays.per_planet(arrays.hostile)
+    print("hostile NPCs per planet: " + ", ".join(f"{name}={count}" for name, count in hostile.items() if count))
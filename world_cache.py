@@ -0,0 +1,267 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+import zlib
+from array import array
+
+# Aufbau der Cache-Datei (little endian):
+#   Header      MAGIC, Version, mtime_ns und Größe der Quelldatei, SHA-256 der Quelldatei,
+#               CRC32 über alles nach dem Header (erkennt beschädigte Tabellen)
+#   Zähler      Strings, Bytes der Stringtabelle, Bytes der NPC-Daten, Bytes der Raumregeln, Planeten, Räume, NPCs,
+#               Verbindungen, Listeneinträge
+#   Strings     alle Texte, UTF-8, durch NUL getrennt (Referenzen sind Indizes, -1 = None)
+#   Planeten    je (Name, Bild)
+#   Räume       je ROOM_FIELDS Zahlen (siehe write_cache)
+#   NPC-Daten   ein JSON-Array mit [Inventar, Dialoge] pro NPC
+#   Raumregeln  ein JSON-Array mit [Raumindex, Aktionen, on_enter, on_travel] nur für Räume mit Regeln
+#   NPCs        je (Vorname, Nachname, feindlich)
+#   Verbindungen je (Ausgangsraum, Zielraum, Typ) in Einfügereihenfolge
+#   Listen      String-Indizes für Items und Anforderungen der Räume
+MAGIC = b"SGWC"
+VERSION = 3  # 2: Raumaktionen und Auslöser, 3: CRC32 im Header
+HEADER = struct.Struct("<4sHHqq32sI")
+COUNTS = struct.Struct("<9I")
+ROOM_FIELDS = 10
+CACHE_SUFFIX = ".sgwc"
+
+
+def cache_path_for(world_path):
+    """Gibt den Pfad der Cache-Datei zu einer Weltdatei zurück."""
+    return world_path + CACHE_SUFFIX
+
+
+def _file_hash(path):
+    """Berechnet den SHA-256-Hash einer Datei blockweise."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.digest()
+
+
+def write_cache(game, world_path, cache_path=None):
+    """Schreibt die geladene Welt eines Game-Objekts als Binärdatei neben die Quelldatei."""
+    cache_path = cache_path or cache_path_for(world_path)
+    stat = os.stat(world_path)
+
+    string_ids = {}
+    strings = []
+
+    def sid(value):
+        if value is None:
+            return -1
+        index = string_ids.get(value)
+        if index is None:
+            if "\0" in value:
+                raise ValueError("NUL-Zeichen können nicht im Welt-Cache gespeichert werden.")
+            index = string_ids[value] = len(strings)
+            strings.append(value)
+        return index
+
+    planets = list(game.planets.values())
+    planet_ids = {planet: index for index, planet in enumerate(planets)}
+    planet_records = array("i")
+    for planet in planets:
+        planet_records.extend((sid(planet.name), sid(planet.picture)))
+
+    rooms = list(game.rooms.values())
+    room_ids = {room: index for index, room in enumerate(rooms)}
+    room_records = array("i")
+    list_entries = array("i")
+    npc_records = array("i")
+    npc_extras = []
+    room_rules = []
+    edge_records = array("i")
+    for index, room in enumerate(rooms):
+        items_offset = len(list_entries)
+        list_entries.extend(sid(item) for item in room.items)
+        requirement_offset = len(list_entries)
+        list_entries.extend(sid(item) for item in room.requirement)
+        npc_index = -1
+        if room.npc is not None:
+            npc = room.npc
+            npc_index = len(npc_extras)
+            npc_extras.append((npc.inventory, npc.dialogues))
+            npc_records.extend((sid(npc.firstname), sid(npc.lastname), int(bool(npc.hostile))))
+        room_records.extend((
+            sid(room.name), sid(room.description), planet_ids[room.planet], sid(room.objective), sid(room.picture),
+            items_offset, len(room.items), requirement_offset, len(room.requirement), npc_index,
+        ))
+        if room.special_actions or room.enter_trigger or room.travel_triggers:
+            room_rules.append((index, room.special_actions, room.enter_trigger, room.travel_triggers))
+        for conn in room.connections:
+            edge_records.extend((room_ids[conn.from_room], room_ids[game.rooms[conn.to_room]], sid(conn.connection_type)))
+
+    blob = "\0".join(strings).encode("utf-8")
+    npc_blob = json.dumps(npc_extras, ensure_ascii=False).encode("utf-8")
+    rules_blob = json.dumps(room_rules, ensure_ascii=False).encode("utf-8")
+    counts = COUNTS.pack(len(strings), len(blob), len(npc_blob), len(rules_blob), len(planets), len(rooms),
+                         len(npc_extras), len(edge_records) // 3, len(list_entries))
+    body = (counts, blob, npc_blob, rules_blob, planet_records, room_records, npc_records, edge_records, list_entries)
+    crc = 0
+    for part in body:
+        crc = zlib.crc32(part, crc)
+    header = HEADER.pack(MAGIC, VERSION, 0, stat.st_mtime_ns, stat.st_size, _file_hash(world_path), crc)
+
+    # Erst in eine temporäre Datei schreiben, damit parallel startende Prozesse nie eine halbe Datei lesen
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as file:
+        file.write(header)
+        for part in body:
+            file.write(part)
+    os.replace(temp_path, cache_path)
+
+
+def load_cache(game, world_path, cache_path=None):
+    """Lädt die Welt aus der Cache-Datei in ein leeres Game-Objekt.
+
+    Gibt False zurück, wenn es keinen gültigen Cache zur aktuellen Quelldatei gibt.
+    """
+    cache_path = cache_path or cache_path_for(world_path)
+    try:
+        stat = os.stat(world_path)
+        file = open(cache_path, "rb")
+    except OSError:
+        return False
+
+    if os.fstat(file.fileno()).st_size < HEADER.size + COUNTS.size:  # leere oder abgeschnittene Datei
+        file.close()
+        return False
+
+    try:
+        with file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            parsed = _read_tables(data, stat, world_path)
+            if parsed is None:
+                return False
+            refresh_header, digest, crc, tables = parsed
+        _build_world(game, *tables)
+    except (ValueError, IndexError, KeyError, TypeError, struct.error, UnicodeDecodeError):
+        # Beschädigter Cache: nie fatal, die Welt wird dann aus der JSON-Datei geladen und der Cache neu geschrieben
+        game.reset_world()  # halb aufgebaute Welt verwerfen, die bereits geladene Story bleibt
+        return False
+
+    if refresh_header:
+        # Neuen Zeitstempel übernehmen, damit der Hash beim nächsten Start nicht erneut berechnet wird
+        try:
+            with open(cache_path, "r+b") as file:
+                file.write(HEADER.pack(MAGIC, VERSION, 0, stat.st_mtime_ns, stat.st_size, digest, crc))
+        except OSError:
+            pass
+    return True
+
+
+def _read_tables(data, stat, world_path):
+    """Liest Header und Tabellen aus der gemappten Datei; None, wenn der Cache nicht zur Quelldatei passt.
+
+    Alle Größen aus dem Header werden vor dem Lesen gegen die Dateigröße und der Inhalt gegen die CRC32 geprüft
+    (ValueError bei Widerspruch).
+    """
+    magic, version, _, mtime_ns, size, digest, crc = HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        return None
+    refresh_header = False
+    if (mtime_ns, size) != (stat.st_mtime_ns, stat.st_size):
+        # Zeitstempel geändert: nur der Inhalt entscheidet, ob der Cache noch passt
+        if size != stat.st_size or digest != _file_hash(world_path):
+            return None
+        refresh_header = True
+
+    (n_strings, blob_size, npc_blob_size, rules_blob_size, n_planets, n_rooms,
+     n_npcs, n_edges, n_list) = COUNTS.unpack_from(data, HEADER.size)
+    offset = HEADER.size + COUNTS.size
+    int_size = array("i").itemsize
+    expected = offset + blob_size + npc_blob_size + rules_blob_size + int_size * (
+        n_planets * 2 + n_rooms * ROOM_FIELDS + n_npcs * 3 + n_edges * 3 + n_list)
+    if expected != len(data):
+        raise ValueError("Welt-Cache abgeschnitten oder beschädigt.")
+    with memoryview(data) as view:
+        if zlib.crc32(view[HEADER.size:]) != crc:
+            raise ValueError("Welt-Cache beschädigt (CRC32 stimmt nicht).")
+    strings = data[offset:offset + blob_size].decode("utf-8").split("\0") if n_strings else []
+    offset += blob_size
+    npc_extras = json.loads(data[offset:offset + npc_blob_size].decode("utf-8"))
+    offset += npc_blob_size
+    room_rules = {index: rules for index, *rules in json.loads(data[offset:offset + rules_blob_size].decode("utf-8"))}
+    offset += rules_blob_size
+
+    def ints(count):
+        nonlocal offset
+        values = array("i")
+        values.frombytes(data[offset:offset + count * values.itemsize])
+        offset += count * values.itemsize
+        return values
+
+    planet_records = ints(n_planets * 2)
+    room_records = ints(n_rooms * ROOM_FIELDS)
+    npc_records = ints(n_npcs * 3)
+    edge_records = ints(n_edges * 3)
+    list_entries = ints(n_list)
+    tables = (strings, npc_extras, room_rules, planet_records, room_records, npc_records, edge_records, list_entries)
+    return refresh_header, digest, crc, tables
+
+
+def _build_world(game, strings, npc_extras, room_rules, planet_records, room_records, npc_records, edge_records,
+                 list_entries):
+    """Baut Planeten, Räume, NPCs und Verbindungen aus den gelesenen Tabellen auf."""
+    from game import Connection, Npc, Planet, Room
+
+    def text(index):
+        return strings[index] if index >= 0 else None
+
+    planets = []
+    for i in range(0, len(planet_records), 2):
+        planet = Planet(name=strings[planet_records[i]], picture=text(planet_records[i + 1]))
+        game.planets[planet.name] = planet
+        planets.append(planet)
+
+    rooms = []
+    for i in range(0, len(room_records), ROOM_FIELDS):
+        (name, description, planet_index, objective, picture,
+         items_offset, items_len, requirement_offset, requirement_len, npc_index) = room_records[i:i + ROOM_FIELDS]
+        planet = planets[planet_index]
+        room = Room(
+            name=strings[name],
+            description=strings[description],
+            planet=planet,
+            objective=text(objective),
+            requirement=[strings[s] for s in list_entries[requirement_offset:requirement_offset + requirement_len]],
+            items=[strings[s] for s in list_entries[items_offset:items_offset + items_len]],
+            picture=text(picture)
+        )
+        rules = room_rules.get(len(rooms))
+        if rules is not None:
+            actions, room.enter_trigger, room.travel_triggers = rules
+            room.special_actions = tuple(actions)
+        if npc_index >= 0:
+            firstname, lastname, hostile = npc_records[npc_index * 3:npc_index * 3 + 3]
+            inventory, dialogues = npc_extras[npc_index]
+            room.npc = Npc(
+                firstname=strings[firstname],
+                lastname=strings[lastname],
+                room=room,
+                hostile=bool(hostile),
+                inventory=inventory,
+                dialogues=dialogues
+            )
+        game.register_room(room, planet)
+        rooms.append(room)
+
+    # Verbindungen sind bereits aufgelöst: Nachbarschaft direkt aus den Raumindizes aufbauen
+    local_exits = [[] for _ in rooms]
+    gate_exits = [[] for _ in rooms]
+    for i in range(0, len(edge_records), 3):
+        from_index = edge_records[i]
+        from_room = rooms[from_index]
+        to_room = rooms[edge_records[i + 1]]
+        connection_type = strings[edge_records[i + 2]]
+        from_room.connections.append(Connection(from_room, to_room, connection_type))
+        if connection_type == "interplanetary":
+            gate_exits[from_index].append(to_room)
+        else:
+            local_exits[from_index].append(to_room)
+    for room, local, gate in zip(rooms, local_exits, gate_exits):
+        room.local_exits = tuple(local)
+        room.gate_exits = tuple(gate)
+    return True
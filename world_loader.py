@@ -0,0 +1,210 @@
+import json
+from array import array
+
+
+#################################################################
+# Kompakter Zwischenspeicher für Verbindungen, deren Zielräume noch nicht existieren
+class EdgeBuffer:
+    def __init__(self):
+        self.name_ids = {}  # Raumname -> Nummer (jeder Name wird nur einmal gespeichert)
+        self.names = []  # Nummer -> Raumname
+        self.type_ids = {}  # Verbindungstyp -> Nummer
+        self.types = []  # Nummer -> Verbindungstyp
+        self.edges = array("I")  # flache Folge von (von, nach, typ)-Tripeln
+
+    def add(self, from_room, to_room, connection_type):
+        """Merkt sich eine Verbindung als drei Zahlen statt als Dictionary."""
+        name_ids = self.name_ids
+        from_id = name_ids.get(from_room)
+        if from_id is None:
+            from_id = name_ids[from_room] = len(self.names)
+            self.names.append(from_room)
+        to_id = name_ids.get(to_room)
+        if to_id is None:
+            to_id = name_ids[to_room] = len(self.names)
+            self.names.append(to_room)
+        type_id = self.type_ids.get(connection_type)
+        if type_id is None:
+            type_id = self.type_ids[connection_type] = len(self.types)
+            self.types.append(connection_type)
+        self.edges.extend((from_id, to_id, type_id))
+
+    def __len__(self):
+        return len(self.edges) // 3
+
+    def __iter__(self):
+        """Liefert die Verbindungen in Einfügereihenfolge als (von, nach, typ)-Tupel."""
+        names = self.names
+        types = self.types
+        edges = self.edges
+        for i in range(0, len(edges), 3):
+            yield names[edges[i]], names[edges[i + 1]], types[edges[i + 2]]
+
+
+#################################################################
+# Inkrementeller JSON-Leser: läuft Objekte und Arrays ab, ohne die ganze Datei zu parsen
+class JsonStream:
+    def __init__(self, file, chunk_size=1 << 16):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self, size=None):
+        """Liest den nächsten Block nach und verwirft bereits verarbeitete Zeichen."""
+        if self.eof:
+            return False
+        data = self.file.read(size or self.chunk_size)
+        if not data:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Überspringt Leerzeichen und gibt das nächste Zeichen zurück ('' am Dateiende)."""
+        while True:
+            buffer = self.buffer
+            pos = self.pos
+            length = len(buffer)
+            while pos < length and buffer[pos] in " \t\n\r":
+                pos += 1
+            self.pos = pos
+            if pos < length:
+                return buffer[pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char):
+        """Verbraucht das erwartete Strukturzeichen oder meldet einen Formatfehler."""
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Ungültiges JSON: '{char}' erwartet, '{found}' gefunden (Position {self.pos}).")
+        self.pos += 1
+
+    def value(self):
+        """Dekodiert genau einen vollständigen JSON-Wert an der aktuellen Position."""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                # Wert ist noch nicht vollständig im Puffer: Puffer mindestens verdoppeln und neu versuchen
+                if not self._fill(max(self.chunk_size, len(self.buffer) - self.pos)):
+                    raise
+                continue
+            # Zahlen oder Literale am Pufferende könnten abgeschnitten sein
+            if end == len(self.buffer) and not self.eof and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def keys(self):
+        """Läuft die Schlüssel eines Objekts ab; der Aufrufer muss jeden Wert selbst verbrauchen."""
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(":")
+            yield key
+            if self.peek() == ",":
+                self.pos += 1
+                continue
+            self.expect("}")
+            return
+
+    def items(self):
+        """Läuft die Elemente eines Arrays ab; der Aufrufer muss jedes Element selbst verbrauchen."""
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield
+            if self.peek() == ",":
+                self.pos += 1
+                continue
+            self.expect("]")
+            return
+
+
+#################################################################
+# Lädt eine Welt Raum für Raum in ein Game-Objekt
+def stream_world(game, world_path, chunk_size=1 << 16):
+    """Baut Planeten und Räume einzeln aus der JSON-Datei auf, ohne sie komplett zu laden.
+
+    Verbindungen werden in einem EdgeBuffer gesammelt und erst aufgelöst, wenn alle Räume existieren.
+    """
+    room_edges = EdgeBuffer()  # Verbindungen aus den Räumen
+    world_edges = EdgeBuffer()  # Verbindungen aus der obersten Ebene ("connections")
+
+    with open(world_path, 'r', encoding='utf-8') as file:
+        stream = JsonStream(file, chunk_size)
+        for key in stream.keys():
+            if key == "planets":
+                for _ in stream.items():
+                    _stream_planet(game, stream, room_edges)
+            elif key == "connections":
+                for _ in stream.items():
+                    connection_data = stream.value()
+                    world_edges.add(connection_data["from_room"], connection_data["to_room"], connection_data["type"])
+            else:
+                stream.value()  # unbekannte Schlüssel überspringen
+
+    # Gleiche Reihenfolge wie create_game: zuerst Raumverbindungen, dann die der obersten Ebene
+    for edges in (room_edges, world_edges):
+        for from_room, to_room, connection_type in edges:
+            game.connect_rooms(from_room, to_room, connection_type)
+
+
+def _stream_planet(game, stream, room_edges):
+    """Liest ein Planeten-Objekt und legt seine Räume an, sobald sie gelesen wurden."""
+    planet_name = None
+    picture = None
+    planet = None
+    deferred_rooms = None  # Räume, die vor dem Planetennamen in der Datei stehen
+    skipped = False  # Planet ist ein Duplikat und wird ignoriert
+
+    for key in stream.keys():
+        if key == "name":
+            planet_name = stream.value()
+        elif key == "picture":
+            picture = stream.value()
+            if planet:
+                planet.picture = picture
+        elif key == "rooms":
+            if planet is None and not skipped and planet_name is not None:
+                planet = game.add_planet(planet_name, picture)
+                skipped = planet is None
+            if skipped:
+                for _ in stream.items():
+                    stream.value()  # Räume eines doppelten Planeten verwerfen
+            elif planet is None:
+                deferred_rooms = stream.value()  # Name noch unbekannt: Räume ausnahmsweise komplett puffern
+            else:
+                for _ in stream.items():
+                    _add_streamed_room(game, stream.value(), planet, room_edges)
+        else:
+            stream.value()
+
+    if planet_name is None:
+        raise KeyError("name")
+    if planet is None and not skipped:
+        planet = game.add_planet(planet_name, picture)
+        if planet is not None:
+            for room_data in deferred_rooms or []:
+                _add_streamed_room(game, room_data, planet, room_edges)
+
+
+def _add_streamed_room(game, room_data, planet, room_edges):
+    """Legt einen gelesenen Raum an und puffert seine Verbindungen."""
+    room = game.add_room(room_data, planet)
+    if room is None:
+        return
+    for connection_data in room_data.get("connections", []):
+        room_edges.add(room.name, connection_data["to_room"], connection_data["type"])